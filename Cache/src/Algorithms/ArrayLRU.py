@@ -0,0 +1,142 @@
+class ArrayLRU:
+    # Recency list whose links live in two preallocated slot-index lists instead
+    # of one node object per key. Slot 0 is the sentinel: nextSlot[0] is the least
+    # recently used slot and prevSlot[0] the most recently used one. Freed slots
+    # are chained through nextSlot and reused before the arrays are grown.
+
+    DEFAULT_CAPACITY = 16
+
+    def __init__(self, capacity=None):
+        capacity = max(capacity or self.DEFAULT_CAPACITY, 1)
+        self.slots = dict()
+        self.keys = [None] * (capacity + 1)
+        self.prevSlot = [0] * (capacity + 1)
+        self.nextSlot = [0] * (capacity + 1)
+        self.freeHead = 0
+        self.highWater = 1
+
+    def __len__(self):
+        return len(self.slots)
+
+    def __contains__(self, key):
+        return key in self.slots
+
+    def keyAccessed(self, key):
+        slot = self.slots.get(key)
+        prevSlot = self.prevSlot
+        nextSlot = self.nextSlot
+        if slot is not None:
+            after = nextSlot[slot]
+            if after == 0:
+                return
+            before = prevSlot[slot]
+            nextSlot[before] = after
+            prevSlot[after] = before
+        else:
+            slot = self.allocateSlot()
+            prevSlot = self.prevSlot
+            nextSlot = self.nextSlot
+            self.keys[slot] = key
+            self.slots[key] = slot
+        last = prevSlot[0]
+        nextSlot[last] = slot
+        prevSlot[slot] = last
+        nextSlot[slot] = 0
+        prevSlot[0] = slot
+
+    def keysAccessed(self, keys):
+        # Same as keyAccessed per key, with the hit path inlined so a batch
+        # pays for attribute lookups once.
+        slots = self.slots
+        prevSlot = self.prevSlot
+        nextSlot = self.nextSlot
+        for key in keys:
+            slot = slots.get(key)
+            if slot is None:
+                self.keyAccessed(key)
+                prevSlot = self.prevSlot
+                nextSlot = self.nextSlot
+                continue
+            after = nextSlot[slot]
+            if after == 0:
+                continue
+            before = prevSlot[slot]
+            nextSlot[before] = after
+            prevSlot[after] = before
+            last = prevSlot[0]
+            nextSlot[last] = slot
+            prevSlot[slot] = last
+            nextSlot[slot] = 0
+            prevSlot[0] = slot
+
+    def evictKey(self):
+        slot = self.nextSlot[0]
+        if slot == 0:
+            return None
+        key = self.keys[slot]
+        del self.slots[key]
+        self.releaseSlot(slot)
+        return key
+
+    def evictKeys(self, count):
+        keys = []
+        nextSlot = self.nextSlot
+        while len(keys) < count:
+            slot = nextSlot[0]
+            if slot == 0:
+                break
+            key = self.keys[slot]
+            del self.slots[key]
+            self.releaseSlot(slot)
+            keys.append(key)
+        return keys
+
+    def removeKey(self, key):
+        slot = self.slots.pop(key, None)
+        if slot is None:
+            return False
+        self.releaseSlot(slot)
+        return True
+
+    def peekKey(self):
+        slot = self.nextSlot[0]
+        if slot == 0:
+            return None
+        return self.keys[slot]
+
+    def iterKeys(self):
+        # Least recently used first.
+        keys = self.keys
+        nextSlot = self.nextSlot
+        slot = nextSlot[0]
+        while slot != 0:
+            yield keys[slot]
+            slot = nextSlot[slot]
+
+    def allocateSlot(self):
+        slot = self.freeHead
+        if slot != 0:
+            self.freeHead = self.nextSlot[slot]
+            return slot
+        if self.highWater == len(self.keys):
+            self.grow()
+        slot = self.highWater
+        self.highWater += 1
+        return slot
+
+    def releaseSlot(self, slot):
+        prevSlot = self.prevSlot
+        nextSlot = self.nextSlot
+        before = prevSlot[slot]
+        after = nextSlot[slot]
+        nextSlot[before] = after
+        prevSlot[after] = before
+        self.keys[slot] = None
+        nextSlot[slot] = self.freeHead
+        self.freeHead = slot
+
+    def grow(self):
+        extra = len(self.keys)
+        self.keys.extend([None] * extra)
+        self.prevSlot.extend([0] * extra)
+        self.nextSlot.extend([0] * extra)
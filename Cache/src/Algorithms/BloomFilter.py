@@ -0,0 +1,50 @@
+import math
+
+MASK64 = (1 << 64) - 1
+SECOND_HASH_SEED = 0x9E3779B97F4A7C15
+
+
+class BloomFilter:
+
+    def __init__(self, expectedInsertions, falsePositiveRate=0.01):
+        expectedInsertions = max(expectedInsertions, 1)
+        bits = int(-expectedInsertions * math.log(falsePositiveRate) / (math.log(2) ** 2))
+        self.bitCount = max(bits, 64)
+        self.hashCount = max(int(round(self.bitCount / expectedInsertions * math.log(2))), 1)
+        self.bits = bytearray((self.bitCount + 7) // 8)
+
+    def put(self, key):
+        # Sets the key's bits and returns True if any of them was still clear,
+        # i.e. the key was definitely not present before.
+        bits = self.bits
+        bitCount = self.bitCount
+        # Kirsch-Mitzenmacher double hashing: h1 + i * h2.
+        first = hash(key) & MASK64
+        step = ((first * SECOND_HASH_SEED) & MASK64) >> 32 | 1
+        changed = False
+        for position in range(first, first + step * self.hashCount, step):
+            position %= bitCount
+            index = position >> 3
+            mask = 1 << (position & 7)
+            byte = bits[index]
+            if not byte & mask:
+                bits[index] = byte | mask
+                changed = True
+        return changed
+
+    def add(self, key):
+        self.put(key)
+
+    def mightContain(self, key):
+        bits = self.bits
+        bitCount = self.bitCount
+        first = hash(key) & MASK64
+        step = ((first * SECOND_HASH_SEED) & MASK64) >> 32 | 1
+        for position in range(first, first + step * self.hashCount, step):
+            position %= bitCount
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def clear(self):
+        self.bits = bytearray(len(self.bits))
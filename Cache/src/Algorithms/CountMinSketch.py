@@ -0,0 +1,72 @@
+HALVE_TABLE = bytes(value >> 1 for value in range(256))
+MASK64 = (1 << 64) - 1
+SEEDS = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0xD6E8FEB86659FD93)
+
+
+class CountMinSketch:
+    # Frequency estimator over a fixed bytearray of depth * width counters, so
+    # its memory does not grow with the number of distinct keys. Counters
+    # saturate at maxCount and halve() divides all of them by two.
+
+    def __init__(self, width, depth=4, maxCount=15):
+        if depth > len(SEEDS):
+            raise ValueError("depth can be at most " + str(len(SEEDS)))
+        width = 1 << max(width - 1, 1).bit_length()
+        self.width = width
+        self.depth = depth
+        self.maxCount = maxCount
+        self.shift = 64 - (width.bit_length() - 1)
+        self.counters = bytearray(width * depth)
+        self.rows = tuple((seed, row * width) for row, seed in enumerate(SEEDS[:depth]))
+
+    def indexes(self, key):
+        h = hash(key) & MASK64
+        shift = self.shift
+        return [offset + (((h * seed) & MASK64) >> shift) for seed, offset in self.rows]
+
+    def increment(self, key):
+        counters = self.counters
+        indexes = self.indexes(key)
+        smallest = min([counters[index] for index in indexes])
+        if smallest >= self.maxCount:
+            return False
+        # Conservative update: only raise the counters holding the minimum.
+        for index in indexes:
+            if counters[index] == smallest:
+                counters[index] = smallest + 1
+        return True
+
+    def incrementMany(self, keys):
+        counts = dict()
+        for key in keys:
+            counts[key] = counts.get(key, 0) + 1
+        self.incrementCounts(counts)
+
+    def incrementCounts(self, counts):
+        # Same counters as increment() count times per key, done once: count
+        # conservative increments raise every counter of the key to at least
+        # min + count (capped at maxCount).
+        counters = self.counters
+        shift = self.shift
+        rows = self.rows
+        maxCount = self.maxCount
+        for key, count in counts.items():
+            h = hash(key) & MASK64
+            indexes = [offset + (((h * seed) & MASK64) >> shift) for seed, offset in rows]
+            smallest = min([counters[index] for index in indexes])
+            if smallest >= maxCount:
+                continue
+            target = min(smallest + count, maxCount)
+            for index in indexes:
+                if counters[index] < target:
+                    counters[index] = target
+
+    def estimate(self, key):
+        counters = self.counters
+        return min([counters[index] for index in self.indexes(key)])
+
+    def halve(self):
+        self.counters = bytearray(self.counters.translate(HALVE_TABLE))
+
+    def clear(self):
+        self.counters = bytearray(self.width * self.depth)
@@ -1,5 +1,6 @@
 from Cache.src.Algorithms.DoublyLinkedListNode import DoublyLinkedListNode
 from Cache.src.Algorithms.Exceptions.InvalidElementException import InvalidElementException
+from Cache.src.Algorithms.Exceptions.NoSuchElementException import NoSuchElementException
 
 
 class DoublyLinkedList:
@@ -1,16 +1,18 @@
 class DoublyLinkedListNode:
 
-    def __init__(self,element):
-        self.element = element
+    def __init__(self,element=None):
+        self._element = element
         self.next = None
         self.prev = None
 
     @property
     def element(self):
-        return self.element
+        return self._element
 
     @element.setter
     def element(self,element):
-        self.element = element
+        self._element = element
 
+    def getElement(self):
+        return self._element
 
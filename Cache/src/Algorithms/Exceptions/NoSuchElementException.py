@@ -0,0 +1,2 @@
+class NoSuchElementException(RuntimeError):
+    pass
\ No newline at end of file
@@ -0,0 +1,13 @@
+from collections import OrderedDict
+
+
+class FrequencyBucket:
+    # One node of a frequency-ordered doubly linked list. Keys inside the bucket
+    # are kept in the order they reached this frequency, oldest first, each
+    # mapped to a value its policy orders them by (LFU: its last access).
+
+    def __init__(self, frequency):
+        self.frequency = frequency
+        self.keys = OrderedDict()
+        self.prev = None
+        self.next = None
@@ -0,0 +1,63 @@
+class HdrHistogram:
+    # Log-linear histogram of non-negative integers in the style of
+    # HdrHistogram. Values below 2^subBucketBits get a bucket each; above
+    # that every power of two is split into 2^(subBucketBits - 1) equal
+    # buckets, so any recorded value is reported within a relative error of
+    # 2^-(subBucketBits - 1) while the whole 64-bit range fits in a few
+    # thousand counters.
+
+    def __init__(self, subBucketBits=6):
+        self.subBucketBits = subBucketBits
+        self.halfBucketCount = 1 << (subBucketBits - 1)
+        self.counts = [0] * ((64 - subBucketBits + 2) * self.halfBucketCount)
+        self.count = 0
+        self.total = 0
+        self.maximum = 0
+
+    def record(self, value):
+        shift = value.bit_length() - self.subBucketBits
+        if shift <= 0:
+            self.counts[value] += 1
+        else:
+            self.counts[(shift + 1) * self.halfBucketCount + (value >> shift) - self.halfBucketCount] += 1
+        self.count += 1
+        self.total += value
+        if value > self.maximum:
+            self.maximum = value
+
+    def highestEquivalentValue(self, index):
+        # Largest value that lands in bucket index.
+        if index < 2 * self.halfBucketCount:
+            return index
+        shift = index // self.halfBucketCount - 1
+        mantissa = index - shift * self.halfBucketCount
+        return ((mantissa + 1) << shift) - 1
+
+    def percentile(self, percent):
+        if self.count == 0:
+            return 0
+        rank = max(int(self.count * percent / 100 + 0.5), 1)
+        seen = 0
+        for index, bucketCount in enumerate(self.counts):
+            seen += bucketCount
+            if seen >= rank:
+                return min(self.highestEquivalentValue(index), self.maximum)
+        return self.maximum
+
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def merge(self, other):
+        counts = self.counts
+        for index, bucketCount in enumerate(other.counts):
+            if bucketCount:
+                counts[index] += bucketCount
+        self.count += other.count
+        self.total += other.total
+        self.maximum = max(self.maximum, other.maximum)
+
+    def clear(self):
+        self.counts = [0] * len(self.counts)
+        self.count = 0
+        self.total = 0
+        self.maximum = 0
@@ -0,0 +1,109 @@
+import math
+from collections import OrderedDict
+
+
+class HierarchicalTimingWheel:
+    # Level 0 has one bucket per tick, every higher level one bucket per
+    # wheelSize ticks of the level below. A key is filed in the coarsest level
+    # that still resolves its deadline and is cascaded down as the wheel turns,
+    # so scheduling, cancelling and expiring a key are all O(1) amortised.
+    # Deadlines beyond the top level wait in an overflow bucket.
+    #
+    # Every key maps to the dict currently holding it (a bucket, the overflow
+    # or the expired buffer) and that dict maps the key to its deadline.
+
+    def __init__(self, tickDuration=1.0, wheelSize=64, levels=4, now=0.0):
+        self.tickDuration = tickDuration
+        self.wheelSize = wheelSize
+        self.levels = levels
+        self.wheels = [[dict() for _ in range(wheelSize)] for _ in range(levels)]
+        self.spans = [wheelSize ** level for level in range(levels + 1)]
+        self.overflow = dict()
+        self.expired = OrderedDict()
+        self.locations = dict()
+        self.currentTick = self.tickOf(now)
+
+    def __len__(self):
+        return len(self.locations)
+
+    def __contains__(self, key):
+        return key in self.locations
+
+    def tickOf(self, time):
+        return math.ceil(time / self.tickDuration)
+
+    def deadline(self, key):
+        container = self.locations.get(key)
+        if container is None:
+            return None
+        return container[key]
+
+    def schedule(self, key, deadline):
+        self.cancel(key)
+        self.place(key, deadline)
+
+    def cancel(self, key):
+        container = self.locations.pop(key, None)
+        if container is None:
+            return False
+        del container[key]
+        return True
+
+    def advance(self, now, maxExpirations=None):
+        # Turns the wheel up to now and returns the keys whose deadline has
+        # passed, at most maxExpirations of them; the rest stay buffered and
+        # are returned by later calls.
+        targetTick = math.floor(now / self.tickDuration)
+        if len(self.locations) == len(self.expired):
+            self.currentTick = max(self.currentTick, targetTick)
+        while self.currentTick < targetTick:
+            self.currentTick += 1
+            self.cascade()
+            bucket = self.wheels[0][self.currentTick % self.wheelSize]
+            if bucket:
+                for key, deadline in bucket.items():
+                    self.expired[key] = deadline
+                    self.locations[key] = self.expired
+                bucket.clear()
+            if maxExpirations is not None and len(self.expired) >= maxExpirations:
+                break
+        return self.drainExpired(maxExpirations)
+
+    def drainExpired(self, maxExpirations):
+        keys = []
+        expired = self.expired
+        locations = self.locations
+        while expired and (maxExpirations is None or len(keys) < maxExpirations):
+            key, _ = expired.popitem(last=False)
+            del locations[key]
+            keys.append(key)
+        return keys
+
+    def cascade(self):
+        tick = self.currentTick
+        if tick % self.spans[self.levels] == 0 and self.overflow:
+            self.refile(self.overflow)
+        for level in range(self.levels - 1, 0, -1):
+            if tick % self.spans[level] == 0:
+                self.refile(self.wheels[level][(tick // self.spans[level]) % self.wheelSize])
+
+    def refile(self, bucket):
+        entries = list(bucket.items())
+        bucket.clear()
+        for key, deadline in entries:
+            self.place(key, deadline)
+
+    def place(self, key, deadline):
+        tick = self.tickOf(deadline)
+        delta = tick - self.currentTick
+        if delta <= 0:
+            container = self.expired
+        elif delta >= self.spans[self.levels]:
+            container = self.overflow
+        else:
+            level = 0
+            while delta >= self.spans[level + 1]:
+                level += 1
+            container = self.wheels[level][(tick // self.spans[level]) % self.wheelSize]
+        container[key] = deadline
+        self.locations[key] = container
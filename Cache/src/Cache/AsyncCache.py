@@ -0,0 +1,76 @@
+import asyncio
+import inspect
+
+from Cache.src.Cache.LoadFailure import LoadFailure
+
+
+class AsyncCache:
+    # asyncio front end for a Cache. getOrLoad runs at most one loader call
+    # per key at a time; every caller that misses while it runs awaits the
+    # same future. Loader failures can be cached for negativeTtl seconds, and
+    # with refreshAhead set (a fraction of the TTL) a hit on an entry past that
+    # point of its lifetime starts a background reload and returns the
+    # current value straight away. If that reload fails the old value stays
+    # cached, and callers that missed and joined it get the exception.
+
+    def __init__(self, cache, negativeTtl=None, refreshAhead=None):
+        if refreshAhead is not None and not 0 < refreshAhead < 1:
+            raise ValueError("refreshAhead must be between 0 and 1")
+        self.cache = cache
+        self.negativeTtl = negativeTtl
+        self.refreshAhead = refreshAhead
+        self.inFlight = dict()
+
+    async def getOrLoad(self, key, loader, ttl=None):
+        hits, _ = self.cache.getMany((key,))
+        if key in hits:
+            value = hits[key]
+            if isinstance(value, LoadFailure):
+                raise value.exception
+            if self.refreshAhead is not None and key not in self.inFlight and self.isStale(key, ttl):
+                task = asyncio.ensure_future(self.load(key, loader, ttl, refresh=True))
+                task.add_done_callback(self.refreshDone)
+                self.inFlight[key] = task
+            return value
+
+        future = self.inFlight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self.load(key, loader, ttl, refresh=False))
+            self.inFlight[key] = future
+        # Shielded so that one cancelled caller does not cancel the load for
+        # everybody else waiting on it.
+        return await asyncio.shield(future)
+
+    def invalidate(self, key):
+        return self.cache.remove(key)
+
+    @staticmethod
+    def refreshDone(task):
+        # A refresh may have nobody waiting on it; take its failure so asyncio
+        # does not log it as never retrieved.
+        if not task.cancelled():
+            task.exception()
+
+    def isStale(self, key, ttl):
+        if ttl is None:
+            ttl = self.cache.defaultTtl
+        deadline = self.cache.timingWheel.deadline(key)
+        if ttl is None or deadline is None:
+            return False
+        return deadline - self.cache.clock() < ttl * (1 - self.refreshAhead)
+
+    async def load(self, key, loader, ttl, refresh):
+        try:
+            try:
+                value = loader(key)
+                if inspect.isawaitable(value):
+                    value = await value
+            except Exception as error:
+                # A failed refresh leaves the value we already have in place.
+                if not refresh and self.negativeTtl is not None:
+                    self.cache.store(key, LoadFailure(error), self.negativeTtl)
+                raise
+            self.cache.store(key, value, ttl)
+            return value
+        finally:
+            self.inFlight.pop(key, None)
@@ -1,30 +1,356 @@
+import time
+
+from Cache.src.Algorithms.HierarchicalTimingWheel import HierarchicalTimingWheel
 from Cache.src.Cache.Exceptions.NotFoundException import NotFoundException
 from Cache.src.Cache.Exceptions.StorageFullException import StorageFullException
+from Cache.src.Cache.stats.CacheStats import CacheStats
+from Cache.src.Cache.storage.HashMapBasedStorage import HashMapBasedStorage
 
 
 class Cache:
-    def __init__(self, evictionPolicy, storage):
+    def __init__(self, evictionPolicy, storage, admissionPolicy=None, defaultTtl=None,
+                 tickDuration=1.0, clock=time.monotonic, loader=None, writer=None,
+                 evictionListener=None, eventListeners=(), negativeCache=None):
         self.evictionPolicy = evictionPolicy
         self.storage = storage
+        self.admissionPolicy = admissionPolicy
+        self.defaultTtl = defaultTtl
+        self.clock = clock
+        self.timingWheel = HierarchicalTimingWheel(tickDuration, now=clock())
+        self.loader = loader
+        self.writer = writer
+        self.evictionListener = evictionListener
+        self.eventListeners = tuple(eventListeners)
+        self.negativeCache = negativeCache
+        # The last key get missed; its put is the same access, not a second one
+        self.lastMiss = None
+        self.stats = None
+
+    def put(self,key, value, ttl=None):
+        self.store(key, value, ttl)
+        if self.writer is not None:
+            self.writer.write(key, value)
 
-    def put(self,key, value):
+    def store(self, key, value, ttl=None):
+        if self.negativeCache is not None:
+            self.negativeCache.discard(key)
+        if self.admissionPolicy is not None:
+            if key == self.lastMiss:
+                self.lastMiss = None
+            else:
+                self.admissionPolicy.recordAccess(key)
+        stored = False
         try:
-            self.storage.add(key,value)
-            self.evictionPolicy.keyAccessed(key)
-        except StorageFullException:
-            print("Got Storage full. Will try to evict.")
-            keyToRemove = evictionPolicy.evictKey()
-            if keyToRemove is None:
-                raise RuntimeError("Unexpected State. Storage full and no key to evict.")
-            self.storage.remove(keyToRemove)
-            print("Creating space by evicting item ..." + keyToRemove)
-            self.put(key, value)
+            while True:
+                try:
+                    self.storage.add(key,value)
+                    stored = True
+                    self.evictionPolicy.keyAccessed(key)
+                    break
+                except StorageFullException:
+                    for listener in self.eventListeners:
+                        listener.storageFull(key)
+                    if self.admissionPolicy is not None:
+                        victim = self.evictionPolicy.victimKey()
+                        if victim is not None and not self.admissionPolicy.admit(key, victim):
+                            return
+                    victims = self.nextVictims(1)
+                    if not victims:
+                        raise RuntimeError("Unexpected State. Storage full and no key to evict.")
+                    keyToRemove = victims[0]
+                    if self.writer is not None:
+                        self.writer.flushIfDirty((keyToRemove,))
+                    try:
+                        if self.evictionListener is not None:
+                            self.evictionListener(keyToRemove, self.storage.get(keyToRemove))
+                        self.storage.remove(keyToRemove)
+                    except NotFoundException:
+                        # Another process sharing the storage removed it first.
+                        pass
+                    self.timingWheel.cancel(keyToRemove)
+                    for listener in self.eventListeners:
+                        listener.evicted(keyToRemove)
+        finally:
+            if not stored:
+                # Wrapping storages keep the encoded value across retries;
+                # a later put of the same object may have changed it.
+                self.storage.abandonAdd(key)
+
+        if ttl is None:
+            ttl = self.defaultTtl
+        if ttl is not None:
+            self.timingWheel.schedule(key, self.clock() + ttl)
+        elif self.timingWheel.locations:
+            self.timingWheel.cancel(key)
 
     def get(self, key):
+        # Hits and misses are recorded apart: an admission policy can take a
+        # hit more cheaply, the key having been admitted already.
+        if self.timingWheel.locations:
+            deadline = self.timingWheel.deadline(key)
+            if deadline is not None and deadline <= self.clock():
+                if self.admissionPolicy is not None:
+                    self.admissionPolicy.recordAccess(key)
+                    self.lastMiss = key
+                self.timingWheel.cancel(key)
+                self.expire(key)
+                for listener in self.eventListeners:
+                    listener.missed(key)
+                return None
         try:
             value=self.storage.get(key)
             self.evictionPolicy.keyAccessed(key)
+            if self.admissionPolicy is not None:
+                self.admissionPolicy.recordHit(key)
             return value
         except NotFoundException:
-            print("Tried to access non-exixting key.")
-            return None
\ No newline at end of file
+            if self.admissionPolicy is not None:
+                self.admissionPolicy.recordAccess(key)
+                self.lastMiss = key
+            for listener in self.eventListeners:
+                listener.missed(key)
+            if self.loader is None:
+                return None
+        value = self.load(key)
+        if value is not None:
+            self.store(key, value)
+        return value
+
+    def hitPath(self):
+        # For callers with their own hot loop (see CachedFunction): returns
+        # (entries, recordHits), the dict a HashMapBasedStorage keeps its
+        # values in and a function recording what get records for a list of
+        # hits, or None if hits need the full get. A lookup in entries is only
+        # a hit while no key has a TTL, that is while timingWheel.locations is
+        # empty; otherwise use get.
+        if type(self.storage) is not HashMapBasedStorage:
+            return None
+        keysAccessed = self.evictionPolicy.keysAccessed
+        if self.admissionPolicy is None:
+            return self.storage.storage, keysAccessed
+        recordAdmissionHits = self.admissionPolicy.recordHits
+
+        def recordHits(keys):
+            recordAdmissionHits(keys)
+            keysAccessed(keys)
+
+        return self.storage.storage, recordHits
+
+    def getMany(self, keys):
+        # Returns (hits, misses): a dict of found keys to values and a list of
+        # the keys that were not cached. Recency is updated in one pass.
+        if self.timingWheel.locations:
+            now = self.clock()
+            for key in keys:
+                deadline = self.timingWheel.deadline(key)
+                if deadline is not None and deadline <= now:
+                    self.timingWheel.cancel(key)
+                    self.expire(key)
+        hits, misses = self.storage.getMany(keys)
+        self.evictionPolicy.keysAccessed(hits)
+        if self.admissionPolicy is not None:
+            self.admissionPolicy.recordHits(list(hits))
+            for key in misses:
+                self.admissionPolicy.recordAccess(key)
+        for listener in self.eventListeners:
+            for key in misses:
+                listener.missed(key)
+        if self.loader is not None and misses:
+            loaded = dict()
+            for key in misses:
+                value = self.load(key)
+                if value is not None:
+                    loaded[key] = value
+            if loaded:
+                self.storeMany(loaded)
+                hits.update(loaded)
+                misses = [key for key in misses if key not in loaded]
+        return hits, misses
+
+    def putMany(self, items, ttl=None):
+        items = dict(items)
+        self.storeMany(items, ttl)
+        if self.writer is not None:
+            self.writer.writeMany(items)
+
+    def storeMany(self, items, ttl=None):
+        if self.negativeCache is not None:
+            for key in items:
+                self.negativeCache.discard(key)
+        if self.admissionPolicy is not None:
+            # Admission is decided per candidate against its own victim.
+            for key, value in items.items():
+                self.store(key, value, ttl)
+            return
+        while True:
+            shortfall = self.storage.shortfall(items)
+            if shortfall <= 0:
+                break
+            victims = self.nextVictims(shortfall)
+            if not victims:
+                # The batch alone does not fit; let put make room key by key.
+                for key, value in items.items():
+                    self.store(key, value, ttl)
+                return
+            if self.writer is not None:
+                self.writer.flushIfDirty(victims)
+            if self.evictionListener is not None:
+                for victim, value in self.storage.getMany(victims)[0].items():
+                    self.evictionListener(victim, value)
+            self.storage.removeMany(victims)
+            for listener in self.eventListeners:
+                for victim in victims:
+                    listener.evicted(victim)
+            for victim in victims:
+                self.timingWheel.cancel(victim)
+        self.storage.addMany(items)
+        self.evictionPolicy.keysAccessed(items)
+
+        if ttl is None:
+            ttl = self.defaultTtl
+        if ttl is not None:
+            deadline = self.clock() + ttl
+            for key in items:
+                self.timingWheel.schedule(key, deadline)
+        elif self.timingWheel.locations:
+            for key in items:
+                self.timingWheel.cancel(key)
+
+    def deleteMany(self, keys):
+        if self.writer is not None:
+            self.writer.flushIfDirty(keys)
+        removed = self.storage.removeMany(keys)
+        self.evictionPolicy.keysRemoved(removed)
+        if self.timingWheel.locations:
+            for key in removed:
+                self.timingWheel.cancel(key)
+        return removed
+
+    def remove(self, key):
+        if self.writer is not None:
+            self.writer.flushIfDirty((key,))
+        try:
+            self.storage.remove(key)
+        except NotFoundException:
+            return False
+        self.evictionPolicy.keyRemoved(key)
+        self.timingWheel.cancel(key)
+        return True
+
+    def clear(self):
+        return len(self.deleteMany(self.storage.keys()))
+
+    def nextVictims(self, count):
+        # Entries recovered from a persistent storage that nobody has touched
+        # since are the coldest we have, so they go before anything the policy
+        # is tracking.
+        victims = []
+        while len(victims) < count:
+            key = self.storage.recoveredKey()
+            if key is None:
+                break
+            victims.append(key)
+        if victims:
+            self.evictionPolicy.keysRemoved(victims)
+        if len(victims) < count:
+            victims.extend(self.evictionPolicy.evictKeys(count - len(victims)))
+        return victims
+
+    def expireEntries(self, maxEntries=None):
+        # Reclaims entries whose TTL has passed, at most maxEntries per call so
+        # a sweeper can work through a large backlog in bounded slices.
+        expired = self.timingWheel.advance(self.clock(), maxEntries)
+        for key in expired:
+            self.expire(key)
+        return len(expired)
+
+    def expire(self, key):
+        if self.writer is not None:
+            self.writer.flushIfDirty((key,))
+        try:
+            self.storage.remove(key)
+        except NotFoundException:
+            # Another process sharing the storage removed it first; our
+            # policy and listeners still have to let go of the key.
+            pass
+        self.evictionPolicy.keyRemoved(key)
+        for listener in self.eventListeners:
+            listener.expired(key)
+
+    def load(self, key):
+        # Keys the loader recently reported absent are answered from the
+        # negative cache without asking it again.
+        negativeCache = self.negativeCache
+        if negativeCache is not None and negativeCache.mightContain(key):
+            return None
+        if not self.eventListeners:
+            value = self.loader(key)
+        else:
+            start = time.perf_counter()
+            value = self.loader(key)
+            elapsed = time.perf_counter() - start
+            for listener in self.eventListeners:
+                listener.loaded(key, elapsed, value is not None)
+        if value is None and negativeCache is not None:
+            negativeCache.add(key)
+        return value
+
+    def addEventListener(self, listener):
+        self.eventListeners = self.eventListeners + (listener,)
+
+    def removeEventListener(self, listener):
+        self.eventListeners = tuple(each for each in self.eventListeners if each is not listener)
+
+    def enableStats(self, sampleEvery=1, stats=None):
+        # Swaps timed versions of get and put in on this instance only, so a
+        # cache with stats off runs exactly the code it ran before.
+        if self.stats is not None:
+            return self.stats
+        if stats is None:
+            stats = CacheStats(type(self.evictionPolicy).__name__, sampleEvery)
+        self.stats = stats
+        self.addEventListener(stats)
+        self.get = self.timedGet
+        self.put = self.timedPut
+        self.getMany = self.countedGetMany
+        self.putMany = self.countedPutMany
+        return stats
+
+    def disableStats(self):
+        if self.stats is None:
+            return
+        self.removeEventListener(self.stats)
+        self.stats = None
+        del self.get
+        del self.put
+        del self.getMany
+        del self.putMany
+
+    def timedGet(self, key):
+        stats = self.stats.forThread()
+        stats.gets += 1
+        if stats.gets % self.stats.sampleEvery:
+            return Cache.get(self, key)
+        start = time.perf_counter_ns()
+        value = Cache.get(self, key)
+        stats.getNanos.record(time.perf_counter_ns() - start)
+        return value
+
+    def timedPut(self, key, value, ttl=None):
+        stats = self.stats.forThread()
+        stats.puts += 1
+        if stats.puts % self.stats.sampleEvery:
+            return Cache.put(self, key, value, ttl)
+        start = time.perf_counter_ns()
+        Cache.put(self, key, value, ttl)
+        stats.putNanos.record(time.perf_counter_ns() - start)
+
+    def countedGetMany(self, keys):
+        keys = list(keys)
+        self.stats.forThread().gets += len(keys)
+        return Cache.getMany(self, keys)
+
+    def countedPutMany(self, items, ttl=None):
+        items = dict(items)
+        self.stats.forThread().puts += len(items)
+        Cache.putMany(self, items, ttl)
@@ -0,0 +1,107 @@
+import threading
+
+from Cache.src.Cache.Cache import Cache
+from Cache.src.Cache.stats.CacheStats import CacheStats
+
+
+class ConcurrentCache:
+    # Splits the key space over independent Cache shards, each guarded by its
+    # own lock, so threads touching different shards never wait on each other.
+    # The capacity budget is divided between the shards and always sums to the
+    # requested capacity.
+
+    def __init__(self, capacity, shardCount, evictionPolicyFactory, storageFactory, defaultTtl=None):
+        if shardCount < 1:
+            raise ValueError("shardCount must be at least 1")
+        if capacity < shardCount:
+            raise ValueError("capacity must be at least shardCount")
+        self.capacity = capacity
+        self.shards = []
+        self.locks = []
+        for index in range(shardCount):
+            shardCapacity = capacity // shardCount + (1 if index < capacity % shardCount else 0)
+            self.shards.append(Cache(evictionPolicyFactory(shardCapacity), storageFactory(shardCapacity),
+                                     defaultTtl=defaultTtl))
+            self.locks.append(threading.Lock())
+
+    def put(self, key, value, ttl=None):
+        index = hash(key) % len(self.shards)
+        with self.locks[index]:
+            self.shards[index].put(key, value, ttl)
+
+    def get(self, key):
+        index = hash(key) % len(self.shards)
+        with self.locks[index]:
+            return self.shards[index].get(key)
+
+    def remove(self, key):
+        index = hash(key) % len(self.shards)
+        with self.locks[index]:
+            return self.shards[index].remove(key)
+
+    def getMany(self, keys):
+        hits = dict()
+        misses = []
+        for index, shardKeys in self.groupByShard(keys).items():
+            with self.locks[index]:
+                shardHits, shardMisses = self.shards[index].getMany(shardKeys)
+            hits.update(shardHits)
+            misses.extend(shardMisses)
+        return hits, misses
+
+    def putMany(self, items, ttl=None):
+        items = dict(items)
+        for index, shardKeys in self.groupByShard(items).items():
+            with self.locks[index]:
+                self.shards[index].putMany({key: items[key] for key in shardKeys}, ttl)
+
+    def deleteMany(self, keys):
+        removed = []
+        for index, shardKeys in self.groupByShard(keys).items():
+            with self.locks[index]:
+                removed.extend(self.shards[index].deleteMany(shardKeys))
+        return removed
+
+    def enableStats(self, sampleEvery=1):
+        # One CacheStats for all shards; it keeps per-thread counters, so the
+        # shards never contend on it.
+        stats = CacheStats(type(self.shards[0].evictionPolicy).__name__, sampleEvery)
+        for shard, lock in zip(self.shards, self.locks):
+            with lock:
+                shard.enableStats(stats=stats)
+        return stats
+
+    def disableStats(self):
+        for shard, lock in zip(self.shards, self.locks):
+            with lock:
+                shard.disableStats()
+
+    def groupByShard(self, keys):
+        groups = dict()
+        shardCount = len(self.shards)
+        for key in keys:
+            groups.setdefault(hash(key) % shardCount, []).append(key)
+        return groups
+
+    def expireEntries(self, maxEntries=None):
+        # Each shard is swept under its own lock, so a sweep never blocks more
+        # than one shard at a time.
+        expired = 0
+        for shard, lock in zip(self.shards, self.locks):
+            with lock:
+                expired += shard.expireEntries(maxEntries)
+        return expired
+
+    def currentWeight(self):
+        total = 0
+        for shard, lock in zip(self.shards, self.locks):
+            with lock:
+                total += shard.storage.currentWeight()
+        return total
+
+    def size(self):
+        total = 0
+        for shard, lock in zip(self.shards, self.locks):
+            with lock:
+                total += shard.storage.size()
+        return total
@@ -0,0 +1,4 @@
+class CacheServerException(RuntimeError):
+
+    def __init__(self, message):
+        super().__init__(message)
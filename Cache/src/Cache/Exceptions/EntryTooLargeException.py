@@ -0,0 +1,4 @@
+class EntryTooLargeException(RuntimeError):
+
+    def __init__(self, message):
+        super().__init__(message)
\ No newline at end of file
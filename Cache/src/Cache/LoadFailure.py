@@ -0,0 +1,7 @@
+class LoadFailure:
+    # Cached in place of a value when a loader raised, so that callers see
+    # the same error again until the entry expires instead of hitting the
+    # failing backend on every request.
+
+    def __init__(self, exception):
+        self.exception = exception
@@ -0,0 +1,169 @@
+import queue
+import threading
+import time
+
+
+class TieredCache:
+    # A small, fast l1 Cache in front of a large (typically disk-backed) l2
+    # Cache. Entries evicted from l1 are demoted to l2 and l2 hits are
+    # promoted back into l1; both moves run on a background thread so a get
+    # never waits for a disk write. A key lives in one tier at a time.
+
+    def __init__(self, l1, l2):
+        self.l1 = l1
+        self.l2 = l2
+        self.l1.evictionListener = self.demote
+        self.l1Lock = threading.Lock()
+        self.l2Lock = threading.Lock()
+        # Demoted entries stay visible here until l2 has them, as
+        # (value, deadline) with the deadline on l1's clock or None.
+        self.pendingDemotions = dict()
+        # Moves that raised (an entry too large for l2, say) are dropped and
+        # counted so the mover keeps running; the last error is kept.
+        self.failedMoves = 0
+        self.lastMoveError = None
+        self.moves = queue.Queue()
+        self.stats = {tier: {"lookups": 0, "hits": 0, "latency": 0.0} for tier in ("l1", "l2")}
+        self.worker = threading.Thread(target=self.run, name="cache-tier-mover", daemon=True)
+        self.worker.start()
+
+    def get(self, key):
+        start = time.perf_counter()
+        with self.l1Lock:
+            hits, _ = self.l1.getMany((key,))
+            if key not in hits and key in self.pendingDemotions:
+                value, deadline = self.pendingDemotions[key]
+                if deadline is None or deadline > self.l1.clock():
+                    hits[key] = value
+        self.record("l1", key in hits, start)
+        if key in hits:
+            return hits[key]
+
+        start = time.perf_counter()
+        with self.l2Lock:
+            hits, _ = self.l2.getMany((key,))
+        self.record("l2", key in hits, start)
+        if key not in hits:
+            return None
+        value = hits[key]
+        self.moves.put(("promote", key, None))
+        return value
+
+    def put(self, key, value, ttl=None):
+        with self.l1Lock:
+            self.pendingDemotions.pop(key, None)
+            self.l1.put(key, value, ttl)
+        self.moves.put(("drop", key, None))
+
+    def remove(self, key):
+        # Both tiers at once, so a queued promotion cannot slip in between.
+        with self.l1Lock, self.l2Lock:
+            self.pendingDemotions.pop(key, None)
+            removedFromL1 = self.l1.remove(key)
+            removedFromL2 = self.l2.remove(key)
+        return removedFromL1 or removedFromL2
+
+    def demote(self, key, value):
+        # Called by l1 while l1Lock is held, before the victim's TTL is
+        # cancelled, so its deadline can travel with it to l2.
+        deadline = self.l1.timingWheel.deadline(key)
+        if deadline is not None and deadline <= self.l1.clock():
+            return
+        if isinstance(value, memoryview):
+            value = bytes(value)
+        entry = (value, deadline)
+        self.pendingDemotions[key] = entry
+        self.moves.put(("demote", key, entry))
+
+    def run(self):
+        while True:
+            move, key, value = self.moves.get()
+            try:
+                if move == "demote":
+                    # The l2 write may hit the disk (or compact), so only l2
+                    # is held for it; l1 gets keep serving the pending entry.
+                    with self.l1Lock:
+                        if self.pendingDemotions.get(key) is not value:
+                            continue
+                    try:
+                        with self.l2Lock:
+                            self.demoteToL2(key, *value)
+                    finally:
+                        with self.l1Lock, self.l2Lock:
+                            if self.pendingDemotions.get(key) is value:
+                                del self.pendingDemotions[key]
+                            else:
+                                # Rewritten or removed while l2 was written;
+                                # the copy just made there is stale.
+                                self.l2.remove(key)
+                elif move == "promote":
+                    # The value is read again under both locks: the key may
+                    # have been removed or rewritten since the hit, and a
+                    # promotion must never bring an old value back.
+                    with self.l1Lock, self.l2Lock:
+                        if self.l1.storage.containsKey(key) or key in self.pendingDemotions:
+                            continue
+                        hits, _ = self.l2.storage.getMany((key,))
+                        if key in hits:
+                            value = hits[key]
+                            if isinstance(value, memoryview):
+                                value = bytes(value)
+                            ttl = self.remainingTtl(self.l2, key)
+                            if ttl is None or ttl > 0:
+                                self.l1.store(key, value, ttl)
+                            self.l2.remove(key)
+                elif move == "drop":
+                    # l1 has the newest value; an older l2 copy must not win.
+                    with self.l2Lock:
+                        self.l2.remove(key)
+                elif move == "stop":
+                    return
+            except Exception as error:
+                self.failedMoves += 1
+                self.lastMoveError = error
+            finally:
+                self.moves.task_done()
+
+    def demoteToL2(self, key, value, deadline):
+        ttl = None
+        if deadline is not None:
+            ttl = deadline - self.l1.clock()
+            if ttl <= 0:
+                return
+        self.l2.put(key, value, ttl)
+
+    @staticmethod
+    def remainingTtl(cache, key):
+        deadline = cache.timingWheel.deadline(key)
+        if deadline is None:
+            return None
+        return max(deadline - cache.clock(), 0.0)
+
+    def drain(self):
+        self.moves.join()
+
+    def close(self):
+        self.moves.put(("stop", None, None))
+        self.worker.join()
+        close = getattr(self.l2.storage, "close", None)
+        if close is not None:
+            close()
+
+    def record(self, tier, hit, start):
+        stats = self.stats[tier]
+        stats["lookups"] += 1
+        stats["latency"] += time.perf_counter() - start
+        if hit:
+            stats["hits"] += 1
+
+    def tierStats(self):
+        report = dict()
+        for tier, stats in self.stats.items():
+            lookups = stats["lookups"]
+            report[tier] = {
+                "lookups": lookups,
+                "hits": stats["hits"],
+                "hitRatio": stats["hits"] / lookups if lookups else 0.0,
+                "meanLatencyMicros": stats["latency"] / lookups * 1e6 if lookups else 0.0,
+            }
+        return report
@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+
+
+class AdmissionPolicy(ABC):
+
+    @abstractmethod
+    def recordAccess(self, key):
+        pass
+
+    @abstractmethod
+    def admit(self, candidateKey, victimKey):
+        pass
+
+    def recordHit(self, key):
+        # An access to a key that is already cached.
+        self.recordAccess(key)
+
+    def recordHits(self, keys):
+        for key in keys:
+            self.recordHit(key)
@@ -0,0 +1,19 @@
+class CacheEventListener:
+    # Hooks a Cache calls on its slow paths. Every method is a no-op here;
+    # listeners override the events they care about. A Cache without
+    # listeners skips the calls altogether.
+
+    def missed(self, key):
+        pass
+
+    def storageFull(self, key):
+        pass
+
+    def evicted(self, key):
+        pass
+
+    def expired(self, key):
+        pass
+
+    def loaded(self, key, seconds, found):
+        pass
@@ -0,0 +1,15 @@
+from Cache.src.Cache.events.CacheEventListener import CacheEventListener
+
+
+class PrintingEventListener(CacheEventListener):
+    # The messages Cache used to print unconditionally, for anyone who wants
+    # them back while debugging.
+
+    def missed(self, key):
+        print("Tried to access non-exixting key.")
+
+    def storageFull(self, key):
+        print("Got Storage full. Will try to evict.")
+
+    def evicted(self, key):
+        print("Creating space by evicting item ..." + str(key))
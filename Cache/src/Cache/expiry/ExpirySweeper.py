@@ -0,0 +1,43 @@
+import contextlib
+import threading
+
+
+class ExpirySweeper:
+    # Background thread that reclaims expired entries every interval seconds.
+    # Work is done in slices of at most sliceSize entries and the lock is
+    # released between slices, so request threads never wait behind a full
+    # sweep. Pass the lock that guards a plain Cache; ConcurrentCache locks
+    # its shards itself and needs none.
+
+    def __init__(self, cache, interval=1.0, sliceSize=1000, lock=None):
+        self.cache = cache
+        self.interval = interval
+        self.sliceSize = sliceSize
+        self.lock = lock
+        self.stopped = threading.Event()
+        self.thread = None
+
+    def start(self):
+        self.stopped.clear()
+        self.thread = threading.Thread(target=self.run, name="cache-expiry-sweeper", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.sweep()
+
+    def sweep(self):
+        total = 0
+        while not self.stopped.is_set():
+            with self.lock if self.lock is not None else contextlib.nullcontext():
+                expired = self.cache.expireEntries(self.sliceSize)
+            total += expired
+            if expired < self.sliceSize:
+                break
+        return total
@@ -1,8 +1,93 @@
+import sys
+
+from Cache.src.Cache.AsyncCache import AsyncCache
 from Cache.src.Cache.Cache import Cache
+from Cache.src.Cache.ConcurrentCache import ConcurrentCache
+from Cache.src.Cache.TieredCache import TieredCache
+from Cache.src.Cache.admission.TinyLFUAdmissionPolicy import TinyLFUAdmissionPolicy
+from Cache.src.Cache.negative.NegativeLookupCache import NegativeLookupCache
+from Cache.src.Cache.policies.ARCEvictionPolicy import ARCEvictionPolicy
+from Cache.src.Cache.policies.ClockEvictionPolicy import ClockEvictionPolicy
+from Cache.src.Cache.policies.LFUEvictionPolicy import LFUEvictionPolicy
 from Cache.src.Cache.policies.LRUEvictionPolicy import LRUEvictionPolicy
+from Cache.src.Cache.policies.SharedClockEvictionPolicy import SharedClockEvictionPolicy
+from Cache.src.Cache.policies.SieveEvictionPolicy import SieveEvictionPolicy
+from Cache.src.Cache.policies.TwoQueueEvictionPolicy import TwoQueueEvictionPolicy
+from Cache.src.Cache.storage.CompressingStorage import CompressingStorage
 from Cache.src.Cache.storage.HashMapBasedStorage import HashMapBasedStorage
+from Cache.src.Cache.storage.MemoryMappedStorage import MemoryMappedStorage
+from Cache.src.Cache.storage.SerializingStorage import SerializingStorage
+from Cache.src.Cache.storage.SharedMemoryStorage import SharedMemoryStorage
+from Cache.src.Cache.writers.WriteBehindWriter import WriteBehindWriter
 
 
 class CacheFactory:
     def defaultCache(self,capacity):
-        return Cache(LRUEvictionPolicy(),HashMapBasedStorage(capacity))
\ No newline at end of file
+        return Cache(LRUEvictionPolicy(capacity),HashMapBasedStorage(capacity))
+
+    def concurrentCache(self, capacity, shardCount=16):
+        return ConcurrentCache(capacity, shardCount, LRUEvictionPolicy, HashMapBasedStorage)
+
+    def lfuCache(self, capacity, agingPeriod=None):
+        return Cache(LFUEvictionPolicy(capacity, agingPeriod),HashMapBasedStorage(capacity))
+
+    def tinyLfuCache(self, capacity, evictionPolicy=None):
+        if evictionPolicy is None:
+            evictionPolicy = LRUEvictionPolicy(capacity)
+        return Cache(evictionPolicy,HashMapBasedStorage(capacity),TinyLFUAdmissionPolicy(capacity))
+
+    def arcCache(self, capacity):
+        return Cache(ARCEvictionPolicy(capacity),HashMapBasedStorage(capacity))
+
+    def twoQueueCache(self, capacity):
+        return Cache(TwoQueueEvictionPolicy(capacity),HashMapBasedStorage(capacity))
+
+    def clockCache(self, capacity):
+        return Cache(ClockEvictionPolicy(capacity),HashMapBasedStorage(capacity))
+
+    def sieveCache(self, capacity):
+        return Cache(SieveEvictionPolicy(capacity),HashMapBasedStorage(capacity))
+
+    def expiringCache(self, capacity, defaultTtl=None, tickDuration=1.0):
+        return Cache(LRUEvictionPolicy(capacity),HashMapBasedStorage(capacity),
+                     defaultTtl=defaultTtl,tickDuration=tickDuration)
+
+    def weightedCache(self, maxWeight, weigher=None, evictionPolicy=None):
+        if weigher is None:
+            weigher = lambda key, value: sys.getsizeof(value)
+        if evictionPolicy is None:
+            evictionPolicy = LRUEvictionPolicy()
+        return Cache(evictionPolicy,HashMapBasedStorage(None, weigher, maxWeight))
+
+    def compressedCache(self, maxBytes, codec="zlib", threshold=1024, serializer="pickle", evictionPolicy=None):
+        # Budgeted by the bytes values take once serialized and compressed.
+        if evictionPolicy is None:
+            evictionPolicy = LRUEvictionPolicy()
+        storage = HashMapBasedStorage(None, CompressingStorage.storedSize, maxBytes)
+        return Cache(evictionPolicy,SerializingStorage(CompressingStorage(storage, codec, threshold), serializer))
+
+    def asyncCache(self, capacity, defaultTtl=None, negativeTtl=None, refreshAhead=None):
+        return AsyncCache(self.expiringCache(capacity, defaultTtl), negativeTtl, refreshAhead)
+
+    def readWriteCache(self, capacity, loader=None, writeBatch=None, batchSize=100, flushInterval=None,
+                       negativeCapacity=None, falsePositiveRate=0.01):
+        writer = None
+        if writeBatch is not None:
+            writer = WriteBehindWriter(writeBatch, batchSize, flushInterval)
+        negativeCache = None
+        if negativeCapacity is not None:
+            negativeCache = NegativeLookupCache(negativeCapacity, falsePositiveRate)
+        return Cache(LRUEvictionPolicy(capacity),HashMapBasedStorage(capacity),loader=loader,writer=writer,
+                     negativeCache=negativeCache)
+
+    def persistentCache(self, path, capacity, dataSize=64 * 1024 * 1024):
+        return Cache(LRUEvictionPolicy(capacity),MemoryMappedStorage(path, capacity, dataSize))
+
+    def tieredCache(self, l1Capacity, path, l2Capacity, dataSize=64 * 1024 * 1024):
+        return TieredCache(self.defaultCache(l1Capacity), self.persistentCache(path, l2Capacity, dataSize))
+
+    def sharedMemoryCache(self, capacity, slotSize=256, name=None):
+        # Build before forking the workers; each one then uses its inherited
+        # copy and they all share the same table.
+        storage = SharedMemoryStorage(capacity, slotSize, name=name)
+        return Cache(SharedClockEvictionPolicy(storage),storage)
@@ -0,0 +1,45 @@
+from Cache.src.Cache.AsyncCache import AsyncCache
+from Cache.src.Cache.memoize.CachedFunction import CachedFunction, NoneValue
+
+
+class AsyncCachedFunction(CachedFunction):
+    # @cached on a coroutine function. Single-flight comes from AsyncCache:
+    # callers that miss while a call for their key is running await it. All
+    # callers are on one event loop, so no lock is needed.
+
+    def __init__(self, function, cache, key=None):
+        CachedFunction.__init__(self, function, cache, key)
+        self.asyncCache = AsyncCache(cache)
+
+    def wrap(self):
+        cacheGet = self.cache.get
+        makeKey = self.makeKey
+        customKey = self.customKey
+        inFlight = self.asyncCache.inFlight
+        getOrLoad = self.asyncCache.getOrLoad
+        call = self.call
+
+        async def wrapper(*args, **kwargs):
+            key = makeKey(args, kwargs) if kwargs or customKey else args
+            value = cacheGet(key)
+            if value is not None:
+                self.hits += 1
+                return None if value is NoneValue else value
+            if key in inFlight:
+                self.waits += 1
+            else:
+                self.misses += 1
+            value = await getOrLoad(key, lambda _: call(args, kwargs))
+            return None if value is NoneValue else value
+
+        return self.decorate(wrapper)
+
+    async def call(self, args, kwargs):
+        value = await self.function(*args, **kwargs)
+        return NoneValue if value is None else value
+
+    def invalidate(self, *args, **kwargs):
+        return self.cache.remove(self.makeKey(args, kwargs))
+
+    def invalidateAll(self):
+        return self.cache.clear()
@@ -0,0 +1,192 @@
+import concurrent.futures
+import functools
+import threading
+
+
+class KeywordMarker:
+    # Separates positional from keyword arguments in a call key. A class
+    # rather than object() so keys stay picklable for file-backed storages.
+    pass
+
+
+class NoneValue:
+    # Stored in place of a None result; Cache.get uses None for a miss.
+    pass
+
+
+class CachedFunction:
+    # State behind a function decorated with @cached. wrap() returns the
+    # function callers actually get: a closure, so that a hit is one key
+    # build, one dict lookup and one list append, with no lock and no
+    # attribute lookups on the way. That shortcut (Cache.hitPath) is taken
+    # while the cache holds no TTL entries. The hits are handed to the
+    # eviction (and admission) policy in batches by drainHits, under the
+    # lock: when the buffer fills, before every miss and for cacheStats, so
+    # the policy always knows them before it picks a victim. Everything else
+    # goes through Cache.get under the lock. Functions only ever called from
+    # one thread can drop that lock with threadSafe=False. On a miss the
+    # first caller runs the function and everyone else asking for the same
+    # key meanwhile waits on its future instead of computing it again.
+
+    HIT_BUFFER_SIZE = 64
+
+    def __init__(self, function, cache, key=None, threadSafe=True):
+        self.function = function
+        self.cache = cache
+        self.customKey = key is not None
+        if key is not None:
+            self.makeKey = key
+        self.threadSafe = threadSafe
+        self.lock = threading.Lock()
+        self.inFlight = dict()
+        self.hitBuffer = []
+        self.entries = None
+        self.recordHits = None
+        self.hits = 0
+        self.misses = 0
+        self.waits = 0
+
+    @staticmethod
+    def makeKey(args, kwargs):
+        if not kwargs:
+            return args
+        key = args + (KeywordMarker,)
+        for item in kwargs.items():
+            key += item
+        return key
+
+    def wrap(self):
+        cacheGet = self.cache.get
+        makeKey = self.makeKey
+        customKey = self.customKey
+        load = self.load
+        lock = self.lock
+        acquire = lock.acquire
+        release = lock.release
+        drainHits = self.drainHits
+        hitPath = self.cache.hitPath() if hasattr(self.cache, "hitPath") else None
+        if hitPath is None:
+            entries, deadlines = dict(), True
+        else:
+            entries, self.recordHits = hitPath
+            self.entries = entries
+            # Non-empty as soon as any key has a TTL
+            deadlines = self.cache.timingWheel.locations
+        hitBuffer = self.hitBuffer
+        bufferHit = hitBuffer.append
+        bufferSize = self.HIT_BUFFER_SIZE
+
+        def wrapper(*args, **kwargs):
+            key = makeKey(args, kwargs) if kwargs or customKey else args
+            # A dict lookup and a list append are atomic, so hits skip the lock
+            value = None if deadlines else entries.get(key)
+            if value is not None:
+                bufferHit(key)
+                if len(hitBuffer) >= bufferSize:
+                    with lock:
+                        drainHits()
+                return None if value is NoneValue else value
+            acquire()
+            try:
+                drainHits()
+                value = cacheGet(key)
+                if value is not None:
+                    self.hits += 1
+                    return None if value is NoneValue else value
+            finally:
+                release()
+            return load(key, args, kwargs)
+
+        def unlockedWrapper(*args, **kwargs):
+            key = makeKey(args, kwargs) if kwargs or customKey else args
+            value = None if deadlines else entries.get(key)
+            if value is not None:
+                bufferHit(key)
+                if len(hitBuffer) >= bufferSize:
+                    drainHits()
+                return None if value is NoneValue else value
+            drainHits()
+            value = cacheGet(key)
+            if value is not None:
+                self.hits += 1
+                return None if value is NoneValue else value
+            return load(key, args, kwargs)
+
+        return self.decorate(wrapper if self.threadSafe else unlockedWrapper)
+
+    def drainHits(self):
+        # Called with the lock held (or single-threaded). Other threads may
+        # append meanwhile; only the keys copied here are taken off the front.
+        hitBuffer = self.hitBuffer
+        if not hitBuffer:
+            return
+        keys = hitBuffer[:]
+        del hitBuffer[:len(keys)]
+        self.hits += len(keys)
+        # A key evicted or invalidated since its hit must not re-enter the policy
+        entries = self.entries
+        self.recordHits([key for key in keys if key in entries])
+
+    def decorate(self, wrapper):
+        # Plain functions bind as methods by themselves, with the instance
+        # becoming part of the key as with functools.lru_cache.
+        functools.update_wrapper(wrapper, self.function)
+        wrapper.cache = self.cache
+        wrapper.invalidate = self.invalidate
+        wrapper.invalidateAll = self.invalidateAll
+        wrapper.cacheStats = self.cacheStats
+        return wrapper
+
+    def load(self, key, args, kwargs):
+        with self.lock:
+            value = self.cache.get(key)
+            if value is not None:
+                self.hits += 1
+                return None if value is NoneValue else value
+            future = self.inFlight.get(key)
+            if future is None:
+                self.misses += 1
+                future = concurrent.futures.Future()
+                self.inFlight[key] = future
+                owner = True
+            else:
+                self.waits += 1
+                owner = False
+        if not owner:
+            return future.result()
+
+        # Waiters block on the future until it is resolved, so it is resolved
+        # and the key leaves inFlight whatever the function or put raises.
+        try:
+            value = self.function(*args, **kwargs)
+            with self.lock:
+                self.cache.put(key, NoneValue if value is None else value)
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(value)
+        finally:
+            with self.lock:
+                del self.inFlight[key]
+        return value
+
+    def invalidate(self, *args, **kwargs):
+        with self.lock:
+            return self.cache.remove(self.makeKey(args, kwargs))
+
+    def invalidateAll(self):
+        with self.lock:
+            return self.cache.clear()
+
+    def cacheStats(self):
+        with self.lock:
+            self.drainHits()
+            calls = self.hits + self.misses + self.waits
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "waits": self.waits,
+                "hitRatio": self.hits / calls if calls else 0.0,
+                "size": self.cache.storage.size(),
+            }
@@ -0,0 +1,36 @@
+import inspect
+
+from Cache.src.Cache.factories.CacheFactory import CacheFactory
+from Cache.src.Cache.memoize.AsyncCachedFunction import AsyncCachedFunction
+from Cache.src.Cache.memoize.CachedFunction import CachedFunction
+
+
+def cached(capacity=128, policy="defaultCache", ttl=None, cache=None, key=None, threadSafe=True):
+    # Memoizes a function or coroutine function in its own bounded Cache.
+    #
+    #   @cached(capacity=10_000, policy="tinyLfuCache", ttl=60)
+    #   def lookup(userId): ...
+    #
+    # policy names any CacheFactory method that takes a capacity; pass cache
+    # to use a Cache built some other way. Such a cache keeps its own
+    # defaultTtl, so giving ttl as well is an error. key(args, kwargs)
+    # replaces the default argument key. threadSafe=False drops the lock
+    # taken on every call, for functions only ever called from one thread.
+    # The wrapper has
+    # invalidate(*args, **kwargs), invalidateAll() and cacheStats(). Plain
+    # @cached uses the defaults.
+    if callable(capacity):
+        return cached()(capacity)
+    if cache is not None and ttl is not None:
+        raise ValueError("ttl only applies to the cache @cached builds; set defaultTtl on the cache passed in")
+
+    def decorate(function):
+        functionCache = cache
+        if functionCache is None:
+            functionCache = getattr(CacheFactory(), policy)(capacity)
+            functionCache.defaultTtl = ttl
+        if inspect.iscoroutinefunction(function):
+            return AsyncCachedFunction(function, functionCache, key).wrap()
+        return CachedFunction(function, functionCache, key, threadSafe).wrap()
+
+    return decorate
@@ -0,0 +1,86 @@
+from Cache.src.Algorithms.BloomFilter import BloomFilter
+
+
+class NegativeLookupCache:
+    # Remembers keys the loader reported absent so that repeated lookups for
+    # them skip the origin. Two generations of Bloom filters of
+    # `capacity` keys each: new keys go into the current one and once it is
+    # full the older generation is dropped, which bounds both memory and how
+    # long a key is believed absent. Each generation is sized for half the
+    # target false-positive rate since lookups consult both.
+    #
+    # discard() is called when a key is stored. A filter match cannot tell a
+    # key that was added from a false positive, so nothing is taken out of
+    # the filters (counters decremented for a false positive would belong to
+    # other keys, which could then be missed). A matching key goes into a
+    # small exact set that overrides the filters instead, so a stored key is
+    # never reported absent afterwards. Rotation prunes the set, and it also
+    # forces a rotation once it outgrows capacity.
+
+    def __init__(self, capacity, falsePositiveRate=0.01):
+        self.capacity = capacity
+        self.falsePositiveRate = falsePositiveRate
+        self.current = BloomFilter(capacity, falsePositiveRate / 2)
+        self.previous = BloomFilter(capacity, falsePositiveRate / 2)
+        self.currentCount = 0
+        self.overrides = set()
+        self.lookups = 0
+        self.lookupsPrevented = 0
+        self.keysRecorded = 0
+        self.rotations = 0
+
+    def mightContain(self, key):
+        self.lookups += 1
+        if not (self.current.mightContain(key) or self.previous.mightContain(key)):
+            return False
+        if key in self.overrides:
+            return False
+        self.lookupsPrevented += 1
+        return True
+
+    def add(self, key):
+        self.overrides.discard(key)
+        if self.current.mightContain(key):
+            return
+        if self.currentCount >= self.capacity:
+            self.rotate()
+        self.current.add(key)
+        self.currentCount += 1
+        self.keysRecorded += 1
+
+    def discard(self, key):
+        if key in self.overrides:
+            return
+        if self.current.mightContain(key) or self.previous.mightContain(key):
+            self.overrides.add(key)
+            if len(self.overrides) > self.capacity:
+                self.rotate()
+
+    def rotate(self):
+        dropped = self.previous
+        self.previous = self.current
+        dropped.clear()
+        self.current = dropped
+        self.currentCount = 0
+        self.rotations += 1
+        self.overrides = {key for key in self.overrides
+                          if self.current.mightContain(key) or self.previous.mightContain(key)}
+
+    def clear(self):
+        self.current.clear()
+        self.previous.clear()
+        self.currentCount = 0
+        self.overrides = set()
+
+    def memoryBytes(self):
+        return len(self.current.bits) + len(self.previous.bits)
+
+    def negativeStats(self):
+        return {
+            "lookups": self.lookups,
+            "lookupsPrevented": self.lookupsPrevented,
+            "keysRecorded": self.keysRecorded,
+            "rotations": self.rotations,
+            "overrides": len(self.overrides),
+            "memoryBytes": self.memoryBytes(),
+        }
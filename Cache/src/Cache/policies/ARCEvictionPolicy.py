@@ -0,0 +1,72 @@
+from collections import OrderedDict
+
+from Cache.src.Cache.policies.EvictionPolicy import EvictionPolicy
+
+
+class ARCEvictionPolicy(EvictionPolicy):
+    # Adaptive Replacement Cache (Megiddo & Modha). t1 holds keys seen once
+    # recently, t2 keys seen at least twice; b1/b2 remember keys recently
+    # evicted from them. A hit in b1 grows the recency target p, a hit in b2
+    # shrinks it, so the split between the two segments follows the workload.
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.target = 0
+        self.t1 = OrderedDict()
+        self.t2 = OrderedDict()
+        self.b1 = OrderedDict()
+        self.b2 = OrderedDict()
+
+    def keyAccessed(self, key):
+        if key in self.t2:
+            self.t2.move_to_end(key)
+        elif key in self.t1:
+            del self.t1[key]
+            self.t2[key] = None
+        elif key in self.b1:
+            self.target = min(self.capacity, self.target + max(len(self.b2) // len(self.b1), 1))
+            del self.b1[key]
+            self.t2[key] = None
+        elif key in self.b2:
+            self.target = max(0, self.target - max(len(self.b1) // len(self.b2), 1))
+            del self.b2[key]
+            self.t2[key] = None
+        else:
+            self.t1[key] = None
+            self.trimGhosts()
+
+    def evictKey(self):
+        if self.evictFromT1():
+            key, _ = self.t1.popitem(last=False)
+            self.b1[key] = None
+        elif self.t2:
+            key, _ = self.t2.popitem(last=False)
+            self.b2[key] = None
+        else:
+            return None
+        self.trimGhosts()
+        return key
+
+    def victimKey(self):
+        if self.evictFromT1():
+            return next(iter(self.t1))
+        if self.t2:
+            return next(iter(self.t2))
+        return None
+
+    def keyRemoved(self, key):
+        # An explicitly deleted key was not pushed out by the policy, so it
+        # must not come back as a ghost hit and skew the target.
+        for segment in (self.t1, self.t2, self.b1, self.b2):
+            if key in segment:
+                del segment[key]
+                return
+
+    def evictFromT1(self):
+        return bool(self.t1) and (len(self.t1) > self.target or not self.t2)
+
+    def trimGhosts(self):
+        while self.b1 and len(self.t1) + len(self.b1) > self.capacity:
+            self.b1.popitem(last=False)
+        while self.b2 and len(self.t1) + len(self.t2) + len(self.b1) + len(self.b2) > 2 * self.capacity:
+            self.b2.popitem(last=False)
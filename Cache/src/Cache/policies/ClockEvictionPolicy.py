@@ -0,0 +1,101 @@
+from Cache.src.Cache.policies.EvictionPolicy import EvictionPolicy
+
+
+class ClockEvictionPolicy(EvictionPolicy):
+    # Keys sit in a fixed ring of frames with one reference bit per frame,
+    # packed eight to a byte. A hit only sets the bit. To evict, the hand
+    # sweeps the ring clearing set bits and takes the first key whose bit is
+    # already clear. The new key reuses the freed frame, just behind the hand.
+
+    DEFAULT_CAPACITY = 16
+
+    def __init__(self, capacity=None):
+        capacity = max(capacity or self.DEFAULT_CAPACITY, 1)
+        self.slots = dict()
+        self.keys = []
+        self.referenced = bytearray((capacity + 7) >> 3)
+        self.freeSlots = []
+        self.hand = 0
+
+    def __len__(self):
+        return len(self.slots)
+
+    def __contains__(self, key):
+        return key in self.slots
+
+    def keyAccessed(self, key):
+        slot = self.slots.get(key)
+        if slot is not None:
+            self.referenced[slot >> 3] |= 1 << (slot & 7)
+            return
+        if self.freeSlots:
+            slot = self.freeSlots.pop()
+            self.keys[slot] = key
+        else:
+            slot = len(self.keys)
+            self.keys.append(key)
+            if slot >> 3 == len(self.referenced):
+                self.referenced.append(0)
+        # New keys start unreferenced: they have to be hit to survive a sweep.
+        self.slots[key] = slot
+
+    def keysAccessed(self, keys):
+        slots = self.slots
+        referenced = self.referenced
+        for key in keys:
+            slot = slots.get(key)
+            if slot is None:
+                self.keyAccessed(key)
+                referenced = self.referenced
+            else:
+                referenced[slot >> 3] |= 1 << (slot & 7)
+
+    def evictKey(self):
+        if not self.slots:
+            return None
+        keys = self.keys
+        referenced = self.referenced
+        hand = self.hand
+        while True:
+            if hand >= len(keys):
+                hand = 0
+            key = keys[hand]
+            if key is not None:
+                mask = 1 << (hand & 7)
+                if not referenced[hand >> 3] & mask:
+                    break
+                referenced[hand >> 3] ^= mask
+            hand += 1
+        del self.slots[key]
+        keys[hand] = None
+        self.freeSlots.append(hand)
+        self.hand = hand + 1
+        return key
+
+    def victimKey(self):
+        # Where the sweep would stop, without clearing any bits: the first
+        # unreferenced key from the hand on, or the first key at all if every
+        # bit is set.
+        if not self.slots:
+            return None
+        keys = self.keys
+        referenced = self.referenced
+        first = None
+        for offset in range(len(keys)):
+            slot = (self.hand + offset) % len(keys)
+            key = keys[slot]
+            if key is None:
+                continue
+            if not referenced[slot >> 3] & (1 << (slot & 7)):
+                return key
+            if first is None:
+                first = key
+        return first
+
+    def keyRemoved(self, key):
+        slot = self.slots.pop(key, None)
+        if slot is None:
+            return
+        self.keys[slot] = None
+        self.referenced[slot >> 3] &= ~(1 << (slot & 7)) & 0xFF
+        self.freeSlots.append(slot)
@@ -9,4 +9,30 @@ class EvictionPolicy(ABC):
 
     @abstractmethod
     def evictKey(self):
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def keyRemoved(self, key):
+        pass
+
+    def victimKey(self):
+        # Key evictKey would return next, without evicting it. Policies that
+        # cannot tell return None and the cache admits every new key.
+        return None
+
+    def keysAccessed(self, keys):
+        for key in keys:
+            self.keyAccessed(key)
+
+    def evictKeys(self, count):
+        keys = []
+        while len(keys) < count:
+            key = self.evictKey()
+            if key is None:
+                break
+            keys.append(key)
+        return keys
+
+    def keysRemoved(self, keys):
+        for key in keys:
+            self.keyRemoved(key)
@@ -0,0 +1,117 @@
+import heapq
+from collections import OrderedDict
+from operator import itemgetter
+
+from Cache.src.Algorithms.FrequencyBucket import FrequencyBucket
+from Cache.src.Cache.policies.EvictionPolicy import EvictionPolicy
+
+
+class LFUEvictionPolicy(EvictionPolicy):
+    # Constant-time LFU: buckets form a list sorted by frequency and every key
+    # points at its bucket, so an access moves the key to the neighbouring
+    # bucket and eviction pops the oldest key of the lowest bucket. With an
+    # agingPeriod every count is halved after that many accesses, letting keys
+    # that are no longer requested fall back towards the bottom.
+    #
+    # Each key is stored in its bucket with the number of the access that put
+    # it there, its last access, so buckets merged by age() can be put back
+    # in recency order.
+
+    def __init__(self, capacity=None, agingPeriod=None):
+        self.head = FrequencyBucket(0)
+        self.head.next = self.head
+        self.head.prev = self.head
+        self.keyBuckets = dict()
+        self.agingPeriod = agingPeriod
+        self.accesses = 0
+        self.lastAccess = 0
+
+    def keyAccessed(self, key):
+        bucket = self.keyBuckets.get(key)
+        if bucket is None:
+            target = self.head.next
+            if target.frequency != 1:
+                target = self.insertBucketAfter(self.head, 1)
+        else:
+            target = bucket.next
+            if target.frequency != bucket.frequency + 1:
+                target = self.insertBucketAfter(bucket, bucket.frequency + 1)
+            del bucket.keys[key]
+            if not bucket.keys:
+                self.unlinkBucket(bucket)
+        self.lastAccess += 1
+        target.keys[key] = self.lastAccess
+        self.keyBuckets[key] = target
+
+        if self.agingPeriod is not None:
+            self.accesses += 1
+            if self.accesses >= self.agingPeriod:
+                self.accesses = 0
+                self.age()
+
+    def evictKey(self):
+        bucket = self.head.next
+        if bucket is self.head:
+            return None
+        key, _ = bucket.keys.popitem(last=False)
+        if not bucket.keys:
+            self.unlinkBucket(bucket)
+        del self.keyBuckets[key]
+        return key
+
+    def keyRemoved(self, key):
+        bucket = self.keyBuckets.pop(key, None)
+        if bucket is not None:
+            del bucket.keys[key]
+            if not bucket.keys:
+                self.unlinkBucket(bucket)
+
+    def victimKey(self):
+        bucket = self.head.next
+        if bucket is self.head:
+            return None
+        return next(iter(bucket.keys))
+
+    def frequencyOf(self, key):
+        bucket = self.keyBuckets.get(key)
+        return 0 if bucket is None else bucket.frequency
+
+    def age(self):
+        # Halve every count, merging buckets that collapse onto the same value.
+        # Visits every bucket and rebuilds the merged ones, so a call is
+        # O(buckets + keys in merged buckets), up to O(keys). Spread over the
+        # agingPeriod accesses between calls that is O(1) per access only if
+        # agingPeriod is at least the number of keys.
+        bucket = self.head.next
+        previous = self.head
+        self.head.next = self.head
+        self.head.prev = self.head
+        while bucket is not self.head:
+            following = bucket.next
+            frequency = max(bucket.frequency // 2, 1)
+            if previous is not self.head and previous.frequency == frequency:
+                # Both are in last-access order already; interleave them
+                previous.keys = OrderedDict(heapq.merge(previous.keys.items(), bucket.keys.items(),
+                                                        key=itemgetter(1)))
+                for key in bucket.keys:
+                    self.keyBuckets[key] = previous
+            else:
+                bucket.frequency = frequency
+                bucket.prev = previous
+                bucket.next = self.head
+                previous.next = bucket
+                self.head.prev = bucket
+                previous = bucket
+            bucket = following
+
+    def insertBucketAfter(self, bucket, frequency):
+        newBucket = FrequencyBucket(frequency)
+        newBucket.prev = bucket
+        newBucket.next = bucket.next
+        bucket.next.prev = newBucket
+        bucket.next = newBucket
+        return newBucket
+
+    def unlinkBucket(self, bucket):
+        bucket.prev.next = bucket.next
+        bucket.next.prev = bucket.prev
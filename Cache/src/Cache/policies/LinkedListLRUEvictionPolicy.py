@@ -0,0 +1,31 @@
+from Cache.src.Algorithms.DoublyLinkedList import DoublyLinkedList
+from Cache.src.Cache.policies.EvictionPolicy import EvictionPolicy
+
+
+class LinkedListLRUEvictionPolicy(EvictionPolicy):
+
+    def __init__(self):
+        self.dll = DoublyLinkedList()
+        self.mapper = dict()
+
+    def keyAccessed(self,key):
+        node = self.mapper.get(key)
+        if node is not None:
+            self.dll.detachNode(node)
+            self.dll.addNodeAtLast(node)
+        else:
+            newNode = self.dll.addElementAtLast(key)
+            self.mapper[key] = newNode
+
+    def evictKey(self):
+        if not self.dll.isItemPresent():
+            return None
+        first = self.dll.getFirstNode()
+        self.dll.detachNode(first)
+        del self.mapper[first.getElement()]
+        return first.getElement()
+
+    def keyRemoved(self, key):
+        node = self.mapper.pop(key, None)
+        if node is not None:
+            self.dll.detachNode(node)
@@ -0,0 +1,30 @@
+from Cache.src.Cache.policies.EvictionPolicy import EvictionPolicy
+
+
+class SharedClockEvictionPolicy(EvictionPolicy):
+    # CLOCK whose reference bits and hand live in a SharedMemoryStorage, so
+    # every process sharing the storage evicts from the same picture. The
+    # storage sets a slot's bit on every hit and clears it on removal, which
+    # leaves nothing for this side to track per key.
+
+    def __init__(self, storage):
+        self.storage = storage
+
+    def keyAccessed(self, key):
+        pass
+
+    def keysAccessed(self, keys):
+        pass
+
+    def evictKey(self):
+        victims = self.storage.clockVictims(1)
+        return victims[0] if victims else None
+
+    def evictKeys(self, count):
+        return self.storage.clockVictims(count)
+
+    def keyRemoved(self, key):
+        pass
+
+    def keysRemoved(self, keys):
+        pass
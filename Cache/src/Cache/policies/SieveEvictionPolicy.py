@@ -0,0 +1,124 @@
+from Cache.src.Cache.policies.EvictionPolicy import EvictionPolicy
+
+
+class SieveEvictionPolicy(EvictionPolicy):
+    # SIEVE: keys are kept in insertion order with one visited bit each,
+    # packed eight to a byte. A hit only sets the bit. The hand moves from the
+    # oldest key towards the newest, clearing set bits, and evicts the first
+    # key whose bit is already clear; surviving keys keep their place instead
+    # of being moved to the head as CLOCK or LRU would. New keys are appended.
+    #
+    # Evicted and removed keys leave holes that the hand steps over. Once
+    # more than half of the list is holes it is compacted, which only ever
+    # happens on eviction or removal, never on a hit.
+
+    DEFAULT_CAPACITY = 16
+
+    def __init__(self, capacity=None):
+        capacity = max(capacity or self.DEFAULT_CAPACITY, 1)
+        self.slots = dict()
+        self.keys = []
+        self.visited = bytearray((capacity + 7) >> 3)
+        self.hand = 0
+        self.holes = 0
+
+    def __len__(self):
+        return len(self.slots)
+
+    def __contains__(self, key):
+        return key in self.slots
+
+    def keyAccessed(self, key):
+        slot = self.slots.get(key)
+        if slot is not None:
+            self.visited[slot >> 3] |= 1 << (slot & 7)
+            return
+        slot = len(self.keys)
+        self.keys.append(key)
+        if slot >> 3 == len(self.visited):
+            self.visited.append(0)
+        self.slots[key] = slot
+
+    def keysAccessed(self, keys):
+        slots = self.slots
+        visited = self.visited
+        for key in keys:
+            slot = slots.get(key)
+            if slot is None:
+                self.keyAccessed(key)
+                visited = self.visited
+            else:
+                visited[slot >> 3] |= 1 << (slot & 7)
+
+    def evictKey(self):
+        if not self.slots:
+            return None
+        keys = self.keys
+        visited = self.visited
+        hand = self.hand
+        while True:
+            if hand >= len(keys):
+                hand = 0
+            key = keys[hand]
+            if key is not None:
+                mask = 1 << (hand & 7)
+                if not visited[hand >> 3] & mask:
+                    break
+                visited[hand >> 3] ^= mask
+            hand += 1
+        del self.slots[key]
+        keys[hand] = None
+        self.hand = hand + 1
+        self.holes += 1
+        self.compactIfSparse()
+        return key
+
+    def victimKey(self):
+        if not self.slots:
+            return None
+        keys = self.keys
+        visited = self.visited
+        first = None
+        for offset in range(len(keys)):
+            slot = (self.hand + offset) % len(keys)
+            key = keys[slot]
+            if key is None:
+                continue
+            if not visited[slot >> 3] & (1 << (slot & 7)):
+                return key
+            if first is None:
+                first = key
+        return first
+
+    def keyRemoved(self, key):
+        slot = self.slots.pop(key, None)
+        if slot is None:
+            return
+        self.keys[slot] = None
+        self.visited[slot >> 3] &= ~(1 << (slot & 7)) & 0xFF
+        self.holes += 1
+        self.compactIfSparse()
+
+    def compactIfSparse(self):
+        if self.holes <= self.DEFAULT_CAPACITY or 2 * self.holes <= len(self.keys):
+            return
+        keys = []
+        slots = self.slots
+        visited = bytearray((len(slots) + 7) >> 3)
+        hand = 0
+        for slot, key in enumerate(self.keys):
+            if slot == self.hand:
+                hand = len(keys)
+            if key is None:
+                continue
+            newSlot = len(keys)
+            if self.visited[slot >> 3] & (1 << (slot & 7)):
+                visited[newSlot >> 3] |= 1 << (newSlot & 7)
+            keys.append(key)
+            slots[key] = newSlot
+        if self.hand >= len(self.keys):
+            hand = len(keys)
+        self.keys = keys
+        self.visited = visited
+        self.hand = hand
+        self.holes = 0
@@ -0,0 +1,57 @@
+from collections import OrderedDict
+
+from Cache.src.Cache.policies.EvictionPolicy import EvictionPolicy
+
+
+class TwoQueueEvictionPolicy(EvictionPolicy):
+    # Full 2Q (Johnson & Shasha). New keys enter the a1in FIFO; keys pushed out
+    # of it are remembered in the a1out ghost FIFO, and only a key seen again
+    # while it is a ghost is promoted to the am LRU. A scan therefore only ever
+    # cycles through a1in and never displaces am.
+
+    def __init__(self, capacity, inRatio=0.25, outRatio=0.5):
+        self.capacity = capacity
+        self.inCapacity = max(int(capacity * inRatio), 1)
+        self.outCapacity = max(int(capacity * outRatio), 1)
+        self.a1in = OrderedDict()
+        self.a1out = OrderedDict()
+        self.am = OrderedDict()
+
+    def keyAccessed(self, key):
+        if key in self.am:
+            self.am.move_to_end(key)
+        elif key in self.a1in:
+            pass
+        elif key in self.a1out:
+            del self.a1out[key]
+            self.am[key] = None
+        else:
+            self.a1in[key] = None
+
+    def evictKey(self):
+        if self.evictFromA1in():
+            key, _ = self.a1in.popitem(last=False)
+            self.a1out[key] = None
+            if len(self.a1out) > self.outCapacity:
+                self.a1out.popitem(last=False)
+            return key
+        if self.am:
+            key, _ = self.am.popitem(last=False)
+            return key
+        return None
+
+    def victimKey(self):
+        if self.evictFromA1in():
+            return next(iter(self.a1in))
+        if self.am:
+            return next(iter(self.am))
+        return None
+
+    def keyRemoved(self, key):
+        for segment in (self.a1in, self.am, self.a1out):
+            if key in segment:
+                del segment[key]
+                return
+
+    def evictFromA1in(self):
+        return bool(self.a1in) and (len(self.a1in) > self.inCapacity or not self.am)
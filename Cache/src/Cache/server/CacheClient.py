@@ -0,0 +1,50 @@
+from Cache.src.Cache.Exceptions.CacheServerException import CacheServerException
+from Cache.src.Cache.server.CacheConnection import CacheConnection
+from Cache.src.Cache.server.Protocol import ERROR, OK, Protocol
+
+
+class CacheClient:
+    # asyncio client for a CacheServer with a pool of pipelined connections.
+    # Each request goes to the connection with the fewest requests in flight,
+    # so concurrent callers spread over the pool and queue up behind each
+    # other on a connection instead of waiting for a free one.
+
+    def __init__(self, host="127.0.0.1", port=None, path=None, poolSize=4):
+        self.host = host
+        self.port = port
+        self.path = path
+        self.poolSize = poolSize
+        self.connections = []
+
+    async def connect(self):
+        for _ in range(self.poolSize):
+            self.connections.append(await CacheConnection.open(self.host, self.port, self.path))
+        return self
+
+    async def request(self, frame):
+        connection = min(self.connections, key=len)
+        status, body = await connection.request(frame)
+        if status == ERROR:
+            raise CacheServerException(body.decode(errors="replace"))
+        return status, body
+
+    async def get(self, key):
+        status, body = await self.request(Protocol.encodeGet(key))
+        return body if status == OK else None
+
+    async def put(self, key, value, ttl=None):
+        await self.request(Protocol.encodePut(key, value, ttl))
+
+    async def delete(self, key):
+        status, _ = await self.request(Protocol.encodeDelete(key))
+        return status == OK
+
+    async def getMany(self, keys):
+        keys = list(keys)
+        _, body = await self.request(Protocol.encodeGetMany(keys))
+        return {key: value for key, value in zip(keys, Protocol.decodeValues(body)) if value is not None}
+
+    async def close(self):
+        for connection in self.connections:
+            await connection.close()
+        self.connections = []
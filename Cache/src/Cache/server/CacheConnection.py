@@ -0,0 +1,79 @@
+import asyncio
+import collections
+
+from Cache.src.Cache.Exceptions.CacheServerException import CacheServerException
+from Cache.src.Cache.server.Protocol import HEADER
+
+
+class CacheConnection:
+    # One pipelined connection to a CacheServer. Requests are answered in the
+    # order they were sent, so each one just queues a future and a single
+    # reader task resolves them as responses arrive. Requests sent within
+    # the same event loop iteration are coalesced into one write.
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.loop = asyncio.get_running_loop()
+        self.pending = collections.deque()
+        self.outgoing = []
+        self.closed = False
+        self.readerTask = asyncio.ensure_future(self.readResponses())
+
+    @classmethod
+    async def open(cls, host="127.0.0.1", port=None, path=None):
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    def __len__(self):
+        return len(self.pending)
+
+    async def request(self, frame):
+        if self.closed:
+            raise CacheServerException("connection is closed")
+        future = self.loop.create_future()
+        self.pending.append(future)
+        if not self.outgoing:
+            self.loop.call_soon(self.flush)
+        self.outgoing.append(frame)
+        return await future
+
+    def flush(self):
+        if self.outgoing and not self.closed:
+            self.writer.write(b"".join(self.outgoing))
+        self.outgoing = []
+
+    async def readResponses(self):
+        try:
+            while True:
+                header = await self.reader.readexactly(HEADER.size)
+                length, status = HEADER.unpack(header)
+                body = await self.reader.readexactly(length) if length else b""
+                future = self.pending.popleft()
+                if not future.done():
+                    future.set_result((status, body))
+        except (asyncio.IncompleteReadError, ConnectionError) as error:
+            self.failPending(CacheServerException("connection lost: " + str(error)))
+        except asyncio.CancelledError:
+            self.failPending(CacheServerException("connection closed"))
+            raise
+
+    def failPending(self, error):
+        self.closed = True
+        while self.pending:
+            future = self.pending.popleft()
+            if not future.done():
+                future.set_exception(error)
+
+    async def close(self):
+        self.flush()
+        self.closed = True
+        self.writer.close()
+        self.readerTask.cancel()
+        try:
+            await self.readerTask
+        except asyncio.CancelledError:
+            pass
@@ -0,0 +1,126 @@
+import asyncio
+
+from Cache.src.Cache.server.Protocol import (DELETE, ERROR, GET, GET_MANY, NOT_FOUND, OK, PUT, Protocol)
+
+
+class CacheServer:
+    # Serves one Cache over TCP (host, port) or a Unix socket (path). All
+    # connections are handled on one event loop, so the cache needs no lock.
+    # Whatever a client has pipelined by the time a read returns is executed
+    # as one batch: runs of GETs become one getMany and runs of PUTs one
+    # putMany, and the responses go out in a single write.
+
+    def __init__(self, cache, host="127.0.0.1", port=0, path=None):
+        self.cache = cache
+        self.host = host
+        self.port = port
+        self.path = path
+        self.server = None
+
+    async def start(self):
+        if self.path is not None:
+            self.server = await asyncio.start_unix_server(self.handle, path=self.path)
+        else:
+            self.server = await asyncio.start_server(self.handle, self.host, self.port)
+            self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def serveForever(self):
+        await self.server.serve_forever()
+
+    async def close(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(self, reader, writer):
+        buffer = bytearray()
+        try:
+            while True:
+                data = await reader.read(256 * 1024)
+                if not data:
+                    break
+                buffer += data
+                frames, consumed = Protocol.decodeFrames(buffer)
+                if not frames:
+                    continue
+                del buffer[:consumed]
+                writer.write(self.execute(frames))
+                await writer.drain()
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    def execute(self, frames):
+        responses = []
+        index = 0
+        while index < len(frames):
+            code = frames[index][0]
+            end = index + 1
+            if code == GET or code == PUT:
+                while end < len(frames) and frames[end][0] == code:
+                    end += 1
+            run = frames[index:end]
+            try:
+                if code == GET:
+                    self.getRun(run, responses)
+                elif code == PUT:
+                    self.putRun(run, responses)
+                elif code == DELETE:
+                    removed = self.cache.remove(run[0][1])
+                    responses.append(Protocol.encodeResponse(OK if removed else NOT_FOUND))
+                elif code == GET_MANY:
+                    keys = Protocol.decodeKeys(run[0][1])
+                    hits, _ = self.cache.getMany(keys)
+                    values = Protocol.encodeValues([hits.get(key) for key in keys])
+                    responses.append(Protocol.encodeResponse(OK, values))
+                else:
+                    responses.append(Protocol.encodeResponse(ERROR, b"unknown opcode"))
+            except Exception as error:
+                message = str(error).encode()
+                responses.extend(Protocol.encodeResponse(ERROR, message) for _ in run)
+            index = end
+        return b"".join(responses)
+
+    def getRun(self, run, responses):
+        hits, _ = self.cache.getMany([body for _, body in run])
+        for _, key in run:
+            value = hits.get(key)
+            if value is None:
+                responses.append(Protocol.encodeResponse(NOT_FOUND))
+            else:
+                responses.append(Protocol.encodeResponse(OK, value))
+
+    def putRun(self, run, responses):
+        # One putMany per stretch of PUTs sharing a ttl; a later PUT of the
+        # same key wins, as it would have one by one. Every PUT gets its own
+        # status, so one bad frame or value does not fail the others.
+        statuses = [Protocol.encodeResponse(OK)] * len(run)
+        stretch = []
+        batchTtl = None
+        for position, (_, body) in enumerate(run):
+            try:
+                key, value, ttl = Protocol.decodePut(body)
+            except Exception as error:
+                statuses[position] = Protocol.encodeResponse(ERROR, str(error).encode())
+                continue
+            if stretch and ttl != batchTtl:
+                self.putStretch(stretch, batchTtl, statuses)
+                stretch = []
+            batchTtl = ttl
+            stretch.append((position, key, value))
+        if stretch:
+            self.putStretch(stretch, batchTtl, statuses)
+        responses.extend(statuses)
+
+    def putStretch(self, stretch, ttl, statuses):
+        try:
+            self.cache.putMany({key: value for _, key, value in stretch}, ttl)
+        except Exception:
+            # putMany may have stored part of the stretch before it raised;
+            # putting each again on its own finds out which ones fail.
+            for position, key, value in stretch:
+                try:
+                    self.cache.put(key, value, ttl)
+                except Exception as error:
+                    statuses[position] = Protocol.encodeResponse(ERROR, str(error).encode())
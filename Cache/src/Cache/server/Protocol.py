@@ -0,0 +1,119 @@
+import math
+import struct
+
+# Every frame is a 5 byte header, the body length and a code, then the body.
+# Requests carry an opcode and responses a status. Responses come back in
+# request order, so a client can pipeline any number of requests on one
+# connection without tagging them.
+HEADER = struct.Struct("<IB")
+LENGTH = struct.Struct("<I")
+PUT_HEADER = struct.Struct("<Id")
+VALUE_LENGTH = struct.Struct("<i")
+
+GET = 1
+PUT = 2
+DELETE = 3
+GET_MANY = 4
+
+OK = 0
+NOT_FOUND = 1
+ERROR = 2
+
+MAX_BODY = 64 * 1024 * 1024
+
+
+class Protocol:
+    # Keys and values are bytes; callers that want to store objects encode
+    # them themselves.
+    #
+    #   GET       key                                 -> OK value | NOT_FOUND
+    #   PUT       keyLength:u32 ttl:f64 key value     -> OK
+    #   DELETE    key                                 -> OK | NOT_FOUND
+    #   GET_MANY  (length:u32 key)*                   -> OK (length:i32 value)*
+    #
+    # A PUT with a NaN ttl uses the cache's default. In a GET_MANY response a
+    # length of -1 marks a missing key.
+
+    @staticmethod
+    def encodeGet(key):
+        return HEADER.pack(len(key), GET) + key
+
+    @staticmethod
+    def encodePut(key, value, ttl=None):
+        header = PUT_HEADER.pack(len(key), math.nan if ttl is None else ttl)
+        return HEADER.pack(len(header) + len(key) + len(value), PUT) + header + key + value
+
+    @staticmethod
+    def encodeDelete(key):
+        return HEADER.pack(len(key), DELETE) + key
+
+    @staticmethod
+    def encodeGetMany(keys):
+        body = b"".join(LENGTH.pack(len(key)) + key for key in keys)
+        return HEADER.pack(len(body), GET_MANY) + body
+
+    @staticmethod
+    def encodeResponse(status, body=b""):
+        return HEADER.pack(len(body), status) + body
+
+    @staticmethod
+    def decodeFrames(buffer):
+        # Complete frames at the front of buffer as (code, body) pairs, and
+        # how many bytes they took. A trailing partial frame is left alone.
+        frames = []
+        offset = 0
+        end = len(buffer)
+        while end - offset >= HEADER.size:
+            length, code = HEADER.unpack_from(buffer, offset)
+            if length > MAX_BODY:
+                raise ValueError("frame body of "+str(length)+" bytes is over the limit")
+            start = offset + HEADER.size
+            if end - start < length:
+                break
+            frames.append((code, bytes(buffer[start:start + length])))
+            offset = start + length
+        return frames, offset
+
+    @staticmethod
+    def decodePut(body):
+        keyLength, ttl = PUT_HEADER.unpack_from(body, 0)
+        start = PUT_HEADER.size
+        key = body[start:start + keyLength]
+        value = body[start + keyLength:]
+        return key, value, None if math.isnan(ttl) else ttl
+
+    @staticmethod
+    def decodeKeys(body):
+        keys = []
+        offset = 0
+        while offset < len(body):
+            length, = LENGTH.unpack_from(body, offset)
+            offset += LENGTH.size
+            keys.append(body[offset:offset + length])
+            offset += length
+        return keys
+
+    @staticmethod
+    def encodeValues(values):
+        parts = []
+        for value in values:
+            if value is None:
+                parts.append(VALUE_LENGTH.pack(-1))
+            else:
+                parts.append(VALUE_LENGTH.pack(len(value)))
+                parts.append(value)
+        return b"".join(parts)
+
+    @staticmethod
+    def decodeValues(body):
+        values = []
+        offset = 0
+        while offset < len(body):
+            length, = VALUE_LENGTH.unpack_from(body, offset)
+            offset += VALUE_LENGTH.size
+            if length < 0:
+                values.append(None)
+                continue
+            values.append(body[offset:offset + length])
+            offset += length
+        return values
@@ -0,0 +1,92 @@
+import threading
+
+from Cache.src.Cache.events.CacheEventListener import CacheEventListener
+from Cache.src.Cache.stats.ThreadStats import ThreadStats
+
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+class CacheStats(CacheEventListener):
+    # Collects what an instrumented Cache reports. Each thread records into
+    # its own ThreadStats, so the hot path never takes a lock; snapshot()
+    # sums them up. Counters are exact; get and put latencies are timed for
+    # one call in every sampleEvery to keep the clock reads off most calls.
+
+    def __init__(self, evictionPolicy=None, sampleEvery=1):
+        self.evictionPolicy = evictionPolicy
+        self.sampleEvery = sampleEvery
+        self.local = threading.local()
+        self.threads = []
+        self.threadsLock = threading.Lock()
+
+    def forThread(self):
+        try:
+            return self.local.stats
+        except AttributeError:
+            stats = ThreadStats()
+            self.local.stats = stats
+            with self.threadsLock:
+                self.threads.append(stats)
+            return stats
+
+    def missed(self, key):
+        self.forThread().misses += 1
+
+    def evicted(self, key):
+        self.forThread().evictions += 1
+
+    def expired(self, key):
+        self.forThread().expirations += 1
+
+    def loaded(self, key, seconds, found):
+        stats = self.forThread()
+        stats.loads += 1
+        stats.loadNanos += int(seconds * 1e9)
+        if not found:
+            stats.loadMisses += 1
+
+    def snapshot(self):
+        # Totals across threads. Other threads keep recording while this
+        # runs, so the figures are consistent to within a few operations.
+        with self.threadsLock:
+            threads = list(self.threads)
+        totals = ThreadStats()
+        for stats in threads:
+            totals.gets += stats.gets
+            totals.misses += stats.misses
+            totals.puts += stats.puts
+            totals.evictions += stats.evictions
+            totals.expirations += stats.expirations
+            totals.loads += stats.loads
+            totals.loadMisses += stats.loadMisses
+            totals.loadNanos += stats.loadNanos
+            totals.getNanos.merge(stats.getNanos)
+            totals.putNanos.merge(stats.putNanos)
+        hits = max(totals.gets - totals.misses, 0)
+        return {
+            "gets": totals.gets,
+            "hits": hits,
+            "misses": totals.misses,
+            "hitRatio": hits / totals.gets if totals.gets else 0.0,
+            "puts": totals.puts,
+            "evictionPolicy": self.evictionPolicy,
+            "evictions": totals.evictions,
+            "expirations": totals.expirations,
+            "loads": totals.loads,
+            "loadMisses": totals.loadMisses,
+            "meanLoadMicros": totals.loadNanos / totals.loads / 1e3 if totals.loads else 0.0,
+            "getMicros": self.latencySummary(totals.getNanos),
+            "putMicros": self.latencySummary(totals.putNanos),
+        }
+
+    @staticmethod
+    def latencySummary(histogram):
+        summary = {"samples": histogram.count, "mean": histogram.mean() / 1e3, "max": histogram.maximum / 1e3}
+        for percent in PERCENTILES:
+            summary["p" + str(percent).replace(".", "")] = histogram.percentile(percent) / 1e3
+        return summary
+
+    def reset(self):
+        with self.threadsLock:
+            self.threads = []
+        self.local = threading.local()
@@ -0,0 +1,18 @@
+from Cache.src.Algorithms.HdrHistogram import HdrHistogram
+
+
+class ThreadStats:
+    # Counters and histograms written by one thread only, so recording needs
+    # no lock. CacheStats adds them up when a snapshot is taken.
+
+    def __init__(self):
+        self.gets = 0
+        self.misses = 0
+        self.puts = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.loads = 0
+        self.loadMisses = 0
+        self.loadNanos = 0
+        self.getNanos = HdrHistogram()
+        self.putNanos = HdrHistogram()
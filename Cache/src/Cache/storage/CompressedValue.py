@@ -0,0 +1,9 @@
+class CompressedValue:
+    # A value as CompressingStorage keeps it: the compressed bytes and the
+    # codec needed to get the original back.
+
+    __slots__ = ("codec", "data")
+
+    def __init__(self, codec, data):
+        self.codec = codec
+        self.data = data
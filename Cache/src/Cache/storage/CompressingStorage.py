@@ -0,0 +1,163 @@
+import lzma
+import time
+import zlib
+
+from Cache.src.Cache.storage.CompressedValue import CompressedValue
+from Cache.src.Cache.storage.Storage import Storage
+
+CODECS = {
+    "zlib": (lambda data, level: zlib.compress(data, 6 if level is None else level), zlib.decompress),
+    "lzma": (lambda data, level: lzma.compress(data, preset=1 if level is None else level), lzma.decompress),
+}
+
+
+class CompressingStorage(Storage):
+    # Wraps a storage of bytes values (see SerializingStorage) and compresses
+    # those of at least `threshold` bytes. A value is kept compressed only if
+    # that saves at least minSavings of its size; otherwise the raw bytes are
+    # stored and later reads pay nothing. Values are decompressed on get, one
+    # at a time, never while they sit in the cache.
+    #
+    # Give the inner storage storedSize as its weigher to budget memory by
+    # compressed size.
+    #
+    # Cache.store retries add with the same value after every eviction, so
+    # the encoding of a value the inner storage had no room for is kept and
+    # reused. Stats only count values the inner storage accepted.
+
+    def __init__(self, inner, codec="zlib", threshold=1024, level=None, minSavings=0.1):
+        self.inner = inner
+        self.codec = codec
+        self.compress, _ = CODECS[codec]
+        self.threshold = threshold
+        self.level = level
+        self.minSavings = minSavings
+        self.lastBatch = None
+        self.pending = None
+        self.bytesIn = 0
+        self.bytesStored = 0
+        self.valuesCompressed = 0
+        self.valuesSkipped = 0
+        self.compressNanos = 0
+        self.decompressions = 0
+        self.decompressNanos = 0
+
+    @staticmethod
+    def storedSize(key, value):
+        if isinstance(value, CompressedValue):
+            return len(value.data)
+        return len(value)
+
+    def encode(self, value):
+        # Returns the value to store and the nanoseconds spent compressing it.
+        size = len(value)
+        if size < self.threshold:
+            return value, 0
+        start = time.perf_counter_ns()
+        data = self.compress(value, self.level)
+        nanos = time.perf_counter_ns() - start
+        if len(data) > size * (1 - self.minSavings):
+            return value, nanos
+        return CompressedValue(self.codec, data), nanos
+
+    def countStored(self, value, encoded, nanos):
+        size = len(value)
+        self.bytesIn += size
+        if isinstance(encoded, CompressedValue):
+            self.valuesCompressed += 1
+            self.bytesStored += len(encoded.data)
+        else:
+            if size >= self.threshold:
+                self.valuesSkipped += 1
+            self.bytesStored += size
+        self.compressNanos += nanos
+
+    def decode(self, value):
+        if not isinstance(value, CompressedValue):
+            return value
+        start = time.perf_counter_ns()
+        data = CODECS[value.codec][1](value.data)
+        self.decompressNanos += time.perf_counter_ns() - start
+        self.decompressions += 1
+        return data
+
+    def add(self, key, value):
+        pending = self.pending
+        if pending is not None and pending[1] is value and pending[0] == key:
+            _, _, encoded, nanos = pending
+        else:
+            encoded, nanos = self.encode(value)
+            self.pending = (key, value, encoded, nanos)
+        self.inner.add(key, encoded)
+        self.pending = None
+        self.countStored(value, encoded, nanos)
+
+    def abandonAdd(self, key):
+        self.pending = None
+        self.inner.abandonAdd(key)
+
+    def remove(self, key):
+        self.inner.remove(key)
+
+    def get(self, key):
+        return self.decode(self.inner.get(key))
+
+    def containsKey(self, key):
+        return self.inner.containsKey(key)
+
+    def size(self):
+        return self.inner.size()
+
+    def remainingCapacity(self):
+        return self.inner.remainingCapacity()
+
+    def recoveredKey(self):
+        return self.inner.recoveredKey()
+
+    def currentWeight(self):
+        return self.inner.currentWeight()
+
+    def keys(self):
+        return self.inner.keys()
+
+    def shortfall(self, items):
+        return self.inner.shortfall(self.encodeMany(items)[0])
+
+    def missingKeys(self, keys):
+        return self.inner.missingKeys(keys)
+
+    def getMany(self, keys):
+        hits, misses = self.inner.getMany(keys)
+        return {key: self.decode(value) for key, value in hits.items()}, misses
+
+    def addMany(self, items):
+        encoded, nanos = self.encodeMany(items)
+        self.lastBatch = None
+        self.inner.addMany(encoded)
+        for key, value in items.items():
+            self.countStored(value, encoded[key], nanos[key])
+
+    def removeMany(self, keys):
+        return self.inner.removeMany(keys)
+
+    def encodeMany(self, items):
+        # Same reuse of the last batch as SerializingStorage.encodeMany.
+        if self.lastBatch is not None and self.lastBatch[0] is items:
+            return self.lastBatch[1]
+        encoded = dict()
+        nanos = dict()
+        for key, value in items.items():
+            encoded[key], nanos[key] = self.encode(value)
+        self.lastBatch = (items, (encoded, nanos))
+        return encoded, nanos
+
+    def compressionStats(self):
+        return {
+            "codec": self.codec,
+            "ratio": self.bytesIn / self.bytesStored if self.bytesStored else 1.0,
+            "valuesCompressed": self.valuesCompressed,
+            "valuesSkipped": self.valuesSkipped,
+            "meanCompressMicros": self.compressNanos / (self.valuesCompressed + self.valuesSkipped) / 1e3
+            if self.valuesCompressed + self.valuesSkipped else 0.0,
+            "meanDecompressMicros": self.decompressNanos / self.decompressions / 1e3 if self.decompressions else 0.0,
+        }
@@ -1,28 +1,133 @@
+import math
+
 from Cache.src.Cache.storage.Storage import Storage
+from Cache.src.Cache.Exceptions.EntryTooLargeException import EntryTooLargeException
 from Cache.src.Cache.Exceptions.NotFoundException import NotFoundException
-from collections import defaultdict
+from Cache.src.Cache.Exceptions.StorageFullException import StorageFullException
 
 class HashMapBasedStorage(Storage):
+    # Bounded by entry count (capacity), by total weight (maxWeight, measured
+    # with weigher(key, value)), or both. Either bound may be None.
 
-    def __init__(self,capacity):
-        self.storage = []
+    def __init__(self,capacity, weigher=None, maxWeight=None):
+        if maxWeight is not None and weigher is None:
+            raise ValueError("maxWeight needs a weigher")
+        self.storage = dict()
         self.capacity = capacity
+        self.weigher = weigher
+        self.maxWeight = maxWeight
+        self.weights = dict()
+        self.totalWeight = 0
 
     def add(self,key, value):
-        if self.isStorageFull():
-            raise NotFoundException(key+" doesn't exist in the cache.")
+        if self.weigher is None:
+            if key not in self.storage and self.isStorageFull():
+                raise StorageFullException("Capacity full.....")
+            self.storage[key]=value
+            return
+        weight = self.weigh(key, value)
+        if key not in self.storage and self.isStorageFull():
+            raise StorageFullException("Capacity full.....")
+        growth = weight - self.weights.get(key, 0)
+        if self.maxWeight is not None and self.totalWeight + growth > self.maxWeight:
+            raise StorageFullException("Weight budget full.....")
         self.storage[key]=value
+        self.weights[key] = weight
+        self.totalWeight += growth
 
     def remove(self, key):
-        if not self.storage[key]:
-            raise NotFoundException(key+"doesn't exixt in the cache")
-        self.storage.remove(key)
+        if key not in self.storage:
+            raise NotFoundException(str(key)+" doesn't exist in the cache")
+        del self.storage[key]
+        if self.weigher is not None:
+            self.totalWeight -= self.weights.pop(key)
 
     def get(self, key):
-        if not self.storage[key]:
-            raise NotFoundException(key+"doesn't exixt in the cache")
-        return self.storage[key]
+        try:
+            return self.storage[key]
+        except KeyError:
+            raise NotFoundException(str(key)+" doesn't exist in the cache")
+
+    def containsKey(self, key):
+        return key in self.storage
+
+    def size(self):
+        return len(self.storage)
+
+    def currentWeight(self):
+        if self.weigher is None:
+            return len(self.storage)
+        return self.totalWeight
+
+    def keys(self):
+        return list(self.storage)
+
+    def remainingCapacity(self):
+        if self.capacity is None:
+            return math.inf
+        return max(self.capacity - len(self.storage), 0)
+
+    def weigh(self, key, value):
+        weight = self.weigher(key, value)
+        if self.maxWeight is not None and weight > self.maxWeight:
+            raise EntryTooLargeException(str(key)+" weighs "+str(weight)+", more than the whole budget of "+str(self.maxWeight))
+        return weight
+
+    def shortfall(self, items):
+        missing = len(self.missingKeys(items))
+        countShortfall = missing - self.remainingCapacity()
+        if countShortfall > 0 or self.maxWeight is None:
+            return max(countShortfall, 0)
+        growth = 0
+        for key, value in items.items():
+            growth += self.weigh(key, value) - self.weights.get(key, 0)
+        excess = self.totalWeight + growth - self.maxWeight
+        if excess <= 0:
+            return 0
+        # Guess how many average-sized entries have to go; the caller asks
+        # again until nothing is missing.
+        averageWeight = self.totalWeight / len(self.storage) if self.storage else excess
+        return max(math.ceil(excess / averageWeight), 1)
+
+    def missingKeys(self, keys):
+        storage = self.storage
+        return [key for key in keys if key not in storage]
+
+    def getMany(self, keys):
+        storage = self.storage
+        hits = dict()
+        misses = []
+        for key in keys:
+            if key in storage:
+                hits[key] = storage[key]
+            else:
+                misses.append(key)
+        return hits, misses
+
+    def addMany(self, items):
+        if self.shortfall(items) > 0:
+            raise StorageFullException("Capacity full.....")
+        if self.weigher is None:
+            self.storage.update(items)
+            return
+        # The batch as a whole fits, so apply it without per-entry checks.
+        for key, value in items.items():
+            weight = self.weigh(key, value)
+            self.totalWeight += weight - self.weights.get(key, 0)
+            self.weights[key] = weight
+            self.storage[key] = value
+
+    def removeMany(self, keys):
+        storage = self.storage
+        removed = []
+        for key in keys:
+            if key in storage:
+                del storage[key]
+                removed.append(key)
+                if self.weigher is not None:
+                    self.totalWeight -= self.weights.pop(key)
+        return removed
 
     def isStorageFull(self):
-        return len(self.storage) == self.capacity
+        return self.capacity is not None and len(self.storage) >= self.capacity
 
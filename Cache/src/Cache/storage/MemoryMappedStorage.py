@@ -0,0 +1,380 @@
+import hashlib
+import mmap
+import os
+import pickle
+import struct
+import threading
+
+from Cache.src.Cache.storage.Storage import Storage
+from Cache.src.Cache.Exceptions.EntryTooLargeException import EntryTooLargeException
+from Cache.src.Cache.Exceptions.NotFoundException import NotFoundException
+from Cache.src.Cache.Exceptions.StorageFullException import StorageFullException
+
+MAGIC = b"LLDCACH1"
+HEADER = struct.Struct("<8sQQQQQQQ")
+HEADER_SIZE = 64
+SLOT = struct.Struct("<BxxxIQQ")
+RECORD = struct.Struct("<IIB")
+
+EMPTY = 0
+USED = 1
+DELETED = 2
+
+BYTES_VALUE = 0
+PICKLED_VALUE = 1
+
+
+class MemoryMappedStorage(Storage):
+    # Entries live in one memory-mapped file laid out as
+    #
+    #   header | open-addressing index (slotCount slots) | append-only records
+    #
+    # A slot holds the key hash and the offset/length of the key's latest
+    # record. Updates and removals only append or drop slots, leaving dead
+    # record bytes behind; once more than compactRatio of the record area is
+    # dead a background thread rewrites the live records into a fresh file.
+    # The copy runs outside the lock; only the final index rebuild and file
+    # swap block readers and writers.
+    #
+    # Removed slots become tombstones that lookups have to probe past. Once
+    # more than tombstoneRatio of the slots are tombstones the index alone is
+    # rehashed in place, so misses never degrade into a scan of every slot.
+    #
+    # Reopening an existing file maps it as is: nothing is deserialised up
+    # front. Entries that have not been touched since the file was opened are
+    # handed out by recoveredKey() so the cache can evict them before keys its
+    # policy already knows about.
+
+    def __init__(self, path, capacity=None, dataSize=64 * 1024 * 1024, compactRatio=0.5, tombstoneRatio=0.25):
+        self.path = path
+        self.compactRatio = compactRatio
+        self.tombstoneRatio = tombstoneRatio
+        self.lock = threading.RLock()
+        self.compactor = None
+        # Bumped whenever the file is swapped, so a background copy taken
+        # from an older file is thrown away instead of swapped in.
+        self.generation = 0
+        if os.path.exists(path) and os.path.getsize(path) >= HEADER_SIZE:
+            self.open()
+        else:
+            if capacity is None:
+                raise ValueError("capacity is needed to create a new storage file")
+            self.create(path, capacity, dataSize)
+            self.open()
+        self.touched = bytearray(self.slotCount)
+        self.recoveryCursor = 0
+
+    @staticmethod
+    def create(path, capacity, dataSize):
+        slotCount = 1 << max(2 * capacity - 1, 1).bit_length()
+        dataStart = HEADER_SIZE + slotCount * SLOT.size
+        with open(path, "wb") as file:
+            file.truncate(dataStart + dataSize)
+            file.write(HEADER.pack(MAGIC, slotCount, capacity, dataSize, 0, 0, 0, 0))
+
+    def open(self):
+        self.file = open(self.path, "r+b")
+        self.map = mmap.mmap(self.file.fileno(), 0)
+        magic, slotCount, capacity, dataSize, dataEnd, liveBytes, entryCount, tombstones = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC:
+            raise ValueError(self.path + " is not a cache storage file")
+        self.slotCount = slotCount
+        self.capacity = capacity
+        self.dataSize = dataSize
+        self.dataEnd = dataEnd
+        self.liveBytes = liveBytes
+        self.entryCount = entryCount
+        self.tombstones = tombstones
+        self.dataStart = HEADER_SIZE + slotCount * SLOT.size
+
+    def writeHeader(self):
+        HEADER.pack_into(self.map, 0, MAGIC, self.slotCount, self.capacity, self.dataSize,
+                         self.dataEnd, self.liveBytes, self.entryCount, self.tombstones)
+
+    def add(self, key, value):
+        keyBytes = self.encodeKey(key)
+        valueType, valueBytes = self.encodeValue(value)
+        recordLength = RECORD.size + len(keyBytes) + len(valueBytes)
+        if recordLength > self.dataSize:
+            raise EntryTooLargeException(str(key)+" needs "+str(recordLength)+" bytes, more than the whole data area")
+        with self.lock:
+            keyHash = self.hashKey(keyBytes)
+            slot, found = self.findSlot(keyHash, keyBytes)
+            if not found and self.entryCount >= self.capacity:
+                raise StorageFullException("Capacity full.....")
+            if self.dataEnd + recordLength > self.dataSize:
+                oldLength = self.slotAt(slot)[1] if found else 0
+                if self.liveBytes - oldLength + recordLength > self.dataSize:
+                    raise StorageFullException("Data area full.....")
+                self.compact()
+                slot, found = self.findSlot(keyHash, keyBytes)
+            offset = self.dataEnd
+            start = self.dataStart + offset
+            RECORD.pack_into(self.map, start, len(keyBytes), len(valueBytes), valueType)
+            start += RECORD.size
+            self.map[start:start + len(keyBytes)] = keyBytes
+            start += len(keyBytes)
+            self.map[start:start + len(valueBytes)] = valueBytes
+            self.dataEnd += recordLength
+            if found:
+                self.liveBytes -= self.slotAt(slot)[1]
+            else:
+                if self.slotAt(slot)[0] == DELETED:
+                    self.tombstones -= 1
+                self.entryCount += 1
+            self.liveBytes += recordLength
+            SLOT.pack_into(self.map, self.slotOffset(slot), USED, recordLength, keyHash, offset)
+            self.touched[slot] = 1
+            self.writeHeader()
+            if found:
+                # The replaced record is dead now; the synchronous compact()
+                # above is only for when the data area is really full.
+                self.maybeCompactInBackground()
+
+    def remove(self, key):
+        keyBytes = self.encodeKey(key)
+        with self.lock:
+            slot, found = self.findSlot(self.hashKey(keyBytes), keyBytes)
+            if not found:
+                raise NotFoundException(str(key)+" doesn't exist in the cache")
+            self.liveBytes -= self.slotAt(slot)[1]
+            self.entryCount -= 1
+            SLOT.pack_into(self.map, self.slotOffset(slot), DELETED, 0, 0, 0)
+            self.tombstones += 1
+            if self.tombstones > self.slotCount * self.tombstoneRatio:
+                self.rebuildIndex()
+            self.writeHeader()
+            self.maybeCompactInBackground()
+
+    def get(self, key):
+        keyBytes = self.encodeKey(key)
+        with self.lock:
+            slot, found = self.findSlot(self.hashKey(keyBytes), keyBytes)
+            if not found:
+                raise NotFoundException(str(key)+" doesn't exist in the cache")
+            self.touched[slot] = 1
+            return self.readValue(self.slotAt(slot)[3])
+
+    def containsKey(self, key):
+        keyBytes = self.encodeKey(key)
+        with self.lock:
+            return self.findSlot(self.hashKey(keyBytes), keyBytes)[1]
+
+    def size(self):
+        return self.entryCount
+
+    def currentWeight(self):
+        return self.liveBytes
+
+    def remainingCapacity(self):
+        return max(self.capacity - self.entryCount, 0)
+
+    def recoveredKey(self):
+        # Next entry that was already in the file when it was opened and has
+        # not been read or written since, or None once all have been seen.
+        with self.lock:
+            while self.recoveryCursor < self.slotCount:
+                slot = self.recoveryCursor
+                self.recoveryCursor += 1
+                state, _, _, offset = self.slotAt(slot)
+                if state == USED and not self.touched[slot]:
+                    self.touched[slot] = 1
+                    return self.readKey(offset)
+            return None
+
+    def keys(self):
+        with self.lock:
+            keys = []
+            for slot in range(self.slotCount):
+                state, _, _, offset = self.slotAt(slot)
+                if state == USED:
+                    keys.append(self.readKey(offset))
+            return keys
+
+    def close(self):
+        with self.lock:
+            compactor = self.compactor
+        if compactor is not None:
+            compactor.join()
+        with self.lock:
+            self.map.flush()
+            try:
+                self.map.close()
+            except BufferError:
+                # Callers still hold memoryviews into the map; it is released
+                # together with the last of them.
+                pass
+            self.file.close()
+
+    def slotOffset(self, slot):
+        return HEADER_SIZE + slot * SLOT.size
+
+    def slotAt(self, slot):
+        return SLOT.unpack_from(self.map, HEADER_SIZE + slot * SLOT.size)
+
+    def findSlot(self, keyHash, keyBytes):
+        # Linear probing. Returns (slot, True) for the key's slot, otherwise
+        # (slot, False) for the first free or deleted slot it could take.
+        mask = self.slotCount - 1
+        slot = keyHash & mask
+        firstFree = None
+        for _ in range(self.slotCount):
+            state, _, slotHash, offset = self.slotAt(slot)
+            if state == EMPTY:
+                return (slot if firstFree is None else firstFree), False
+            if state == DELETED:
+                if firstFree is None:
+                    firstFree = slot
+            elif slotHash == keyHash and self.readKeyBytes(offset) == keyBytes:
+                return slot, True
+            slot = (slot + 1) & mask
+        if firstFree is None:
+            raise StorageFullException("Index full.....")
+        return firstFree, False
+
+    def readKeyBytes(self, offset):
+        start = self.dataStart + offset
+        keyLength, _, _ = RECORD.unpack_from(self.map, start)
+        start += RECORD.size
+        return self.map[start:start + keyLength]
+
+    def readKey(self, offset):
+        return pickle.loads(self.readKeyBytes(offset))
+
+    def readValue(self, offset):
+        start = self.dataStart + offset
+        keyLength, valueLength, valueType = RECORD.unpack_from(self.map, start)
+        start += RECORD.size + keyLength
+        if valueType == BYTES_VALUE:
+            return memoryview(self.map)[start:start + valueLength]
+        return pickle.loads(self.map[start:start + valueLength])
+
+    @staticmethod
+    def encodeKey(key):
+        return pickle.dumps(key, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def encodeValue(value):
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return BYTES_VALUE, bytes(value)
+        return PICKLED_VALUE, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def hashKey(keyBytes):
+        return int.from_bytes(hashlib.blake2b(keyBytes, digest_size=8).digest(), "little")
+
+    def rebuildIndex(self):
+        # Rehashes the live slots into a clean index, dropping every tombstone.
+        # Records are not touched. Slots move, so the recovery scan restarts
+        # with everything it had already passed marked as seen.
+        mask = self.slotCount - 1
+        index = bytearray(self.slotCount * SLOT.size)
+        touched = bytearray(self.slotCount)
+        for slot in range(self.slotCount):
+            state, recordLength, keyHash, offset = self.slotAt(slot)
+            if state != USED:
+                continue
+            newSlot = keyHash & mask
+            while index[newSlot * SLOT.size] == USED:
+                newSlot = (newSlot + 1) & mask
+            SLOT.pack_into(index, newSlot * SLOT.size, USED, recordLength, keyHash, offset)
+            touched[newSlot] = self.touched[slot] if slot >= self.recoveryCursor else 1
+        self.map[HEADER_SIZE:self.dataStart] = index
+        self.tombstones = 0
+        self.touched = touched
+        self.recoveryCursor = 0
+
+    def maybeCompactInBackground(self):
+        if self.compactor is not None or self.dataEnd == 0:
+            return
+        if (self.dataEnd - self.liveBytes) / self.dataSize < self.compactRatio:
+            return
+        self.compactor = threading.Thread(target=self.compactInBackground, name="cache-mmap-compactor", daemon=True)
+        self.compactor.start()
+
+    def compactInBackground(self):
+        # Bulk copy without the lock; gets and puts carry on meanwhile.
+        try:
+            with self.lock:
+                snapshot = self.liveRecords()
+            copy = self.copyRecords(self.path + ".compact-background", *snapshot)
+            with self.lock:
+                self.swapIn(*copy)
+        finally:
+            with self.lock:
+                self.compactor = None
+
+    def compact(self):
+        # Copies live records into a new file with a clean index and swaps it
+        # in. The old map is only dropped, never closed, so memoryviews handed
+        # out by get() stay valid.
+        with self.lock:
+            self.swapIn(*self.copyRecords(self.path + ".compact", *self.liveRecords()))
+
+    def liveRecords(self):
+        # Called under the lock. Records below dataEnd are never written
+        # again, so they can be copied from this map without holding it.
+        records = []
+        for slot in range(self.slotCount):
+            state, recordLength, _, offset = self.slotAt(slot)
+            if state == USED:
+                records.append((offset, recordLength))
+        return self.generation, self.map, records
+
+    def copyRecords(self, temporaryPath, generation, source, records):
+        self.create(temporaryPath, self.capacity, self.dataSize)
+        file = open(temporaryPath, "r+b")
+        target = mmap.mmap(file.fileno(), 0)
+        moved = dict()
+        dataEnd = 0
+        for offset, recordLength in records:
+            start = self.dataStart + offset
+            destination = self.dataStart + dataEnd
+            target[destination:destination + recordLength] = source[start:start + recordLength]
+            moved[offset] = dataEnd
+            dataEnd += recordLength
+        return generation, temporaryPath, file, target, moved, dataEnd
+
+    def swapIn(self, generation, temporaryPath, file, target, moved, dataEnd):
+        # Called under the lock. The index is rebuilt from the current slots:
+        # records copied earlier are reused, and records written since the
+        # copy started (or replaced ones) are copied now.
+        if generation != self.generation:
+            # A synchronous compaction swapped the file while this copy ran
+            target.close()
+            file.close()
+            os.remove(temporaryPath)
+            return
+        try:
+            mask = self.slotCount - 1
+            liveBytes = 0
+            touched = bytearray(self.slotCount)
+            for slot in range(self.slotCount):
+                state, recordLength, keyHash, offset = self.slotAt(slot)
+                if state != USED:
+                    continue
+                newOffset = moved.get(offset)
+                if newOffset is None:
+                    source = self.dataStart + offset
+                    destination = self.dataStart + dataEnd
+                    target[destination:destination + recordLength] = self.map[source:source + recordLength]
+                    newOffset = dataEnd
+                    dataEnd += recordLength
+                newSlot = keyHash & mask
+                while target[HEADER_SIZE + newSlot * SLOT.size] == USED:
+                    newSlot = (newSlot + 1) & mask
+                SLOT.pack_into(target, HEADER_SIZE + newSlot * SLOT.size, USED, recordLength, keyHash, newOffset)
+                touched[newSlot] = self.touched[slot] if slot >= self.recoveryCursor else 1
+                liveBytes += recordLength
+            HEADER.pack_into(target, 0, MAGIC, self.slotCount, self.capacity, self.dataSize,
+                             dataEnd, liveBytes, self.entryCount, 0)
+            target.flush()
+            os.replace(temporaryPath, self.path)
+        finally:
+            target.close()
+            file.close()
+        self.file.close()
+        self.open()
+        self.touched = touched
+        self.recoveryCursor = 0
+        self.generation += 1
@@ -0,0 +1,92 @@
+import json
+import pickle
+
+from Cache.src.Cache.storage.Storage import Storage
+
+SERIALIZERS = {
+    "pickle": (lambda value: pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads),
+    "json": (lambda value: json.dumps(value, separators=(",", ":")).encode(), json.loads),
+}
+
+
+class SerializingStorage(Storage):
+    # Wraps another storage and keeps values in it as bytes, turned back into
+    # objects only when they are read. Together with CompressingStorage and a
+    # weigher counting bytes, the weight of an entry is what it really takes.
+    #
+    # Cache.store retries add with the same value after every eviction, so
+    # the bytes of a value the inner storage had no room for are kept and
+    # handed over again instead of serialising it once per retry.
+
+    def __init__(self, inner, serializer="pickle"):
+        self.inner = inner
+        self.dumps, self.loads = SERIALIZERS[serializer]
+        self.lastBatch = None
+        self.pending = None
+
+    def add(self, key, value):
+        pending = self.pending
+        if pending is not None and pending[1] is value and pending[0] == key:
+            encoded = pending[2]
+        else:
+            encoded = self.dumps(value)
+            self.pending = (key, value, encoded)
+        self.inner.add(key, encoded)
+        self.pending = None
+
+    def abandonAdd(self, key):
+        self.pending = None
+        self.inner.abandonAdd(key)
+
+    def remove(self, key):
+        self.inner.remove(key)
+
+    def get(self, key):
+        return self.loads(self.inner.get(key))
+
+    def containsKey(self, key):
+        return self.inner.containsKey(key)
+
+    def size(self):
+        return self.inner.size()
+
+    def remainingCapacity(self):
+        return self.inner.remainingCapacity()
+
+    def recoveredKey(self):
+        return self.inner.recoveredKey()
+
+    def currentWeight(self):
+        return self.inner.currentWeight()
+
+    def keys(self):
+        return self.inner.keys()
+
+    def shortfall(self, items):
+        return self.inner.shortfall(self.encodeMany(items))
+
+    def missingKeys(self, keys):
+        return self.inner.missingKeys(keys)
+
+    def getMany(self, keys):
+        hits, misses = self.inner.getMany(keys)
+        loads = self.loads
+        return {key: loads(value) for key, value in hits.items()}, misses
+
+    def addMany(self, items):
+        encoded = self.encodeMany(items)
+        self.lastBatch = None
+        self.inner.addMany(encoded)
+
+    def removeMany(self, keys):
+        return self.inner.removeMany(keys)
+
+    def encodeMany(self, items):
+        # Cache.storeMany asks for the shortfall and then adds the same batch,
+        # so the last encoding is kept and reused for it.
+        if self.lastBatch is not None and self.lastBatch[0] is items:
+            return self.lastBatch[1]
+        dumps = self.dumps
+        encoded = {key: dumps(value) for key, value in items.items()}
+        self.lastBatch = (items, encoded)
+        return encoded
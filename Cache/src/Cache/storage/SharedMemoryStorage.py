@@ -0,0 +1,303 @@
+import hashlib
+import math
+import multiprocessing
+import pickle
+import struct
+import time
+from multiprocessing import shared_memory
+
+from Cache.src.Cache.storage.Storage import Storage
+from Cache.src.Cache.Exceptions.EntryTooLargeException import EntryTooLargeException
+from Cache.src.Cache.Exceptions.NotFoundException import NotFoundException
+from Cache.src.Cache.Exceptions.StorageFullException import StorageFullException
+
+MAGIC = b"LLDSHM01"
+HEADER = struct.Struct("<8sQQQQQQ")
+HEADER_SIZE = 64
+ENTRY_COUNT_OFFSET = 40
+CLOCK_HAND_OFFSET = 48
+COUNTER = struct.Struct("<Q")
+SLOT = struct.Struct("<BxHI")
+
+BYTES_VALUE = 0
+PICKLED_VALUE = 1
+
+
+class SharedMemoryStorage(Storage):
+    # One table in a multiprocessing.shared_memory block, shared by every
+    # process that inherits (or unpickles) this object:
+    #
+    #   header | per-bucket sequence numbers | reference bytes | tags | slots
+    #
+    # The table is set associative: a key hashes to one bucket of `ways`
+    # fixed-size slots and the key and value are stored inline in the slot.
+    # A slot's tag is the key's 64-bit hash (never 0) or 0 while the slot is
+    # free, so a lookup scans the bucket's tags in one go.
+    # Writers take the lock striped over the bucket and bump its sequence
+    # number to odd while they modify it and back to even afterwards. Readers
+    # take no lock: they copy the slot out and retry if the sequence number
+    # was odd or changed underneath them (a seqlock).
+    #
+    # The reference bytes are the CLOCK bits for SharedClockEvictionPolicy.
+    # A hit sets the byte of its slot; the sweep in clockVictims() clears
+    # them. They are whole bytes rather than packed bits so that processes
+    # setting bits of neighbouring slots never overwrite each other.
+
+    def __init__(self, capacity, slotSize=256, ways=8, lockStripes=64, name=None, context=None):
+        if context is None:
+            context = multiprocessing.get_context()
+        bucketCount = max(math.ceil(capacity * 1.5 / ways), 1)
+        self.bucketCount = bucketCount
+        self.ways = ways
+        self.slotSize = slotSize
+        self.capacity = capacity
+        self.slotCount = bucketCount * ways
+        self.stride = SLOT.size + slotSize
+        self.seqStart = HEADER_SIZE
+        self.referencedStart = self.seqStart + 4 * bucketCount
+        self.tagsStart = self.referencedStart + self.slotCount
+        self.tagsStart += -self.tagsStart % 8
+        self.slotsStart = self.tagsStart + 8 * self.slotCount
+        self.shm = shared_memory.SharedMemory(name=name, create=True,
+                                              size=self.slotsStart + self.slotCount * self.stride)
+        HEADER.pack_into(self.shm.buf, 0, MAGIC, bucketCount, ways, slotSize, capacity, 0, 0)
+        self.locks = [context.Lock() for _ in range(min(lockStripes, bucketCount))]
+        self.headerLock = context.Lock()
+        self.attach()
+
+    def attach(self):
+        buf = self.shm.buf
+        self.buf = buf
+        self.seqs = buf[self.seqStart:self.referencedStart].cast("I")
+        self.referenced = buf[self.referencedStart:self.referencedStart + self.slotCount]
+        self.tags = buf[self.tagsStart:self.slotsStart].cast("Q")
+        # Bucket whose last add failed for lack of a free way; the next sweep
+        # takes its victim from there. Local to each process.
+        self.fullBucket = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for view in ("buf", "seqs", "referenced", "tags", "fullBucket"):
+            del state[view]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.attach()
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def add(self, key, value):
+        keyBytes = self.encodeKey(key)
+        valueType, valueBytes = self.encodeValue(value)
+        if len(keyBytes) + len(valueBytes) > self.slotSize:
+            raise EntryTooLargeException(str(key)+" needs "+str(len(keyBytes) + len(valueBytes))+" bytes, more than a slot holds")
+        keyHash = self.hashKey(keyBytes)
+        bucket = (keyHash >> 1) % self.bucketCount
+        with self.locks[bucket % len(self.locks)]:
+            slot, freeSlot = self.findInBucket(bucket, keyHash, keyBytes)
+            if slot is None:
+                if freeSlot is None:
+                    self.fullBucket = bucket
+                    raise StorageFullException("Bucket full.....")
+                with self.headerLock:
+                    entryCount = COUNTER.unpack_from(self.buf, ENTRY_COUNT_OFFSET)[0]
+                    if entryCount >= self.capacity:
+                        raise StorageFullException("Capacity full.....")
+                    COUNTER.pack_into(self.buf, ENTRY_COUNT_OFFSET, entryCount + 1)
+                slot = freeSlot
+                # A new entry has to be hit once before it gets a second chance.
+                referenced = 0
+            else:
+                referenced = 1
+            seqs = self.seqs
+            seqs[bucket] = (seqs[bucket] + 1) & 0xFFFFFFFF
+            start = self.slotsStart + slot * self.stride
+            payload = start + SLOT.size
+            self.buf[payload:payload + len(keyBytes)] = keyBytes
+            payload += len(keyBytes)
+            self.buf[payload:payload + len(valueBytes)] = valueBytes
+            SLOT.pack_into(self.buf, start, valueType, len(keyBytes), len(valueBytes))
+            self.tags[slot] = keyHash
+            seqs[bucket] = (seqs[bucket] + 1) & 0xFFFFFFFF
+            self.referenced[slot] = referenced
+
+    def remove(self, key):
+        keyBytes = self.encodeKey(key)
+        keyHash = self.hashKey(keyBytes)
+        bucket = (keyHash >> 1) % self.bucketCount
+        with self.locks[bucket % len(self.locks)]:
+            slot, _ = self.findInBucket(bucket, keyHash, keyBytes)
+            if slot is None:
+                raise NotFoundException(str(key)+" doesn't exist in the cache")
+            seqs = self.seqs
+            seqs[bucket] = (seqs[bucket] + 1) & 0xFFFFFFFF
+            self.tags[slot] = 0
+            seqs[bucket] = (seqs[bucket] + 1) & 0xFFFFFFFF
+            self.referenced[slot] = 0
+            with self.headerLock:
+                entryCount = COUNTER.unpack_from(self.buf, ENTRY_COUNT_OFFSET)[0]
+                COUNTER.pack_into(self.buf, ENTRY_COUNT_OFFSET, entryCount - 1)
+
+    def get(self, key):
+        keyBytes = self.encodeKey(key)
+        keyHash = self.hashKey(keyBytes)
+        bucket = (keyHash >> 1) % self.bucketCount
+        seqs = self.seqs
+        while True:
+            before = seqs[bucket]
+            if before & 1:
+                time.sleep(0)
+                continue
+            slot, _ = self.findInBucket(bucket, keyHash, keyBytes)
+            if slot is not None:
+                start = self.slotsStart + slot * self.stride
+                valueType, keyLength, valueLength = SLOT.unpack_from(self.buf, start)
+                payload = start + SLOT.size + keyLength
+                valueBytes = bytes(self.buf[payload:payload + valueLength])
+            if seqs[bucket] == before:
+                break
+        if slot is None:
+            raise NotFoundException(str(key)+" doesn't exist in the cache")
+        self.referenced[slot] = 1
+        if valueType == BYTES_VALUE:
+            return valueBytes
+        return pickle.loads(valueBytes)
+
+    def containsKey(self, key):
+        keyBytes = self.encodeKey(key)
+        keyHash = self.hashKey(keyBytes)
+        bucket = (keyHash >> 1) % self.bucketCount
+        seqs = self.seqs
+        while True:
+            before = seqs[bucket]
+            if before & 1:
+                time.sleep(0)
+                continue
+            slot, _ = self.findInBucket(bucket, keyHash, keyBytes)
+            if seqs[bucket] == before:
+                return slot is not None
+
+    def size(self):
+        return COUNTER.unpack_from(self.buf, ENTRY_COUNT_OFFSET)[0]
+
+    def remainingCapacity(self):
+        return max(self.capacity - self.size(), 0)
+
+    def keys(self):
+        # Occupied slots at the time each bucket is read; other processes may
+        # add or remove entries while the scan is running.
+        keys = []
+        tags = self.tags
+        for slot in range(self.slotCount):
+            if tags[slot]:
+                key = self.readKey(slot // self.ways, slot)
+                if key is not None:
+                    keys.append(key)
+        return keys
+
+    def findInBucket(self, bucket, keyHash, keyBytes):
+        # Returns (slot, None) for the key's slot, otherwise (None, slot) for
+        # the first free way of the bucket or (None, None) if it is full.
+        first = bucket * self.ways
+        tags = self.tags[first:first + self.ways].tolist()
+        way = -1
+        while keyHash in tags[way + 1:]:
+            way = tags.index(keyHash, way + 1)
+            start = self.slotsStart + (first + way) * self.stride
+            keyLength = SLOT.unpack_from(self.buf, start)[1]
+            if keyLength == len(keyBytes) and self.buf[start + SLOT.size:start + SLOT.size + keyLength] == keyBytes:
+                return first + way, None
+        if 0 in tags:
+            return None, first + tags.index(0)
+        return None, None
+
+    def clockVictims(self, count):
+        # CLOCK over the whole table. The hand lives in the header and each
+        # process claims one bucket of it at a time, so sweeps from several
+        # processes interleave instead of revisiting the same slots. A victim
+        # is only nominated; the caller removes it and may find another
+        # process got there first.
+        victims = []
+        if self.fullBucket is not None:
+            bucket = self.fullBucket
+            self.fullBucket = None
+            victim = self.bucketVictim(bucket)
+            if victim is not None:
+                victims.append(victim)
+        referenced = self.referenced
+        for _ in range(2 * self.bucketCount):
+            if len(victims) >= count:
+                break
+            with self.headerLock:
+                hand = COUNTER.unpack_from(self.buf, CLOCK_HAND_OFFSET)[0]
+                COUNTER.pack_into(self.buf, CLOCK_HAND_OFFSET, (hand + 1) % self.bucketCount)
+            for slot in range(hand * self.ways, (hand + 1) * self.ways):
+                if referenced[slot]:
+                    referenced[slot] = 0
+                    continue
+                key = self.readKey(hand, slot)
+                if key is not None:
+                    victims.append(key)
+                    if len(victims) >= count:
+                        break
+        return victims
+
+    def bucketVictim(self, bucket):
+        # Second chance among the ways of one bucket.
+        referenced = self.referenced
+        first = bucket * self.ways
+        for _ in range(2):
+            for slot in range(first, first + self.ways):
+                if referenced[slot]:
+                    referenced[slot] = 0
+                    continue
+                key = self.readKey(bucket, slot)
+                if key is not None:
+                    return key
+        return None
+
+    def readKey(self, bucket, slot):
+        seqs = self.seqs
+        start = self.slotsStart + slot * self.stride
+        while True:
+            before = seqs[bucket]
+            if before & 1:
+                time.sleep(0)
+                continue
+            tag = self.tags[slot]
+            _, keyLength, _ = SLOT.unpack_from(self.buf, start)
+            keyBytes = bytes(self.buf[start + SLOT.size:start + SLOT.size + keyLength])
+            if seqs[bucket] == before:
+                break
+        if tag == 0:
+            return None
+        return pickle.loads(keyBytes)
+
+    def close(self):
+        self.seqs.release()
+        self.referenced.release()
+        self.tags.release()
+        self.buf = None
+        self.shm.close()
+
+    def unlink(self):
+        # Only the process that created the storage should call this, once
+        # every worker is done with it.
+        self.shm.unlink()
+
+    @staticmethod
+    def encodeKey(key):
+        return pickle.dumps(key, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def encodeValue(value):
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return BYTES_VALUE, bytes(value)
+        return PICKLED_VALUE, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def hashKey(keyBytes):
+        return int.from_bytes(hashlib.blake2b(keyBytes, digest_size=8).digest(), "little") | 1
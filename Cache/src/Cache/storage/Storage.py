@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+from Cache.src.Cache.Exceptions.NotFoundException import NotFoundException
+
 
 class Storage(ABC):
 
@@ -15,4 +17,62 @@ class Storage(ABC):
     def get(self, key):
         pass
 
+    @abstractmethod
+    def containsKey(self, key):
+        pass
+
+    @abstractmethod
+    def size(self):
+        pass
+
+    @abstractmethod
+    def remainingCapacity(self):
+        pass
+
+    def recoveredKey(self):
+        # Storages that survive a restart return entries the eviction policy
+        # has not seen yet, one per call; None when there are none.
+        return None
+
+    def currentWeight(self):
+        return self.size()
+
+    def abandonAdd(self, key):
+        # Cache.store gave up on a put after add raised StorageFullException.
+        # Storages that kept work for the retry (an encoded value) drop it.
+        pass
+
+    @abstractmethod
+    def keys(self):
+        pass
+
+    def shortfall(self, items):
+        # Number of entries that have to be evicted before items fit.
+        return max(len(self.missingKeys(items)) - self.remainingCapacity(), 0)
+
+    def missingKeys(self, keys):
+        return [key for key in keys if not self.containsKey(key)]
+
+    def getMany(self, keys):
+        hits = dict()
+        misses = []
+        for key in keys:
+            try:
+                hits[key] = self.get(key)
+            except NotFoundException:
+                misses.append(key)
+        return hits, misses
+
+    def addMany(self, items):
+        for key, value in items.items():
+            self.add(key, value)
 
+    def removeMany(self, keys):
+        removed = []
+        for key in keys:
+            try:
+                self.remove(key)
+                removed.append(key)
+            except NotFoundException:
+                pass
+        return removed
@@ -0,0 +1,88 @@
+import threading
+
+
+class WriteBehindWriter:
+    # Buffers writes and hands them to writeBatch(dict) in coalesced batches:
+    # repeated writes of a key between flushes reach the store once. A batch
+    # is flushed when batchSize keys are pending, every flushInterval seconds
+    # if set, and on demand before the cache evicts a dirty key.
+    #
+    # bufferLock guards the pending dict and the batch being written;
+    # flushLock is held for the whole store write. A key counts as dirty
+    # until writeBatch has stored it, so flushIfDirty on a key whose batch
+    # another thread is writing waits for that write to finish.
+
+    def __init__(self, writeBatch, batchSize=100, flushInterval=None):
+        self.writeBatch = writeBatch
+        self.batchSize = batchSize
+        self.flushInterval = flushInterval
+        self.pending = dict()
+        self.flushing = dict()
+        self.bufferLock = threading.Lock()
+        self.flushLock = threading.Lock()
+        self.stopped = threading.Event()
+        self.writesAccepted = 0
+        self.entriesFlushed = 0
+        self.batchesFlushed = 0
+        self.thread = None
+        if flushInterval is not None:
+            self.thread = threading.Thread(target=self.run, name="cache-write-behind", daemon=True)
+            self.thread.start()
+
+    def write(self, key, value):
+        with self.bufferLock:
+            self.pending[key] = value
+            self.writesAccepted += 1
+            full = len(self.pending) >= self.batchSize
+        if full:
+            self.flush()
+
+    def writeMany(self, items):
+        with self.bufferLock:
+            self.pending.update(items)
+            self.writesAccepted += len(items)
+            full = len(self.pending) >= self.batchSize
+        if full:
+            self.flush()
+
+    def isDirty(self, key):
+        with self.bufferLock:
+            return key in self.pending or key in self.flushing
+
+    def flushIfDirty(self, keys):
+        if any(self.isDirty(key) for key in keys):
+            self.flush()
+
+    def flush(self):
+        with self.flushLock:
+            with self.bufferLock:
+                batch = self.pending
+                self.pending = dict()
+                self.flushing = batch
+            if not batch:
+                return 0
+            try:
+                self.writeBatch(batch)
+            except Exception:
+                # Put the batch back without overwriting newer writes.
+                with self.bufferLock:
+                    for key, value in batch.items():
+                        self.pending.setdefault(key, value)
+                raise
+            finally:
+                with self.bufferLock:
+                    self.flushing = dict()
+            self.entriesFlushed += len(batch)
+            self.batchesFlushed += 1
+            return len(batch)
+
+    def run(self):
+        while not self.stopped.wait(self.flushInterval):
+            self.flush()
+
+    def close(self):
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        self.flush()
@@ -0,0 +1,44 @@
+import argparse
+import contextlib
+import io
+import random
+import time
+
+from Cache.src.Cache.factories.CacheFactory import CacheFactory
+
+
+def timeIt(function, batches):
+    start = time.perf_counter()
+    for batch in batches:
+        function(batch)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batched getMany/putMany vs loops of single-key calls.")
+    parser.add_argument("--capacity", type=int, default=50_000)
+    parser.add_argument("--key-space", type=int, default=100_000)
+    parser.add_argument("--keys-per-size", type=int, default=200_000, help="keys looked up per batch size")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 10, 50, 100, 500])
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    print("%8s %16s %16s %16s %16s" % ("batch", "get loop k/s", "getMany k/s", "put loop k/s", "putMany k/s"))
+    for size in args.batch_sizes:
+        batches = [[rng.randrange(args.key_space) for _ in range(size)]
+                   for _ in range(max(args.keys_per_size // size, 1))]
+        keys = sum(len(batch) for batch in batches)
+        factory = CacheFactory()
+        singles = factory.defaultCache(args.capacity)
+        batched = factory.defaultCache(args.capacity)
+        with contextlib.redirect_stdout(io.StringIO()):
+            putLoop = timeIt(lambda batch: [singles.put(key, key) for key in batch], batches)
+            putMany = timeIt(lambda batch: batched.putMany({key: key for key in batch}), batches)
+            getLoop = timeIt(lambda batch: [singles.get(key) for key in batch], batches)
+            getMany = timeIt(batched.getMany, batches)
+        print("%8d %16.0f %16.0f %16.0f %16.0f" % (
+            size, keys / getLoop / 1000, keys / getMany / 1000, keys / putLoop / 1000, keys / putMany / 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+import argparse
+import asyncio
+import multiprocessing
+import os
+import random
+import tempfile
+import time
+
+from Cache.src.Algorithms.HdrHistogram import HdrHistogram
+from Cache.src.Cache.factories.CacheFactory import CacheFactory
+from Cache.src.Cache.server.CacheClient import CacheClient
+from Cache.src.Cache.server.CacheServer import CacheServer
+from Cache.src.benchmarks.Traces import zipfTrace
+
+
+def serve(capacity, port, path, ready):
+    async def run():
+        server = await CacheServer(CacheFactory().defaultCache(capacity), port=port, path=path).start()
+        ready.send(server.port)
+        ready.close()
+        await server.serveForever()
+
+    asyncio.run(run())
+
+
+async def clientLoop(client, keys, readRatio, value, deadline, histogram, seed):
+    rng = random.Random(seed)
+    requests = 0
+    position = 0
+    while time.perf_counter() < deadline:
+        key = keys[position % len(keys)]
+        position += 1
+        start = time.perf_counter_ns()
+        if rng.random() < readRatio:
+            if await client.get(key) is None:
+                await client.put(key, value)
+                requests += 1
+        else:
+            await client.put(key, value)
+        histogram.record(time.perf_counter_ns() - start)
+        requests += 1
+    return requests
+
+
+async def measure(port, path, clients, poolSize, seconds, keys, readRatio, value):
+    client = await CacheClient(port=port, path=path, poolSize=poolSize).connect()
+    histogram = HdrHistogram()
+    deadline = time.perf_counter() + seconds
+    start = time.perf_counter()
+    slices = [keys[index::clients] for index in range(clients)]
+    counts = await asyncio.gather(*[
+        clientLoop(client, slices[index], readRatio, value, deadline, histogram, index) for index in range(clients)])
+    elapsed = time.perf_counter() - start
+    await client.close()
+    return sum(counts) / elapsed, histogram
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load generator for CacheServer on localhost.")
+    parser.add_argument("--capacity", type=int, default=50_000)
+    parser.add_argument("--key-space", type=int, default=200_000)
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 4, 16, 64, 256],
+                        help="concurrent client coroutines, each with one request in flight")
+    parser.add_argument("--pool-size", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--read-ratio", type=float, default=0.9)
+    parser.add_argument("--value-size", type=int, default=100)
+    parser.add_argument("--tcp", action="store_true", help="use TCP on 127.0.0.1 instead of a Unix socket")
+    args = parser.parse_args()
+
+    keys = [str(key).encode() for key in zipfTrace(200_000, args.key_space, skew=0.9, seed=61)]
+    value = b"v" * args.value_size
+    context = multiprocessing.get_context("fork")
+    with tempfile.TemporaryDirectory() as directory:
+        path = None if args.tcp else os.path.join(directory, "cache.sock")
+        receiver, sender = context.Pipe(duplex=False)
+        server = context.Process(target=serve, args=(args.capacity, 0, path, sender), daemon=True)
+        server.start()
+        port = receiver.recv()
+
+        print("%8s %14s %10s %10s %10s" % ("clients", "requests/sec", "p50 us", "p99 us", "p99.9 us"))
+        for clients in args.clients:
+            requestsPerSec, histogram = asyncio.run(measure(
+                port, path, clients, args.pool_size, args.seconds, keys, args.read_ratio, value))
+            print("%8d %14.0f %10.1f %10.1f %10.1f" % (
+                clients, requestsPerSec, histogram.percentile(50) / 1e3,
+                histogram.percentile(99) / 1e3, histogram.percentile(99.9) / 1e3))
+        server.terminate()
+        server.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import argparse
+import time
+import tracemalloc
+
+from Cache.src.Cache.factories.CacheFactory import CacheFactory
+from Cache.src.Cache.policies.ClockEvictionPolicy import ClockEvictionPolicy
+from Cache.src.Cache.policies.LRUEvictionPolicy import LRUEvictionPolicy
+from Cache.src.Cache.policies.SieveEvictionPolicy import SieveEvictionPolicy
+from Cache.src.benchmarks.PolicyBenchmark import replay
+from Cache.src.benchmarks.Traces import burstyZipfTrace, zipfTrace
+
+
+def bytesPerKey(policyClass, keys):
+    # Keys are created before tracing starts so only the policy's own
+    # structures are counted.
+    tracemalloc.start()
+    policy = policyClass(len(keys))
+    policy.keysAccessed(keys)
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return used / len(keys)
+
+
+def hitNanos(policyClass, keys, hits):
+    policy = policyClass(len(keys))
+    policy.keysAccessed(keys)
+    keyAccessed = policy.keyAccessed
+    start = time.perf_counter()
+    for key in hits:
+        keyAccessed(key)
+    return (time.perf_counter() - start) / len(hits) * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CLOCK and SIEVE against the array LRU.")
+    parser.add_argument("--keys", type=int, default=1_000_000, help="keys tracked for the memory and hit-cost runs")
+    parser.add_argument("--capacity", type=int, default=5_000)
+    parser.add_argument("--key-space", type=int, default=100_000)
+    parser.add_argument("--requests", type=int, default=300_000)
+    args = parser.parse_args()
+
+    keys = list(range(args.keys))
+    hits = zipfTrace(500_000, args.keys, seed=21)
+    zipf = zipfTrace(args.requests, args.key_space, skew=0.8, seed=22)
+    bursty = burstyZipfTrace(args.requests, args.key_space, burstEvery=2_000, burstLength=500, skew=0.8, seed=23)
+    factory = CacheFactory()
+    policies = {
+        "LRU": (LRUEvictionPolicy, factory.defaultCache),
+        "CLOCK": (ClockEvictionPolicy, factory.clockCache),
+        "SIEVE": (SieveEvictionPolicy, factory.sieveCache),
+    }
+
+    print("%-6s %10s %12s %10s %10s %14s" % (
+        "policy", "bytes/key", "hit ns", "zipf", "bursty", "cache ops/sec"))
+    for name, (policyClass, build) in policies.items():
+        memory = bytesPerKey(policyClass, keys)
+        nanos = hitNanos(policyClass, keys, hits)
+        zipfHitRatio, opsPerSec = replay(build(args.capacity), zipf)
+        burstyHitRatio, _ = replay(build(args.capacity), bursty)
+        print("%-6s %10.1f %12.1f %10.4f %10.4f %14.0f" % (
+            name, memory, nanos, zipfHitRatio, burstyHitRatio, opsPerSec))
+
+
+if __name__ == "__main__":
+    main()
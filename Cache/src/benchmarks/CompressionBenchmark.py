@@ -0,0 +1,67 @@
+import argparse
+import contextlib
+import io
+import math
+import random
+import time
+
+from Cache.src.Cache.factories.CacheFactory import CacheFactory
+from Cache.src.benchmarks.Traces import zipfTrace
+
+
+def document(rng, key):
+    # JSON-like records of very different sizes with the repetition real API
+    # payloads have.
+    items = rng.randrange(2, 200)
+    return {
+        "id": key,
+        "kind": rng.choice(["order", "invoice", "profile"]),
+        "items": [{"sku": "SKU-%06d" % rng.randrange(5000), "quantity": rng.randrange(1, 9),
+                   "price": round(rng.uniform(1, 500), 2), "tags": ["fragile", "express"][:rng.randrange(3)]}
+                  for _ in range(items)],
+        "note": rng.choice(["", "leave at door", "call before delivery"]) * rng.randrange(1, 4),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serialized vs zlib vs lzma storage under a fixed byte budget.")
+    parser.add_argument("--budget-mb", type=float, default=16.0)
+    parser.add_argument("--key-space", type=int, default=20_000)
+    parser.add_argument("--requests", type=int, default=100_000)
+    parser.add_argument("--threshold", type=int, default=512)
+    args = parser.parse_args()
+
+    rng = random.Random(81)
+    documents = {key: document(rng, key) for key in range(args.key_space)}
+    trace = zipfTrace(args.requests, args.key_space, skew=0.8, seed=82)
+    budget = int(args.budget_mb * 1024 * 1024)
+    factory = CacheFactory()
+
+    print("%-6s %8s %10s %10s %10s %10s %12s" % (
+        "codec", "ratio", "entries", "hit ratio", "put us", "get us", "decompress us"))
+    for codec, threshold in (("none", math.inf), ("zlib", args.threshold), ("lzma", args.threshold)):
+        cache = factory.compressedCache(budget, "zlib" if codec == "none" else codec, threshold)
+        compressing = cache.storage.inner
+        hits = 0
+        putTime = 0.0
+        getTime = 0.0
+        with contextlib.redirect_stdout(io.StringIO()):
+            for key in trace:
+                start = time.perf_counter()
+                value = cache.get(key)
+                getTime += time.perf_counter() - start
+                if value is None:
+                    start = time.perf_counter()
+                    cache.put(key, documents[key])
+                    putTime += time.perf_counter() - start
+                else:
+                    hits += 1
+        stats = compressing.compressionStats()
+        misses = len(trace) - hits
+        print("%-6s %8.2f %10d %10.4f %10.1f %10.1f %12.1f" % (
+            codec, stats["ratio"], cache.storage.size(), hits / len(trace),
+            putTime / max(misses, 1) * 1e6, getTime / len(trace) * 1e6, stats["meanDecompressMicros"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import argparse
+import contextlib
+import io
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from Cache.src.Cache.factories.CacheFactory import CacheFactory
+
+
+def worker(cache, keys, readRatio, seed):
+    rng = random.Random(seed)
+    get = cache.get
+    put = cache.put
+    for key in keys:
+        if rng.random() < readRatio:
+            get(key)
+        else:
+            put(key, key)
+    return len(keys)
+
+
+def run(capacity, shards, threads, opsPerThread, keySpace, readRatio):
+    cache = CacheFactory().concurrentCache(capacity, shards)
+    rng = random.Random(7)
+    workloads = [[rng.randrange(keySpace) for _ in range(opsPerThread)] for _ in range(threads)]
+    # The cache still prints on misses and evictions; keep that out of the terminal.
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            futures = [pool.submit(worker, cache, keys, readRatio, seed) for seed, keys in enumerate(workloads)]
+            total = sum(future.result() for future in futures)
+        elapsed = time.perf_counter() - start
+    return total / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Thread-pool stress test for ConcurrentCache.")
+    parser.add_argument("--capacity", type=int, default=10_000)
+    parser.add_argument("--key-space", type=int, default=20_000)
+    parser.add_argument("--ops", type=int, default=50_000, help="operations per thread")
+    parser.add_argument("--read-ratio", type=float, default=0.9)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, 4, 16, 64])
+    args = parser.parse_args()
+
+    print("%8s %8s %14s" % ("threads", "shards", "ops/sec"))
+    for threads in args.threads:
+        for shards in args.shards:
+            opsPerSec = run(args.capacity, shards, threads, args.ops, args.key_space, args.read_ratio)
+            print("%8d %8d %14.0f" % (threads, shards, opsPerSec))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+import argparse
+
+from Cache.src.Cache.factories.CacheFactory import CacheFactory
+from Cache.src.benchmarks.PolicyBenchmark import compare
+from Cache.src.benchmarks.Traces import burstyZipfTrace
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LFU vs LRU on a Zipf trace with one-off bursts.")
+    parser.add_argument("--capacity", type=int, default=1_000)
+    parser.add_argument("--key-space", type=int, default=20_000)
+    parser.add_argument("--length", type=int, default=200_000)
+    parser.add_argument("--skew", type=float, default=0.9)
+    args = parser.parse_args()
+
+    trace = burstyZipfTrace(args.length, args.key_space, burstEvery=2_000,
+                            burstLength=args.capacity, skew=args.skew)
+    factory = CacheFactory()
+    compare({
+        "LRUEvictionPolicy": lambda: factory.defaultCache(args.capacity),
+        "LFUEvictionPolicy": lambda: factory.lfuCache(args.capacity),
+        "LFUEvictionPolicy+aging": lambda: factory.lfuCache(args.capacity, agingPeriod=10 * args.capacity),
+    }, trace)
+
+
+if __name__ == "__main__":
+    main()
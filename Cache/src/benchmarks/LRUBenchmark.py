@@ -0,0 +1,75 @@
+import argparse
+import random
+import time
+import tracemalloc
+
+from Cache.src.Cache.policies.LRUEvictionPolicy import LRUEvictionPolicy
+from Cache.src.Cache.policies.LinkedListLRUEvictionPolicy import LinkedListLRUEvictionPolicy
+
+
+def measureMemory(policyFactory, keys):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    policy = policyFactory(len(keys))
+    for key in keys:
+        policy.keyAccessed(key)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / len(keys)
+
+
+def measureHits(policyFactory, keys, accesses):
+    policy = policyFactory(len(keys))
+    for key in keys:
+        policy.keyAccessed(key)
+    keyAccessed = policy.keyAccessed
+    start = time.perf_counter()
+    for key in accesses:
+        keyAccessed(key)
+    elapsed = time.perf_counter() - start
+    return len(accesses) / elapsed
+
+
+def measureChurn(policyFactory, capacity, accesses):
+    policy = policyFactory(capacity)
+    keyAccessed = policy.keyAccessed
+    evictKey = policy.evictKey
+    resident = 0
+    start = time.perf_counter()
+    for key in accesses:
+        keyAccessed(key)
+        resident += 1
+        if resident > capacity:
+            evictKey()
+            resident -= 1
+    elapsed = time.perf_counter() - start
+    return len(accesses) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Array-backed LRU vs linked-list LRU.")
+    parser.add_argument("--keys", type=int, default=1_000_000)
+    parser.add_argument("--accesses", type=int, default=2_000_000)
+    args = parser.parse_args()
+
+    policies = {
+        "LinkedListLRUEvictionPolicy": lambda capacity: LinkedListLRUEvictionPolicy(),
+        "LRUEvictionPolicy": LRUEvictionPolicy,
+    }
+    keys = ["key-%d" % i for i in range(args.keys)]
+    rng = random.Random(42)
+    hits = [keys[rng.randrange(args.keys)] for _ in range(args.accesses)]
+    churn = [rng.randrange(args.keys * 2) for _ in range(args.accesses)]
+
+    print("%-30s %14s %14s %14s" % ("policy", "bytes/key", "hits/sec", "churn ops/sec"))
+    for name, factory in policies.items():
+        print("%-30s %14.1f %14.0f %14.0f" % (
+            name,
+            measureMemory(factory, keys),
+            measureHits(factory, keys, hits),
+            measureChurn(factory, args.keys // 2, churn),
+        ))
+
+
+if __name__ == "__main__":
+    main()
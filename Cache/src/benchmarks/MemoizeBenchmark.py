@@ -0,0 +1,55 @@
+import argparse
+import functools
+import time
+
+from Cache.src.Cache.memoize.cached import cached
+from Cache.src.benchmarks.Traces import zipfTrace
+
+
+def timeCalls(function, arguments):
+    start = time.perf_counter()
+    for argument in arguments:
+        function(argument)
+    return (time.perf_counter() - start) / len(arguments) * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description="@cached against functools.lru_cache.")
+    parser.add_argument("--capacity", type=int, default=10_000)
+    parser.add_argument("--key-space", type=int, default=100_000)
+    parser.add_argument("--calls", type=int, default=500_000)
+    parser.add_argument("--policies", nargs="+", default=["defaultCache", "clockCache", "sieveCache", "tinyLfuCache"])
+    args = parser.parse_args()
+
+    def compute(x):
+        return x * 2
+
+    hot = list(range(args.capacity // 2)) * (args.calls // (args.capacity // 2))
+    trace = zipfTrace(args.calls, args.key_space, skew=0.9, seed=51)
+    contenders = {"lru_cache": functools.lru_cache(maxsize=args.capacity)(compute)}
+    for policy in args.policies:
+        contenders["cached/" + policy] = (policy, True)
+    contenders["cached/clockCache unlocked"] = ("clockCache", False)
+
+    print("%-28s %14s %14s %10s" % ("memoizer", "hit ns/call", "zipf ns/call", "hit ratio"))
+    for name, memoized in contenders.items():
+        if isinstance(memoized, tuple):
+            build = lambda: cached(capacity=args.capacity, policy=memoized[0], threadSafe=memoized[1])(compute)
+        else:
+            build = lambda: functools.lru_cache(maxsize=args.capacity)(compute)
+        function = build()
+        for argument in hot[:args.capacity // 2]:
+            function(argument)
+        hitNanos = timeCalls(function, hot)
+        function = build()
+        zipfNanos = timeCalls(function, trace)
+        if hasattr(function, "cache_info"):
+            info = function.cache_info()
+            hitRatio = info.hits / (info.hits + info.misses)
+        else:
+            hitRatio = function.cacheStats()["hitRatio"]
+        print("%-28s %14.0f %14.0f %10.4f" % (name, hitNanos, zipfNanos, hitRatio))
+
+
+if __name__ == "__main__":
+    main()
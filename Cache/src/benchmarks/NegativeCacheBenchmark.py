@@ -0,0 +1,79 @@
+import argparse
+import random
+import time
+
+from Cache.src.Cache.factories.CacheFactory import CacheFactory
+from Cache.src.benchmarks.Traces import zipfTrace
+
+
+def buildTrace(requests, keySpace, absentRatio, seed):
+    # Present keys are 0..keySpace-1; absent ones are negative, drawn from a
+    # Zipf of their own so the same missing keys keep coming back.
+    rng = random.Random(seed)
+    present = zipfTrace(requests, keySpace, skew=0.9, seed=seed)
+    absent = zipfTrace(requests, keySpace * 4, skew=0.7, seed=seed + 1)
+    return [-1 - absent[index] if rng.random() < absentRatio else present[index] for index in range(requests)]
+
+
+def run(trace, origin, capacity, negativeCapacity, falsePositiveRate, latency, putEvery):
+    originCalls = 0
+
+    def loader(key):
+        nonlocal originCalls
+        originCalls += 1
+        return origin.get(key)
+
+    cache = CacheFactory().readWriteCache(capacity, loader, negativeCapacity=negativeCapacity,
+                                          falsePositiveRate=falsePositiveRate)
+    wrong = 0
+    start = time.perf_counter()
+    for position, key in enumerate(trace):
+        if putEvery and key < 0 and position % putEvery == 0:
+            # A key that used to be absent shows up; it must be served from now on.
+            origin[key] = key
+            cache.put(key, key)
+        if cache.get(key) != origin.get(key):
+            wrong += 1
+    elapsed = time.perf_counter() - start
+    for key in [key for key in origin if key < 0]:
+        del origin[key]
+    return cache, originCalls, wrong, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Origin lookups saved by the Bloom-filter negative cache.")
+    parser.add_argument("--capacity", type=int, default=10_000)
+    parser.add_argument("--key-space", type=int, default=50_000)
+    parser.add_argument("--requests", type=int, default=300_000)
+    parser.add_argument("--absent-ratio", type=float, default=0.4)
+    parser.add_argument("--negative-capacity", type=int, default=50_000)
+    parser.add_argument("--false-positive-rate", type=float, nargs="+", default=[0.05, 0.01, 0.001])
+    parser.add_argument("--origin-latency-us", type=float, default=500.0,
+                        help="simulated cost of one origin call, added to the reported time")
+    parser.add_argument("--put-every", type=int, default=1_000, help="turn an absent key into a present one this often")
+    args = parser.parse_args()
+
+    trace = buildTrace(args.requests, args.key_space, args.absent_ratio, seed=71)
+    origin = {key: key for key in range(args.key_space)}
+    latency = args.origin_latency_us / 1e6
+
+    print("%-10s %12s %12s %10s %12s %12s %8s" % (
+        "negative", "origin calls", "prevented", "memory KB", "us/get", "us/get+orig", "wrong"))
+    configurations = [("off", None, None)] + [(str(rate), args.negative_capacity, rate) for rate in args.false_positive_rate]
+    for name, negativeCapacity, rate in configurations:
+        cache, originCalls, wrong, elapsed = run(trace, origin, args.capacity, negativeCapacity, rate or 0.01,
+                                                 latency, args.put_every)
+        prevented = 0
+        memory = 0
+        if cache.negativeCache is not None:
+            stats = cache.negativeCache.negativeStats()
+            prevented = stats["lookupsPrevented"]
+            memory = stats["memoryBytes"]
+        perGet = elapsed / len(trace) * 1e6
+        withOrigin = (elapsed + originCalls * latency) / len(trace) * 1e6
+        print("%-10s %12d %12d %10.1f %12.2f %12.2f %8d" % (
+            name, originCalls, prevented, memory / 1024, perGet, withOrigin, wrong))
+
+
+if __name__ == "__main__":
+    main()
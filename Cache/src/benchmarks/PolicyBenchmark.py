@@ -0,0 +1,26 @@
+import contextlib
+import io
+import time
+
+
+def replay(cache, trace):
+    # Read-through replay: every miss is followed by a put of the same key.
+    hits = 0
+    get = cache.get
+    put = cache.put
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        for key in trace:
+            if get(key) is None:
+                put(key, key)
+            else:
+                hits += 1
+        elapsed = time.perf_counter() - start
+    return hits / len(trace), len(trace) / elapsed
+
+
+def compare(cacheFactories, trace):
+    print("%-24s %10s %14s" % ("policy", "hit ratio", "ops/sec"))
+    for name, cacheFactory in cacheFactories.items():
+        hitRatio, opsPerSec = replay(cacheFactory(), trace)
+        print("%-24s %10.4f %14.0f" % (name, hitRatio, opsPerSec))
@@ -0,0 +1,53 @@
+import argparse
+import contextlib
+import io
+
+from Cache.src.Cache.factories.CacheFactory import CacheFactory
+from Cache.src.benchmarks.Traces import scanTrace, zipfTrace
+
+
+def phaseHitRatios(cache, phases):
+    ratios = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for trace in phases:
+            hits = 0
+            for key in trace:
+                if cache.get(key) is None:
+                    cache.put(key, key)
+                else:
+                    hits += 1
+            ratios.append(hits / len(trace))
+    return ratios
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Trace replay of Zipf traffic interrupted by a batch scan.")
+    parser.add_argument("--capacity", type=int, default=2_000)
+    parser.add_argument("--key-space", type=int, default=50_000)
+    parser.add_argument("--warmup", type=int, default=100_000)
+    parser.add_argument("--recovery", type=int, default=20_000)
+    parser.add_argument("--scan-multiple", type=int, default=10, help="scan length as a multiple of capacity")
+    args = parser.parse_args()
+
+    names = ["warm-up", "scan+zipf", "recovery"]
+    scan = scanTrace(args.capacity * args.scan_multiple, start=args.key_space)
+    interleaved = [key for pair in zip(scan, zipfTrace(len(scan), args.key_space, seed=2)) for key in pair]
+    phases = [
+        zipfTrace(args.warmup, args.key_space, seed=1),
+        interleaved,
+        zipfTrace(args.recovery, args.key_space, seed=3),
+    ]
+    factory = CacheFactory()
+    caches = {
+        "LRU": factory.defaultCache,
+        "2Q": factory.twoQueueCache,
+        "ARC": factory.arcCache,
+    }
+    print("%-6s" % "policy" + "".join("%12s" % name for name in names))
+    for name, build in caches.items():
+        ratios = phaseHitRatios(build(args.capacity), phases)
+        print("%-6s" % name + "".join("%12.4f" % ratio for ratio in ratios))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+import argparse
+import contextlib
+import io
+import multiprocessing
+import time
+
+from Cache.src.Cache.factories.CacheFactory import CacheFactory
+from Cache.src.benchmarks.Traces import zipfTrace
+
+
+def worker(cache, keys, valueSize, results):
+    hits = 0
+    value = b"x" * valueSize
+    with contextlib.redirect_stdout(io.StringIO()):
+        for key in keys:
+            if cache.get(key) is None:
+                cache.put(key, value)
+            else:
+                hits += 1
+    results.put(hits)
+
+
+def run(mode, processes, capacity, trace, valueSize):
+    # One trace cut into per-process slices, so every worker sees the same
+    # key popularity. Private caches split the same capacity between them.
+    context = multiprocessing.get_context("fork")
+    factory = CacheFactory()
+    shared = None
+    if mode == "shared":
+        shared = factory.sharedMemoryCache(capacity, slotSize=valueSize + 64)
+    results = context.Queue()
+    sliceLength = len(trace) // processes
+    workers = []
+    for index in range(processes):
+        cache = shared if shared is not None else factory.defaultCache(max(capacity // processes, 1))
+        keys = trace[index * sliceLength:(index + 1) * sliceLength]
+        workers.append(context.Process(target=worker, args=(cache, keys, valueSize, results)))
+    start = time.perf_counter()
+    for process in workers:
+        process.start()
+    hits = sum(results.get() for _ in workers)
+    for process in workers:
+        process.join()
+    elapsed = time.perf_counter() - start
+    if shared is not None:
+        shared.storage.close()
+        shared.storage.unlink()
+    requests = sliceLength * processes
+    return requests / elapsed, hits / requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Shared-memory cache vs one private cache per process.")
+    parser.add_argument("--capacity", type=int, default=20_000)
+    parser.add_argument("--key-space", type=int, default=100_000)
+    parser.add_argument("--requests", type=int, default=320_000, help="total across all processes")
+    parser.add_argument("--value-size", type=int, default=128)
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+
+    trace = zipfTrace(args.requests, args.key_space, skew=0.9, seed=13)
+    print("%10s %8s %14s %10s" % ("processes", "mode", "requests/sec", "hit ratio"))
+    for processes in args.processes:
+        for mode in ("private", "shared"):
+            requestsPerSec, hitRatio = run(mode, processes, args.capacity, trace, args.value_size)
+            print("%10d %8s %14.0f %10.4f" % (processes, mode, requestsPerSec, hitRatio))
+
+
+if __name__ == "__main__":
+    main()
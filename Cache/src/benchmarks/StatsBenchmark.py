@@ -0,0 +1,34 @@
+import argparse
+import json
+
+from Cache.src.Cache.factories.CacheFactory import CacheFactory
+from Cache.src.benchmarks.PolicyBenchmark import replay
+from Cache.src.benchmarks.Traces import zipfTrace
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cost of Cache stats: off, sampled and timing every call.")
+    parser.add_argument("--capacity", type=int, default=10_000)
+    parser.add_argument("--key-space", type=int, default=100_000)
+    parser.add_argument("--requests", type=int, default=300_000)
+    parser.add_argument("--sample-every", type=int, nargs="+", default=[64, 1])
+    args = parser.parse_args()
+
+    trace = zipfTrace(args.requests, args.key_space, skew=0.9, seed=31)
+    factory = CacheFactory()
+
+    print("%-16s %10s %14s" % ("stats", "hit ratio", "ops/sec"))
+    hitRatio, opsPerSec = replay(factory.defaultCache(args.capacity), trace)
+    print("%-16s %10.4f %14.0f" % ("off", hitRatio, opsPerSec))
+    snapshot = None
+    for sampleEvery in args.sample_every:
+        cache = factory.defaultCache(args.capacity)
+        stats = cache.enableStats(sampleEvery)
+        hitRatio, opsPerSec = replay(cache, trace)
+        print("%-16s %10.4f %14.0f" % ("1 in " + str(sampleEvery), hitRatio, opsPerSec))
+        snapshot = stats.snapshot()
+    print(json.dumps(snapshot, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import argparse
+import contextlib
+import io
+import os
+import random
+import tempfile
+import time
+
+from Cache.src.Cache.factories.CacheFactory import CacheFactory
+from Cache.src.benchmarks.Traces import zipfTrace
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-tier hit ratio and latency of TieredCache.")
+    parser.add_argument("--l1-capacity", type=int, default=1_000)
+    parser.add_argument("--l2-capacity", type=int, default=20_000)
+    parser.add_argument("--key-space", type=int, default=30_000)
+    parser.add_argument("--requests", type=int, default=100_000)
+    parser.add_argument("--value-size", type=int, default=512)
+    args = parser.parse_args()
+
+    rng = random.Random(8)
+    trace = zipfTrace(args.requests, args.key_space, skew=0.9, seed=9)
+    value = rng.randbytes(args.value_size)
+    factory = CacheFactory()
+    with tempfile.TemporaryDirectory() as directory, contextlib.redirect_stdout(io.StringIO()):
+        cache = factory.tieredCache(args.l1_capacity, os.path.join(directory, "l2.bin"), args.l2_capacity,
+                                    dataSize=4 * args.l2_capacity * (args.value_size + 64))
+        misses = 0
+        start = time.perf_counter()
+        for key in trace:
+            if cache.get(key) is None:
+                misses += 1
+                cache.put(key, value)
+        elapsed = time.perf_counter() - start
+        cache.drain()
+        stats = cache.tierStats()
+        cache.close()
+
+    print("%4s %10s %10s %10s %14s" % ("tier", "lookups", "hits", "hit ratio", "mean us/get"))
+    for tier, tierStats in stats.items():
+        print("%4s %10d %10d %10.4f %14.1f" % (tier, tierStats["lookups"], tierStats["hits"],
+                                              tierStats["hitRatio"], tierStats["meanLatencyMicros"]))
+    print("overall hit ratio %.4f, %.0f requests/sec" % (1 - misses / len(trace), len(trace) / elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+import argparse
+
+from Cache.src.Cache.factories.CacheFactory import CacheFactory
+from Cache.src.Cache.policies.LFUEvictionPolicy import LFUEvictionPolicy
+from Cache.src.benchmarks.PolicyBenchmark import compare
+from Cache.src.benchmarks.Traces import scanTrace, zipfTrace
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TinyLFU admission on a Zipf trace interrupted by a large scan.")
+    parser.add_argument("--capacity", type=int, default=1_000)
+    parser.add_argument("--key-space", type=int, default=20_000)
+    parser.add_argument("--length", type=int, default=100_000)
+    args = parser.parse_args()
+
+    half = args.length // 2
+    trace = (zipfTrace(half, args.key_space, seed=1)
+             + scanTrace(args.capacity * 20, start=args.key_space)
+             + zipfTrace(half, args.key_space, seed=2))
+    factory = CacheFactory()
+    compare({
+        "LRU": lambda: factory.defaultCache(args.capacity),
+        "TinyLFU+LRU": lambda: factory.tinyLfuCache(args.capacity),
+        "TinyLFU+LFU": lambda: factory.tinyLfuCache(args.capacity, LFUEvictionPolicy(args.capacity)),
+    }, trace)
+
+
+if __name__ == "__main__":
+    main()
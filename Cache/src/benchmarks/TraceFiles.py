@@ -0,0 +1,37 @@
+import bz2
+import gzip
+import lzma
+
+OPENERS = {".gz": gzip.open, ".bz2": bz2.open, ".xz": lzma.open, ".lzma": lzma.open}
+
+
+def openTrace(path, mode):
+    for suffix, opener in OPENERS.items():
+        if path.endswith(suffix):
+            return opener(path, mode)
+    return open(path, mode)
+
+
+def readTrace(path, limit=None):
+    # Streams the keys of a recorded trace: one request per line, the key in
+    # the first whitespace-separated column, anything after it ignored.
+    # Compression is picked from the file suffix. Numeric keys come back as
+    # ints so they hash like the synthetic traces.
+    count = 0
+    with openTrace(path, "rt") as file:
+        for line in file:
+            if limit is not None and count >= limit:
+                return
+            fields = line.split(None, 1)
+            if not fields or fields[0].startswith("#"):
+                continue
+            key = fields[0]
+            yield int(key) if key.isdigit() else key
+            count += 1
+
+
+def writeTrace(path, keys):
+    with openTrace(path, "wt") as file:
+        for key in keys:
+            file.write(str(key))
+            file.write("\n")
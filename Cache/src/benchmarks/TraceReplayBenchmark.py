@@ -0,0 +1,146 @@
+import argparse
+import json
+import multiprocessing
+import resource
+import sys
+import time
+
+from Cache.src.Cache.factories.CacheFactory import CacheFactory
+from Cache.src.benchmarks.TraceFiles import readTrace
+from Cache.src.benchmarks.Traces import loopingScanTrace, mixedTrace, shiftingHotSetTrace, zipfTrace
+
+DEFAULT_CONFIGS = ["defaultCache", "lfuCache", "tinyLfuCache", "arcCache", "twoQueueCache", "clockCache", "sieveCache"]
+DEFAULT_TRACES = ["zipf:0.6", "zipf:0.9", "zipf:1.2", "loop", "shifting", "mixed"]
+
+
+def buildTrace(spec, args):
+    # Trace specs: zipf:<skew>, loop[:<loop size>], shifting[:<hot set size>],
+    # mixed, or file:<path> for a recorded trace, which is streamed.
+    name, _, parameter = spec.partition(":")
+    if name == "zipf":
+        return zipfTrace(args.requests, args.key_space, skew=float(parameter or 1.0), seed=41)
+    if name == "loop":
+        return loopingScanTrace(args.requests, int(parameter or args.capacity * 3 // 2))
+    if name == "shifting":
+        hotSetSize = int(parameter or args.capacity // 2)
+        return shiftingHotSetTrace(args.requests, args.key_space, hotSetSize, args.requests // 10, seed=42)
+    if name == "mixed":
+        third = args.requests // 3
+        return mixedTrace([
+            zipfTrace(third, args.key_space, skew=0.9, seed=43),
+            loopingScanTrace(third, args.capacity * 3 // 2, start=args.key_space),
+            shiftingHotSetTrace(third, args.key_space, args.capacity // 2, third // 5, seed=44),
+        ], seed=45)
+    if name == "file":
+        return readTrace(parameter, args.requests)
+    raise ValueError("unknown trace " + spec)
+
+
+def replay(config, spec, args):
+    # Runs in its own process so peak RSS belongs to this run alone.
+    cache = getattr(CacheFactory(), config)(args.capacity)
+    stats = cache.enableStats(args.sample_every)
+    trace = buildTrace(spec, args)
+    get = cache.get
+    put = cache.put
+    requests = 0
+    start = time.perf_counter()
+    for key in trace:
+        requests += 1
+        if get(key) is None:
+            put(key, key)
+    elapsed = time.perf_counter() - start
+    snapshot = stats.snapshot()
+    return {
+        "config": config,
+        "trace": spec,
+        "requests": requests,
+        "hitRatio": snapshot["hitRatio"],
+        "opsPerSec": requests / elapsed if elapsed else 0.0,
+        "p50Micros": snapshot["getMicros"]["p50"],
+        "p99Micros": snapshot["getMicros"]["p99"],
+        "peakRssMb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def replayInChild(connection, config, spec, args):
+    try:
+        connection.send(replay(config, spec, args))
+    except Exception as exception:
+        connection.send(exception)
+    finally:
+        connection.close()
+
+
+def run(config, spec, args):
+    context = multiprocessing.get_context("fork")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=replayInChild, args=(sender, config, spec, args))
+    process.start()
+    sender.close()
+    result = receiver.recv()
+    process.join()
+    if isinstance(result, Exception):
+        raise result
+    return result
+
+
+def regressions(results, baseline, threshold):
+    # Runs whose throughput fell more than threshold below the baseline.
+    failures = []
+    for result in results:
+        previous = baseline.get(result["config"] + "/" + result["trace"])
+        if previous is None:
+            continue
+        floor = previous["opsPerSec"] * (1 - threshold)
+        if result["opsPerSec"] < floor:
+            failures.append((result, previous))
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay synthetic or recorded traces through CacheFactory configurations.")
+    parser.add_argument("--configs", nargs="+", default=DEFAULT_CONFIGS,
+                        help="CacheFactory methods that take a capacity")
+    parser.add_argument("--traces", nargs="+", default=DEFAULT_TRACES)
+    parser.add_argument("--capacity", type=int, default=5_000)
+    parser.add_argument("--key-space", type=int, default=100_000)
+    parser.add_argument("--requests", type=int, default=200_000)
+    parser.add_argument("--sample-every", type=int, default=16, help="time one get in this many")
+    parser.add_argument("--json", action="store_true", help="print results as JSON instead of a table")
+    parser.add_argument("--save-baseline", help="write this run's results to a baseline file")
+    parser.add_argument("--baseline", help="fail if throughput regressed against this baseline file")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed throughput drop, as a fraction")
+    args = parser.parse_args()
+
+    results = []
+    if not args.json:
+        print("%-14s %-12s %10s %12s %10s %10s %10s" % (
+            "config", "trace", "hit ratio", "ops/sec", "p50 us", "p99 us", "peak MB"))
+    for spec in args.traces:
+        for config in args.configs:
+            result = run(config, spec, args)
+            results.append(result)
+            if not args.json:
+                print("%-14s %-12s %10.4f %12.0f %10.2f %10.2f %10.1f" % (
+                    config, spec, result["hitRatio"], result["opsPerSec"],
+                    result["p50Micros"], result["p99Micros"], result["peakRssMb"]))
+    if args.json:
+        print(json.dumps(results, indent=2))
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as file:
+            json.dump({result["config"] + "/" + result["trace"]: result for result in results}, file, indent=2)
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        failures = regressions(results, baseline, args.threshold)
+        for result, previous in failures:
+            print("REGRESSION %s/%s: %.0f ops/sec vs baseline %.0f" % (
+                result["config"], result["trace"], result["opsPerSec"], previous["opsPerSec"]), file=sys.stderr)
+        if failures:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import itertools
+import random
+
+
+def zipfTrace(length, keySpace, skew=1.0, seed=0):
+    rng = random.Random(seed)
+    weights = [1.0 / (rank ** skew) for rank in range(1, keySpace + 1)]
+    cumulative = list(itertools.accumulate(weights))
+    # Shuffle the ranking so popular keys are not simply the smallest ints.
+    keys = list(range(keySpace))
+    rng.shuffle(keys)
+    return [keys[index] for index in rng.choices(range(keySpace), cum_weights=cumulative, k=length)]
+
+
+def scanTrace(length, start=0):
+    return list(range(start, start + length))
+
+
+def burstyZipfTrace(length, keySpace, burstEvery, burstLength, skew=1.0, seed=0):
+    # Zipf traffic interrupted by bursts of one-off keys that are never repeated.
+    trace = zipfTrace(length, keySpace, skew, seed)
+    result = []
+    oneOff = keySpace
+    for position, key in enumerate(trace):
+        result.append(key)
+        if burstEvery and position % burstEvery == burstEvery - 1:
+            result.extend(range(oneOff, oneOff + burstLength))
+            oneOff += burstLength
+    return result
+
+
+def loopingScanTrace(length, loopSize, start=0):
+    # The same range read over and over; LRU gets nothing from it as soon as
+    # loopSize exceeds the capacity.
+    return [start + position % loopSize for position in range(length)]
+
+
+def shiftingHotSetTrace(length, keySpace, hotSetSize, shiftEvery, hotRatio=0.9, seed=0):
+    # Most requests go to a small hot set that moves to fresh keys every
+    # shiftEvery requests; the rest are spread over the whole key space.
+    rng = random.Random(seed)
+    trace = []
+    hotStart = 0
+    for position in range(length):
+        if position and position % shiftEvery == 0:
+            hotStart = (hotStart + hotSetSize) % keySpace
+        if rng.random() < hotRatio:
+            trace.append((hotStart + rng.randrange(hotSetSize)) % keySpace)
+        else:
+            trace.append(rng.randrange(keySpace))
+    return trace
+
+
+def mixedTrace(traces, chunk=1_000, seed=0):
+    # Interleaves chunks of the given traces in random order, so phases with
+    # different access patterns follow each other.
+    rng = random.Random(seed)
+    cursors = [0] * len(traces)
+    result = []
+    live = [index for index, trace in enumerate(traces) if trace]
+    while live:
+        index = rng.choice(live)
+        trace = traces[index]
+        result.extend(trace[cursors[index]:cursors[index] + chunk])
+        cursors[index] += chunk
+        if cursors[index] >= len(trace):
+            live.remove(index)
+    return result
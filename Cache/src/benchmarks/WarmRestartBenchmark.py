@@ -0,0 +1,64 @@
+import argparse
+import contextlib
+import io
+import os
+import random
+import tempfile
+import time
+
+from Cache.src.Cache.factories.CacheFactory import CacheFactory
+from Cache.src.benchmarks.Traces import zipfTrace
+
+
+def replay(cache, trace, origin):
+    originCalls = 0
+    for key in trace:
+        if cache.get(key) is None:
+            originCalls += 1
+            cache.put(key, origin[key])
+    return originCalls
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold start vs warm restart from MemoryMappedStorage.")
+    parser.add_argument("--entries", type=int, default=50_000)
+    parser.add_argument("--requests", type=int, default=100_000)
+    parser.add_argument("--origin-latency-ms", type=float, default=2.0,
+                        help="simulated cost of one origin call, added to the reported time")
+    args = parser.parse_args()
+
+    rng = random.Random(3)
+    origin = {key: rng.randbytes(rng.randrange(200, 2000)) for key in range(args.entries)}
+    dataSize = 2 * sum(len(value) + 64 for value in origin.values())
+    trace = zipfTrace(args.requests, args.entries, skew=0.8, seed=4)
+    factory = CacheFactory()
+
+    with tempfile.TemporaryDirectory() as directory, contextlib.redirect_stdout(io.StringIO()):
+        path = os.path.join(directory, "cache.bin")
+        cache = factory.persistentCache(path, args.entries, dataSize)
+        cache.putMany(origin)
+        cache.storage.close()
+
+        results = []
+        start = time.perf_counter()
+        cold = factory.defaultCache(args.entries)
+        opened = time.perf_counter() - start
+        originCalls = replay(cold, trace, origin)
+        results.append(("cold", opened, originCalls, time.perf_counter() - start))
+
+        start = time.perf_counter()
+        warm = factory.persistentCache(path, args.entries)
+        opened = time.perf_counter() - start
+        originCalls = replay(warm, trace, origin)
+        results.append(("warm", opened, originCalls, time.perf_counter() - start))
+        warm.storage.close()
+
+    print("%6s %12s %14s %10s %16s" % ("start", "open ms", "origin calls", "hit ratio", "total s (w/ origin)"))
+    for name, opened, originCalls, elapsed in results:
+        total = elapsed + originCalls * args.origin_latency_ms / 1000
+        print("%6s %12.2f %14d %10.4f %16.2f" % (
+            name, opened * 1000, originCalls, 1 - originCalls / len(trace), total))
+
+
+if __name__ == "__main__":
+    main()
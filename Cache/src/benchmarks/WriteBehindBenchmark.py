@@ -0,0 +1,75 @@
+import argparse
+import contextlib
+import io
+import os
+import sqlite3
+import tempfile
+import time
+
+from Cache.src.Cache.factories.CacheFactory import CacheFactory
+from Cache.src.benchmarks.Traces import zipfTrace
+
+
+class SqliteStore:
+    # Local stand-in for a slow backing store that counts what reaches it.
+
+    def __init__(self, path):
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("CREATE TABLE IF NOT EXISTS kv (key INTEGER PRIMARY KEY, value TEXT)")
+        self.connection.commit()
+        self.rowsWritten = 0
+        self.transactions = 0
+        self.reads = 0
+
+    def load(self, key):
+        self.reads += 1
+        row = self.connection.execute("SELECT value FROM kv WHERE key = ?", (key,)).fetchone()
+        return None if row is None else row[0]
+
+    def writeBatch(self, batch):
+        with self.connection:
+            self.connection.executemany("INSERT OR REPLACE INTO kv (key, value) VALUES (?, ?)", batch.items())
+        self.rowsWritten += len(batch)
+        self.transactions += 1
+
+
+def run(trace, capacity, batchSize, writeRatio, path):
+    store = SqliteStore(path)
+    cache = CacheFactory().readWriteCache(capacity, store.load, store.writeBatch, batchSize)
+    puts = 0
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        for position, key in enumerate(trace):
+            if position % 100 < writeRatio * 100:
+                cache.put(key, "value-%d-%d" % (key, position))
+                puts += 1
+            else:
+                cache.get(key)
+        cache.writer.close()
+        elapsed = time.perf_counter() - start
+    store.connection.close()
+    return puts, store, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write-behind vs write-through against SQLite.")
+    parser.add_argument("--capacity", type=int, default=2_000)
+    parser.add_argument("--key-space", type=int, default=20_000)
+    parser.add_argument("--length", type=int, default=100_000)
+    parser.add_argument("--write-ratio", type=float, default=0.3)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 10, 100, 1000])
+    args = parser.parse_args()
+
+    trace = zipfTrace(args.length, args.key_space, seed=5)
+    print("%10s %8s %12s %13s %12s %10s" % ("batch", "puts", "rows written", "transactions", "amplif.", "seconds"))
+    for batchSize in args.batch_sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            puts, store, elapsed = run(trace, args.capacity, batchSize, args.write_ratio,
+                                       os.path.join(directory, "store.db"))
+        label = "through" if batchSize == 1 else str(batchSize)
+        print("%10s %8d %12d %13d %12.3f %10.2f" % (
+            label, puts, store.rowsWritten, store.transactions, store.rowsWritten / puts, elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,7 @@
+from Composite import *
+from Observer import *
+from HoldQueue import *
+
 # --- Book Class ---
 class Book(LibraryItem, Subject):
     VALID_STATUSES = ["available", "checked out", "reserved", "lost", "damaged", "archived"]
@@ -9,15 +13,27 @@ class Book(LibraryItem, Subject):
         self.author = author
         self.isbn = isbn
         self._status = "available"
-        self.due_date = None
+        self._due_date = None
         self.borrower = None # User object who borrowed/reserved
-        self.waitlist = [] # List of User objects waiting
+        self.waitlist = HoldQueue() # Users waiting, in order
 
     def get_title(self): return self.title
     def get_author(self): return self.author
     def get_isbn(self): return self.isbn
     def get_status(self): return self._status
 
+    @property
+    def due_date(self):
+        return self._due_date
+
+    @due_date.setter
+    def due_date(self, due_date):
+        """Moving the due date of a loan tells the attached observers (the due-date index re-files it)."""
+        changed = due_date != self._due_date
+        self._due_date = due_date
+        if changed and self._status == "checked out":
+            Subject.notify(self, f"Book '{self.title}' is now due {due_date}.")
+
     def _can_checkout(self, user):
         """Check if the book can be checked out by the given user."""
         if self._status == "available":
@@ -37,16 +53,48 @@ class Book(LibraryItem, Subject):
         """Adds a user to the waitlist if they aren't already on it."""
         if user not in self.waitlist and isinstance(user, Observer):
             self.waitlist.append(user)
-            self.attach(user) # Attach user to observe status changes
-            self.notify(f"User {user.get_name()} added to waitlist for '{self.title}'.")
-            print(f"{user.get_name()} added to waitlist for '{self.title}'. Position: {len(self.waitlist)}")
+            self._notify_hold_change(user, f"User {user.get_name()} added to waitlist for '{self.title}'.")
+            print(f"{user.get_name()} added to waitlist for '{self.title}'. Position: {self.waitlist.position(user)}")
             return True
         return False
 
+    def remove_from_waitlist(self, user: Observer):
+        """Cancels a user's hold; everyone behind them moves up one place."""
+        if user not in self.waitlist:
+            return False
+        self.waitlist.remove(user)
+        self._notify_hold_change(user, f"User {user.get_name()} left the waitlist for '{self.title}'.")
+        return True
+
+    def get_waitlist_position(self, user):
+        """1-based position of user in the waitlist, or None."""
+        return self.waitlist.position(user)
+
+    # Statuses that put every hold in doubt; only these are fanned out to the whole waitlist
+    HOLD_AFFECTING_STATUSES = ["lost", "damaged", "archived"]
+
+    def notify(self, message=None):
+        """Notifies attached observers; the waitlist too if the book may not come back."""
+        Subject.notify(self, message)
+        # Routine churn (checked out -> reserved for the next holder -> checked out)
+        # goes only to attached observers: the borrower, the reserver and the catalog
+        # bookkeeping. Sending it to thousands of holders made each return O(holds).
+        if self._status in self.HOLD_AFFECTING_STATUSES:
+            for user in self.waitlist:
+                if not self.is_attached(user):
+                    user.update(self, message)
+
+    def _notify_hold_change(self, user, message):
+        # Joining or leaving concerns the attached observers and that user,
+        # not everyone else in the queue
+        Subject.notify(self, message)
+        if not self.is_attached(user):
+            user.update(self, message)
+
     def _process_waitlist(self):
         """Processes the waitlist when a book becomes available."""
         if self.waitlist:
-            next_user = self.waitlist.pop(0)
+            next_user = self.waitlist.popleft()
             self._set_status("reserved", user=next_user) # Set status internally
             print(f"Book '{self.title}' is now reserved for {next_user.get_name()}.")
             # Observer notification happens within _set_status
@@ -59,44 +107,45 @@ class Book(LibraryItem, Subject):
             raise ValueError(f"Invalid status: {status}")
 
         old_status = self._status
+        previous_borrower = self.borrower
         self._status = status
         message = f"Book '{self.title}' status changed from {old_status} to {status}"
 
         # Clear previous state if necessary
         if status != "checked out" and status != "reserved":
             self.borrower = None
-            self.due_date = None
+            self._due_date = None
 
         if status == "checked out":
             self.borrower = user
-            self.due_date = due_date
+            self._due_date = due_date
             if user and isinstance(user, Observer):
                 self.attach(user) # Ensure borrower observes
             message += f" by {user.get_name() if user else 'N/A'}"
             if due_date: message += f". Due: {due_date}"
         elif status == "reserved":
             self.borrower = user # User for whom it is reserved
+            if user and isinstance(user, Observer):
+                self.attach(user) # Reserver observes until pickup
             message += f" for {user.get_name() if user else 'N/A'}"
         elif status == "available":
-             # Detach previous borrower *only if* they are not on waitlist anymore
-            if old_status in ["checked out", "reserved"] and self.borrower and \
-               isinstance(self.borrower, Observer) and self.borrower not in self.waitlist:
-                 self.detach(self.borrower)
             self.borrower = None
-            self.due_date = None
+            self._due_date = None
         elif status in ["lost", "damaged", "archived"]:
-             # Detach borrower/reserver if any
-             if old_status in ["checked out", "reserved"] and self.borrower and \
-                isinstance(self.borrower, Observer) and self.borrower not in self.waitlist:
-                 self.detach(self.borrower)
              # Clear waitlist? Maybe notify waiting users it's unavailable indefinitely?
              # For now, just clear borrower/due date
              self.borrower = None
-             self.due_date = None
+             self._due_date = None
 
 
         self.notify(message + ".") # Notify all current observers
 
+        # Detach the previous borrower/reserver once they have heard about the change,
+        # *only if* they no longer hold the book and are not on the waitlist
+        if previous_borrower is not None and previous_borrower is not self.borrower and \
+           isinstance(previous_borrower, Observer) and previous_borrower not in self.waitlist:
+            self.detach(previous_borrower)
+
     # --- Public methods to change status (used by Commands) ---
     def checkout(self, user: Observer, due_date):
         if not self._can_checkout(user):
@@ -153,6 +202,9 @@ class BookCollection(LibraryItem):
         for child in self._children:
             child.display_info(indent + "  ")
 
+    def get_children(self):
+        return list(self._children)
+
     def get_books(self):
         all_books = []
         for child in self._children:
@@ -0,0 +1,154 @@
+from Book import *
+
+# --- Catalog Index (Observer of every catalogued Book) ---
+class CatalogIndex(Observer):
+    """
+    Secondary indexes over the books reachable from the main catalog, so that
+    lookups never walk the BookCollection tree.
+
+    Maintained incrementally: the Librarian calls item_added/item_removed when
+    executing AddItemCommand/RemoveItemCommand, and every indexed Book has the
+    index attached as an observer, so Book._set_status keeps the status index
+    current through notify(). Ordered sets are plain dicts with None values.
+    Listeners (the SearchIndex, LibraryStats) are told about every book
+    entering or leaving the catalog.
+    """
+
+    def __init__(self, catalog: BookCollection):
+        self._catalog = catalog
+        self._listeners = []  # (on_added, on_removed) callables
+        self._by_isbn = {}    # isbn -> Book
+        self._by_author = {}  # author -> {Book: None}
+        self._by_status = {status: {} for status in Book.VALID_STATUSES}
+        self._indexed_status = {}  # Book -> status it is filed under
+        self._parent = {}     # LibraryItem -> BookCollection it lives in
+
+    # --- Lookups ---
+    def find_by_isbn(self, isbn):
+        return self._by_isbn.get(isbn)
+
+    def get_all_books(self):
+        return list(self._by_isbn.values())
+
+    def get_books_by_author(self, author):
+        return list(self._by_author.get(author, ()))
+
+    def get_books_by_status(self, status):
+        if status not in self._by_status:
+            raise ValueError(f"Invalid status: {status}")
+        return list(self._by_status[status])
+
+    def count_by_status(self, status):
+        return len(self._by_status[status])
+
+    def get_collection(self, item: LibraryItem):
+        """The collection an item was added to, or None if it is not in one."""
+        return self._parent.get(item)
+
+    def is_catalogued(self, item: LibraryItem):
+        """True if the item is reachable from the main catalog."""
+        while item is not None:
+            if item is self._catalog:
+                return True
+            item = self._parent.get(item)
+        return False
+
+    def get_catalog(self):
+        return self._catalog
+
+    def get_ancestors(self, item: LibraryItem):
+        """Collections containing item, innermost first, up to the main catalog."""
+        ancestors = []
+        collection = self._parent.get(item)
+        while collection is not None:
+            ancestors.append(collection)
+            collection = self._parent.get(collection)
+        return ancestors
+
+    def add_listener(self, on_added, on_removed):
+        """Registers callables taking a Book, run as books enter/leave the catalog."""
+        self._listeners.append((on_added, on_removed))
+
+    def __len__(self):
+        return len(self._by_isbn)
+
+    def __contains__(self, book):
+        return self._by_isbn.get(getattr(book, 'isbn', None)) is book
+
+    # --- Maintenance (called by Librarian before/after changing the tree) ---
+    def check_add(self, item: LibraryItem, collection: BookCollection):
+        """Raises InvalidOperationError if adding item to collection would break the index."""
+        if item is self._catalog or item in self._parent:
+            raise InvalidOperationError(f"'{self._name_of(item)}' is already in collection '{self._name_of(self._parent.get(item))}'.")
+        ancestor = collection
+        while ancestor is not None:
+            if ancestor is item:
+                raise InvalidOperationError(f"Cannot add collection '{self._name_of(item)}' inside itself.")
+            ancestor = self._parent.get(ancestor)
+        if self.is_catalogued(collection):
+            seen = set()
+            for book in item.get_books():
+                isbn = book.get_isbn()
+                if isbn in self._by_isbn or isbn in seen:
+                    raise InvalidOperationError(f"A book with ISBN {isbn} is already in the catalog.")
+                seen.add(isbn)
+
+    def item_added(self, item: LibraryItem, collection: BookCollection):
+        self._parent[item] = collection
+        self._record_parents(item)
+        if self.is_catalogued(collection):
+            for book in item.get_books():
+                self._index_book(book)
+
+    def item_removed(self, item: LibraryItem, collection: BookCollection):
+        if self._parent.get(item) is not collection:
+            return
+        if self.is_catalogued(collection):
+            # Unindex while the item is still linked, so listeners can see where it was
+            for book in item.get_books():
+                self._unindex_book(book)
+        del self._parent[item]
+
+    def update(self, subject, message):
+        """Observer hook: re-file a book whose status changed."""
+        old_status = self._indexed_status.get(subject)
+        if old_status is None or old_status == subject.get_status():
+            return
+        del self._by_status[old_status][subject]
+        self._by_status[subject.get_status()][subject] = None
+        self._indexed_status[subject] = subject.get_status()
+
+    # --- Internals ---
+    def _record_parents(self, item):
+        # Collections may be assembled before they are added; remember their
+        # inner structure so later adds into them can tell if they are catalogued.
+        if isinstance(item, BookCollection):
+            for child in item.get_children():
+                self._parent[child] = item
+                self._record_parents(child)
+
+    def _index_book(self, book: Book):
+        self._by_isbn[book.get_isbn()] = book
+        self._by_author.setdefault(book.get_author(), {})[book] = None
+        self._by_status[book.get_status()][book] = None
+        self._indexed_status[book] = book.get_status()
+        book.attach(self)
+        for on_added, _ in self._listeners:
+            on_added(book)
+
+    def _unindex_book(self, book: Book):
+        if self._by_isbn.get(book.get_isbn()) is not book:
+            return
+        del self._by_isbn[book.get_isbn()]
+        by_author = self._by_author[book.get_author()]
+        del by_author[book]
+        if not by_author:
+            del self._by_author[book.get_author()]
+        del self._by_status[self._indexed_status.pop(book)][book]
+        book.detach(self)
+        for _, on_removed in self._listeners:
+            on_removed(book)
+
+    @staticmethod
+    def _name_of(item):
+        return getattr(item, 'name', getattr(item, 'title', 'Unknown'))
@@ -1,6 +1,7 @@
 import abc
 from User import *
 from Librarian import *
+from Transaction import *
 
 # --- Command Pattern (Added Reserve, UpdateStatus) ---
 class Command(abc.ABC):
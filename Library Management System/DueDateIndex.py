@@ -0,0 +1,115 @@
+import heapq
+import itertools
+from Observer import *
+
+# --- Due-Date Index (min-heap of open loans with lazy deletion; Observer of lent Books) ---
+class DueDateIndex(Observer):
+    """
+    Open loans ordered by due date, so overdue processing only touches loans
+    that are actually due.
+
+    User._actual_checkout_book opens a loan and _actual_return_book closes it.
+    While a loan is open the index observes its book: a new due date (the
+    Book.due_date setter notifies) re-files the loan, and a status change that
+    ends it (return, lost, archived...) closes it. Closing only forgets the
+    loan; its heap entry is skipped when it reaches the top, and the heap is
+    compacted once stale entries outnumber live ones. Loans past their due
+    date move from the heap to an overdue table, so overdue_loans only pops
+    what fell due since the last call. How far fines have been accrued is
+    remembered per loan, so a daily accrual charges each day exactly once and
+    the return only charges what is left.
+    """
+
+    def __init__(self):
+        self._heap = []          # (due_date, seq, user, book)
+        self._live = {}          # (user, book) -> seq of its current heap entry
+        self._overdue = {}       # (user, book) -> None, in the order they became overdue
+        self._due = {}           # (user, book) -> due date the loan is filed under
+        self._accrued = {}       # (user, book) -> date fines are accrued through
+        self._borrowers = {}     # book -> user of its open loan
+        self._stale = 0
+        self._sequence = itertools.count()
+
+    def __len__(self):
+        return len(self._due)
+
+    # --- Maintenance ---
+    def loan_opened(self, user, book, due_date):
+        self._close(book)
+        self._borrowers[book] = user
+        self._file((user, book), due_date)
+        book.attach(self)
+
+    def loan_closed(self, user, book):
+        if self._borrowers.get(book) is user:
+            self._close(book)
+
+    def accrued_through(self, user, book):
+        """The date fines for this loan have been charged up to, or None if none were."""
+        return self._accrued.get((user, book))
+
+    def update(self, subject, message):
+        """Observer hook: re-file a loan whose due date changed, close one that ended."""
+        user = self._borrowers.get(subject)
+        if user is None:
+            return
+        key = (user, subject)
+        if subject.borrower is not user or subject.due_date is None:
+            self._close(subject) # Status changed under the loan; nothing left to chase
+        elif subject.due_date != self._due[key]:
+            self._unfile(key)
+            self._file(key, subject.due_date)
+
+    def _file(self, key, due_date):
+        seq = next(self._sequence)
+        self._live[key] = seq
+        self._due[key] = due_date
+        heapq.heappush(self._heap, (due_date, seq, key[0], key[1]))
+
+    def _unfile(self, key):
+        if self._live.pop(key, None) is not None:
+            self._stale += 1
+            if self._stale > len(self._live):
+                self._compact()
+        self._overdue.pop(key, None)
+        del self._due[key]
+
+    def _close(self, book):
+        user = self._borrowers.pop(book, None)
+        if user is None:
+            return
+        self._unfile((user, book))
+        self._accrued.pop((user, book), None)
+        book.detach(self)
+
+    def _compact(self):
+        self._heap = [entry for entry in self._heap if self._live.get((entry[2], entry[3])) == entry[1]]
+        heapq.heapify(self._heap)
+        self._stale = 0
+
+    # --- Queries ---
+    def overdue_loans(self, today):
+        """(user, book) pairs whose due date is before today, in the order they became overdue."""
+        heap = self._heap
+        while heap and heap[0][0] < today:
+            due_date, seq, user, book = heapq.heappop(heap)
+            key = (user, book)
+            if self._live.get(key) != seq:
+                self._stale -= 1
+                continue
+            del self._live[key]
+            self._overdue[key] = None
+        return list(self._overdue)
+
+    def accrue_fines(self, today, rate_per_day):
+        """Charges every overdue loan for the days since it was last charged. Returns the total."""
+        total = 0.0
+        for key in self.overdue_loans(today):
+            due_date = self._due[key]
+            charged_from = max(self._accrued.get(key, due_date), due_date)
+            days = (today - charged_from).days
+            if days > 0:
+                key[0].add_fine(days * rate_per_day)
+                self._accrued[key] = today
+                total += days * rate_per_day
+        return total
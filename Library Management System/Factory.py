@@ -1,3 +1,5 @@
+from User import *
+from Librarian import *
 
 # --- Factory Pattern (Updated for Librarian) ---
 class PersonFactory: # Renamed from UserFactory
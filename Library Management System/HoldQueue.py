@@ -0,0 +1,119 @@
+from collections import deque
+
+# --- Hold Queue (FIFO waitlist with O(1) membership and O(log n) positions) ---
+class HoldQueue:
+    """
+    Ordered waitlist of users for one book.
+
+    Every hold gets an increasing ticket. The deque keeps tickets in arrival
+    order and dicts map user <-> ticket, so membership, append and popleft
+    are O(1). A cancelled hold stays in the deque as a dead ticket and is
+    skipped when it reaches the front. A Fenwick tree over tickets counts
+    the live holds, so position() (holds ahead, plus one) is O(log n) and
+    stays correct when holds ahead are cancelled. Live holds are renumbered
+    once served and cancelled tickets outnumber them, which keeps memory
+    proportional to the live holds at O(1) amortized cost.
+    """
+
+    def __init__(self, users=()):
+        self._clear()
+        for user in users:
+            self.append(user)
+
+    def _clear(self):
+        self._order = deque()  # tickets in arrival order, including cancelled ones
+        self._tickets = {}     # user -> ticket
+        self._holders = {}     # ticket -> user
+        self._tree = [0]       # Fenwick tree over tickets, 1-based; ticket t is slot t + 1
+
+    # --- List-like interface ---
+    def __len__(self):
+        return len(self._tickets)
+
+    def __bool__(self):
+        return bool(self._tickets)
+
+    def __contains__(self, user):
+        return user in self._tickets
+
+    def __iter__(self):
+        holders = self._holders
+        return (holders[ticket] for ticket in list(self._order) if ticket in holders)
+
+    def __repr__(self):
+        return f"HoldQueue({list(self)!r})"
+
+    def append(self, user):
+        """Adds a hold at the back. Returns False if the user already holds."""
+        if user in self._tickets:
+            return False
+        ticket = len(self._tree) - 1
+        self._tickets[user] = ticket
+        self._holders[ticket] = user
+        self._order.append(ticket)
+        self._grow()
+        return True
+
+    def popleft(self):
+        """Removes and returns the first holder."""
+        while self._order:
+            ticket = self._order.popleft()
+            user = self._holders.pop(ticket, None)
+            if user is None:
+                continue # Cancelled hold
+            del self._tickets[user]
+            self._add(ticket, -1)
+            self._shrink()
+            return user
+        raise IndexError("pop from an empty hold queue")
+
+    def peek(self):
+        for ticket in self._order:
+            if ticket in self._holders:
+                return self._holders[ticket]
+        return None
+
+    def remove(self, user):
+        """Cancels a user's hold; later holders move up by one."""
+        ticket = self._tickets.pop(user)
+        del self._holders[ticket]
+        self._add(ticket, -1)
+        self._shrink()
+
+    def position(self, user):
+        """1-based place in the queue, or None if the user holds nothing."""
+        ticket = self._tickets.get(user)
+        if ticket is None:
+            return None
+        # Served and cancelled tickets are zeroed, so this counts live holds up to ours
+        return self._prefix(ticket + 1)
+
+    # --- Fenwick tree ---
+    def _grow(self):
+        # Append slot i = len(tree) holding 1 plus the live count over the
+        # range it covers, (i - lowbit(i), i - 1].
+        index = len(self._tree)
+        low = index - (index & -index)
+        self._tree.append(1 + self._prefix(index - 1) - self._prefix(low))
+
+    def _add(self, ticket, delta):
+        index = ticket + 1
+        tree = self._tree
+        while index < len(tree):
+            tree[index] += delta
+            index += index & -index
+
+    def _prefix(self, index):
+        total = 0
+        tree = self._tree
+        while index > 0:
+            total += tree[index]
+            index -= index & -index
+        return total
+
+    def _shrink(self):
+        if len(self._tree) > 2 * len(self._tickets) + 64:
+            users = list(self)
+            self._clear()
+            for user in users:
+                self.append(user)
@@ -15,9 +15,12 @@ class Librarian:
 
     def _actual_add_item(self, library, item: LibraryItem, collection: BookCollection = None):
         target_collection = collection if collection else library.get_catalog()
+        index = library.get_catalog_index()
         try:
+            index.check_add(item, target_collection)
             target_collection.add(item)
-            print(f"Librarian {self.name} added '{getattr(item, 'name', item.title)}' to {'collection ' + target_collection.name if target_collection != library.get_catalog() else 'main catalog'}.")
+            index.item_added(item, target_collection)
+            print(f"Librarian {self.name} added '{getattr(item, 'name', getattr(item, 'title', 'Unknown'))}' to {'collection ' + target_collection.name if target_collection != library.get_catalog() else 'main catalog'}.")
             return True
         except InvalidOperationError as e:
             print(f"Add item failed: {e}")
@@ -27,7 +30,8 @@ class Librarian:
         target_collection = collection if collection else library.get_catalog()
         try:
             target_collection.remove(item)
-            print(f"Librarian {self.name} removed '{getattr(item, 'name', item.title)}' from {'collection ' + target_collection.name if target_collection != library.get_catalog() else 'main catalog'}.")
+            library.get_catalog_index().item_removed(item, target_collection)
+            print(f"Librarian {self.name} removed '{getattr(item, 'name', getattr(item, 'title', 'Unknown'))}' from {'collection ' + target_collection.name if target_collection != library.get_catalog() else 'main catalog'}.")
             return True
         except (BookNotFoundError, InvalidOperationError) as e:
              print(f"Remove item failed: {e}")
@@ -38,6 +42,7 @@ class Librarian:
         if action == 'add':
             if user not in library.user_list:
                 library.user_list.append(user)
+                library.get_stats().user_added(user)
                 print(f"Librarian {self.name} registered user {user.get_name()}.")
                 return True
             else:
@@ -46,6 +51,7 @@ class Librarian:
         elif action == 'remove':
              if user in library.user_list:
                 library.user_list.remove(user)
+                library.get_stats().user_removed(user)
                 # Consider implications: outstanding checkouts, fines?
                 print(f"Librarian {self.name} removed user {user.get_name()}.")
                 return True
@@ -65,19 +71,16 @@ class Librarian:
             return False
 
     def generate_report(self, library):
+        # Served from the live LibraryStats totals; no walk over books or users
+        stats = library.get_stats().snapshot()
         print("\n--- Library Report ---")
         print(f"Total Users Registered: {len(library.user_list)}")
-        all_books = library.get_all_books()
-        print(f"Total Books in Catalog: {len(all_books)}")
-        status_counts = {status: 0 for status in Book.VALID_STATUSES}
-        total_fines = sum(user.get_fines() for user in library.user_list)
-        active_waitlists = 0
-        for book in all_books:
-            status_counts[book.get_status()] += 1
-            if book.waitlist: active_waitlists += 1
-
-        for status, count in status_counts.items():
+        print(f"Total Books in Catalog: {stats['total_books']}")
+        for status, count in stats["statuses"].items():
             print(f"  Books - {status.capitalize()}: {count}")
-        print(f"Active Waitlists: {active_waitlists}")
-        print(f"Total Outstanding Fines: ${total_fines:.2f}")
+        print(f"Active Waitlists: {stats['active_waitlists']}")
+        print(f"Total Outstanding Fines: ${stats['total_fines']:.2f}")
+        for collection, rollup in stats["collections"].items():
+            print(f"  Collection {collection.name}: {rollup['books']} books, {rollup['statuses']['available']} available, "
+                  f"{rollup['active_waitlists']} active waitlists")
         print("--- End Report ---\n")
@@ -0,0 +1,185 @@
+import math
+from Book import *
+
+# --- Live Library Statistics (Observer of catalogued Books and registered Users) ---
+class LibraryStats(Observer):
+    """
+    Running totals behind Librarian.generate_report: books per status, active
+    waitlists, total outstanding fines, and the same book counts rolled up
+    per collection. Reading them is O(1) (O(collections) for the rollups).
+
+    Books are tracked from the moment the CatalogIndex catalogues them, users
+    from registration (ManageUserCommand). Both notify their observers on
+    every change this class cares about: Book._set_status, add_to_waitlist
+    and _process_waitlist (through _set_status) on books, add_fine and
+    pay_fine on users. Each notification is turned into a delta against the
+    state last recorded for that subject.
+
+    verify() recounts everything from the catalog tree and user list and
+    reports any difference; rebuild() replaces the totals with that recount.
+    """
+
+    def __init__(self, catalog_index):
+        self._index = catalog_index
+        self._reset()
+        catalog_index.add_listener(self.book_added, self.book_removed)
+
+    def _reset(self):
+        self._status_counts = {status: 0 for status in Book.VALID_STATUSES}
+        self._active_waitlists = 0
+        self._total_fines = 0.0
+        self._collections = {}  # BookCollection -> {"books", "active_waitlists", "statuses"}
+        self._book_state = {}   # Book -> (status, has_waitlist) as last counted
+        self._user_fines = {}   # User -> fines as last counted
+        self._fined_users = {}  # Users owing anything, in the order they started owing
+
+    # --- Reads ---
+    def get_status_counts(self):
+        return dict(self._status_counts)
+
+    def get_active_waitlists(self):
+        return self._active_waitlists
+
+    def get_total_fines(self):
+        # Deltas can leave float dust below zero once every fine is paid
+        return max(self._total_fines, 0.0)
+
+    def get_users_with_fines(self):
+        return list(self._fined_users)
+
+    def get_total_books(self):
+        return len(self._book_state)
+
+    def get_collection_rollup(self, collection):
+        rollup = self._collections.get(collection)
+        if rollup is None:
+            return self._empty_rollup()
+        return {"books": rollup["books"], "active_waitlists": rollup["active_waitlists"],
+                "statuses": dict(rollup["statuses"])}
+
+    def snapshot(self):
+        """All totals as plain data; collections are keyed by the BookCollection itself, since names need not be unique."""
+        return {
+            "total_books": self.get_total_books(),
+            "statuses": self.get_status_counts(),
+            "active_waitlists": self._active_waitlists,
+            "total_fines": self.get_total_fines(),
+            "collections": {collection: self.get_collection_rollup(collection)
+                            for collection in self._collections},
+        }
+
+    # --- Tracking ---
+    def book_added(self, book):
+        if book in self._book_state:
+            return
+        state = (book.get_status(), bool(book.waitlist))
+        self._book_state[book] = state
+        self._apply(book, state, +1)
+        book.attach(self)
+
+    def book_removed(self, book):
+        state = self._book_state.pop(book, None)
+        if state is None:
+            return
+        self._apply(book, state, -1)
+        book.detach(self)
+
+    def user_added(self, user):
+        if user in self._user_fines:
+            return
+        self._user_fines[user] = user.get_fines()
+        self._total_fines += user.get_fines()
+        self._track_fined(user)
+        user.attach(self)
+
+    def user_removed(self, user):
+        if user not in self._user_fines:
+            return
+        self._total_fines -= self._user_fines.pop(user)
+        self._fined_users.pop(user, None)
+        user.detach(self)
+
+    def update(self, subject, message):
+        """Observer hook: apply the change since this subject was last counted."""
+        if subject in self._book_state:
+            state = (subject.get_status(), bool(subject.waitlist))
+            old_state = self._book_state[subject]
+            if state != old_state:
+                self._apply(subject, old_state, -1)
+                self._apply(subject, state, +1)
+                self._book_state[subject] = state
+        elif subject in self._user_fines:
+            fines = subject.get_fines()
+            self._total_fines += fines - self._user_fines[subject]
+            self._user_fines[subject] = fines
+            self._track_fined(subject)
+
+    def _track_fined(self, user):
+        if user.get_fines() > 0:
+            self._fined_users[user] = None
+        else:
+            self._fined_users.pop(user, None)
+
+    def _apply(self, book, state, sign):
+        status, has_waitlist = state
+        self._status_counts[status] += sign
+        self._active_waitlists += sign * has_waitlist
+        for collection in self._index.get_ancestors(book):
+            rollup = self._collections.get(collection)
+            if rollup is None:
+                rollup = self._collections[collection] = self._empty_rollup()
+            rollup["books"] += sign
+            rollup["active_waitlists"] += sign * has_waitlist
+            rollup["statuses"][status] += sign
+            if rollup["books"] == 0:
+                del self._collections[collection]
+
+    @staticmethod
+    def _empty_rollup():
+        return {"books": 0, "active_waitlists": 0, "statuses": {status: 0 for status in Book.VALID_STATUSES}}
+
+    # --- Consistency Checking ---
+    def recount(self, users):
+        """Snapshot computed from scratch by walking the catalog tree and `users`."""
+        fresh = LibraryStats.__new__(LibraryStats)
+        fresh._index = self._index
+        fresh._reset()
+        for book in self._index.get_catalog().get_books():
+            state = (book.get_status(), bool(book.waitlist))
+            fresh._book_state[book] = state
+            fresh._apply(book, state, +1)
+        for user in users:
+            fresh._user_fines[user] = user.get_fines()
+            fresh._total_fines += user.get_fines()
+            fresh._track_fined(user)
+        return fresh
+
+    def verify(self, users):
+        """Returns a list of discrepancies between the live totals and a full recount."""
+        fresh = self.recount(users)
+        expected = fresh.snapshot()
+        actual = self.snapshot()
+        problems = []
+        for key in ("total_books", "statuses", "active_waitlists", "collections"):
+            if actual[key] != expected[key]:
+                problems.append(f"{key}: live {actual[key]} != recount {expected[key]}")
+        if set(self._fined_users) != set(fresh._fined_users):
+            problems.append(f"users with fines: live {len(self._fined_users)} != recount {len(fresh._fined_users)}")
+        if not math.isclose(actual["total_fines"], expected["total_fines"], abs_tol=0.005):
+            problems.append(f"total_fines: live {actual['total_fines']:.2f} != recount {expected['total_fines']:.2f}")
+        return problems
+
+    def rebuild(self, users):
+        """Replaces the live totals with a full recount, re-attaching to every tracked subject."""
+        fresh = self.recount(users)
+        for subject in list(self._book_state) + list(self._user_fines):
+            subject.detach(self)
+        self._status_counts = fresh._status_counts
+        self._active_waitlists = fresh._active_waitlists
+        self._total_fines = fresh._total_fines
+        self._collections = fresh._collections
+        self._book_state = fresh._book_state
+        self._user_fines = fresh._user_fines
+        self._fined_users = fresh._fined_users
+        for subject in list(self._book_state) + list(self._user_fines):
+            subject.attach(self)
@@ -7,20 +7,19 @@ class Observer(abc.ABC):
 
 class Subject(abc.ABC):
     def __init__(self):
-        self._observers = []
+        self._observers = {} # Ordered set: observer -> None, notified in attach order
 
     def attach(self, observer: Observer):
-        if observer not in self._observers:
-            self._observers.append(observer)
+        self._observers.setdefault(observer, None)
 
     def detach(self, observer: Observer):
-        try:
-            self._observers.remove(observer)
-        except ValueError:
-            pass
+        self._observers.pop(observer, None)
+
+    def is_attached(self, observer: Observer):
+        return observer in self._observers
 
     def notify(self, message=None):
         # Create a copy for iteration in case observers detach themselves during update
-        observers_copy = self._observers[:]
+        observers_copy = list(self._observers)
         for observer in observers_copy:
             observer.update(self, message)
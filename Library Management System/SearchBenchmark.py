@@ -0,0 +1,106 @@
+import argparse
+import random
+import time
+
+from Book import *
+from SearchIndex import *
+
+# --- Search Benchmark: SearchIndex vs the old linear scan ---
+# Run directly: python SearchBenchmark.py --sizes 100000 1000000 5000000
+# (app.py runs its demo on import, so the old scan is reproduced here.)
+
+WORDS = ["the", "great", "silent", "river", "garden", "night", "winter", "stone", "house", "shadow",
+         "empire", "letters", "journey", "machine", "ocean", "city", "memory", "fire", "glass", "kingdom",
+         "history", "secret", "light", "storm", "daughter", "island", "mountain", "war", "dream", "song"]
+FIRST_NAMES = ["Harper", "George", "Toni", "Jane", "Leo", "Mary", "James", "Ursula", "Chinua", "Haruki",
+               "Virginia", "Gabriel", "Octavia", "Fyodor", "Zadie", "Kazuo", "Isabel", "Salman", "Agatha", "Ray"]
+
+
+def make_books(count, seed):
+    rng = random.Random(seed)
+    # A long tail of rare, made-up words so the vocabulary grows with the catalog
+    rare = [f"{rng.choice(WORDS)[:3]}{index:x}" for index in range(max(count // 20, 100))]
+    surnames = [f"{rng.choice(WORDS).capitalize()}son{index}" for index in range(max(count // 50, 50))]
+    books = []
+    for index in range(count):
+        words = rng.sample(WORDS, rng.randint(1, 4))
+        if rng.random() < 0.6:
+            words.insert(rng.randrange(len(words) + 1), rng.choice(rare))
+        title = " ".join(words).title()
+        author = f"{rng.choice(FIRST_NAMES)} {rng.choice(surnames)}"
+        books.append(Book(title, author, f"{index:013d}"))
+    return books, rare, surnames
+
+
+def linear_search(books, criteria):
+    # Library.search_books before the inverted index
+    results = []
+    criteria_lower = criteria.lower()
+    for book in books:
+        if criteria_lower in book.get_title().lower() or \
+           criteria_lower in book.get_author().lower() or \
+           criteria_lower == book.get_isbn():
+            results.append(book)
+    return results
+
+
+QUERY_KINDS = ["rare word", "author prefix", "two common", "isbn", "substring"]
+
+
+def make_queries(books, rare, surnames, count, seed):
+    """Returns {kind: [query, ...]} with `count` queries of each kind."""
+    rng = random.Random(seed)
+    return {
+        "rare word": [rng.choice(rare) for _ in range(count)],
+        "author prefix": [rng.choice(surnames).lower()[:-1] for _ in range(count)],
+        "two common": [" ".join(rng.sample(WORDS, 2)) for _ in range(count)],
+        "isbn": [rng.choice(books).get_isbn() for _ in range(count)],
+        "substring": [rng.choice(books).get_title().split()[0][1:] for _ in range(count)],
+    }
+
+
+def time_queries(search, queries):
+    start = time.perf_counter()
+    for query in queries:
+        search(query)
+    return (time.perf_counter() - start) / len(queries) * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SearchIndex top-k queries against the linear substring scan.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000, 5_000_000])
+    parser.add_argument("--queries", type=int, default=50, help="queries of each kind")
+    parser.add_argument("--scan-queries", type=int, default=3, help="the scan is slow; time fewer queries")
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+
+    print("%10s %-14s %12s %12s %10s" % ("books", "query", "index ms", "scan ms", "speedup"))
+    for size in args.sizes:
+        books, rare, surnames = make_books(size, seed=size)
+        queries = make_queries(books, rare, surnames, args.queries, seed=size + 1)
+
+        index = SearchIndex()
+        start = time.perf_counter()
+        for book in books:
+            index.add_book(book)
+        build = time.perf_counter() - start
+
+        for kind in QUERY_KINDS:
+            index_ms = time_queries(lambda query: index.search(query, args.limit), queries[kind])
+            scan_ms = time_queries(lambda query: linear_search(books, query), queries[kind][:args.scan_queries])
+            print("%10d %-14s %12.3f %12.1f %9.0fx" % (size, kind, index_ms, scan_ms, scan_ms / index_ms))
+
+        # Incremental maintenance: remove and re-add a sample of books
+        sample = random.Random(size + 2).sample(books, min(10_000, size))
+        start = time.perf_counter()
+        for book in sample:
+            index.remove_book(book)
+            index.add_book(book)
+        update_us = (time.perf_counter() - start) / (2 * len(sample)) * 1e6
+        print("%10d build %.1f s, vocabulary %d terms, %.1f us per add/remove\n" % (
+            size, build, len(index._postings), update_us))
+        del books, index, sample
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+import heapq
+import math
+import re
+from bisect import bisect_left
+
+# --- Full-Text Search Index (Inverted Index + BM25) ---
+class SearchIndex:
+    """
+    Tokenized inverted index over book titles and authors.
+
+    A query is split into tokens and every token must match the book, either
+    exactly, as a word prefix ("gats" -> "gatsby") or, for tokens of three or
+    more characters, as a substring inside a word ("atsb" -> "gatsby", found
+    through a trigram index over the vocabulary). Matches are ranked with
+    BM25; exact words score above prefix matches, which score above substring
+    matches. A query equal to an ISBN returns that book first.
+
+    A partial token expands to at most max_expansions vocabulary terms (the
+    ones in the most books) when a result limit is given; with limit=None
+    every matching term is used, so all matching books are returned.
+
+    Updated incrementally with add_book/remove_book; the CatalogIndex calls
+    these as books enter and leave the catalog. New and dropped terms are
+    queued and merged into the sorted vocabulary by the next query.
+    """
+
+    TOKEN_PATTERN = re.compile(r"\w+")
+    K1 = 1.2
+    B = 0.75
+    EXACT_WEIGHT = 1.0
+    PREFIX_WEIGHT = 0.8
+    SUBSTRING_WEIGHT = 0.5
+
+    def __init__(self, max_expansions=64):
+        self.max_expansions = max_expansions # Cap on vocabulary terms one partial token may expand to, for limited searches
+        self._postings = {}      # term -> {doc_id: term frequency}
+        self._vocabulary = []    # sorted terms, for prefix ranges; see _sorted_vocabulary
+        self._new_terms = []     # terms added since the vocabulary was last sorted
+        self._dropped_terms = set() # terms removed since then
+        self._trigrams = {}      # trigram -> {term: None}
+        self._docs = {}          # doc_id -> Book
+        self._doc_ids = {}       # Book -> doc_id
+        self._doc_terms = {}     # doc_id -> {term: tf}, needed to remove a doc
+        self._doc_lengths = {}   # doc_id -> number of tokens
+        self._by_isbn = {}       # isbn -> doc_id
+        self._total_length = 0
+        self._next_id = 0
+
+    @classmethod
+    def tokenize(cls, text):
+        return cls.TOKEN_PATTERN.findall(text.casefold())
+
+    def __len__(self):
+        return len(self._docs)
+
+    # --- Updates ---
+    def add_book(self, book):
+        if book in self._doc_ids:
+            return
+        doc_id = self._next_id
+        self._next_id += 1
+        tokens = self.tokenize(book.get_title()) + self.tokenize(book.get_author())
+        terms = {}
+        for token in tokens:
+            terms[token] = terms.get(token, 0) + 1
+        for term, frequency in terms.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                self._add_term(term)
+            postings[doc_id] = frequency
+        self._docs[doc_id] = book
+        self._doc_ids[book] = doc_id
+        self._doc_terms[doc_id] = terms
+        self._doc_lengths[doc_id] = len(tokens)
+        self._by_isbn[book.get_isbn()] = doc_id
+        self._total_length += len(tokens)
+
+    def remove_book(self, book):
+        doc_id = self._doc_ids.pop(book, None)
+        if doc_id is None:
+            return
+        for term in self._doc_terms.pop(doc_id):
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+                self._remove_term(term)
+        del self._docs[doc_id]
+        self._total_length -= self._doc_lengths.pop(doc_id)
+        if self._by_isbn.get(book.get_isbn()) == doc_id:
+            del self._by_isbn[book.get_isbn()]
+
+    # --- Queries ---
+    def search(self, query, limit=10):
+        """Returns up to `limit` books best matching query (all matches if limit is None)."""
+        scores = {}
+        tokens = self.tokenize(query)
+        if tokens and self._docs:
+            scores = self._score(tokens, None if limit is None else self.max_expansions)
+        isbn_doc = self._by_isbn.get(query.strip())
+        if isbn_doc is not None:
+            scores[isbn_doc] = math.inf
+        if limit is None:
+            ranked = sorted(scores, key=scores.__getitem__, reverse=True)
+        else:
+            ranked = heapq.nlargest(limit, scores, key=scores.__getitem__)
+        return [self._docs[doc_id] for doc_id in ranked]
+
+    def _score(self, tokens, max_expansions):
+        vocabulary = self._sorted_vocabulary()
+        expansions = [self._expand(token, vocabulary, max_expansions) for token in set(tokens)]
+        # Docs matching every token, found with set operations before any scoring;
+        # the most selective token goes first so the intersection shrinks quickly
+        expansions.sort(key=lambda terms: sum(len(self._postings[term]) for term, _ in terms))
+        survivors = None
+        for terms in expansions:
+            docs = set().union(*(self._postings[term].keys() for term, _ in terms))
+            survivors = docs if survivors is None else survivors & docs
+            if not survivors:
+                return {}
+        doc_count = len(self._docs)
+        lengths = self._doc_lengths
+        # BM25 length normalisation K1 * (1 - B + B * length / average), split into two constants
+        base = self.K1 * (1 - self.B)
+        scale = self.K1 * self.B * doc_count / self._total_length
+        scores = dict.fromkeys(survivors, 0.0)
+        for terms in expansions:
+            token_scores = {}
+            best = token_scores.get
+            for term, weight in terms:
+                postings = self._postings[term]
+                idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                factor = weight * idf * (self.K1 + 1)
+                matched = postings if len(expansions) == 1 else postings.keys() & survivors
+                for doc_id in matched:
+                    tf = postings[doc_id]
+                    score = factor * tf / (tf + base + scale * lengths[doc_id])
+                    if score > best(doc_id, 0.0):
+                        token_scores[doc_id] = score
+            for doc_id, score in token_scores.items():
+                scores[doc_id] += score
+        return scores
+
+    def _expand(self, token, vocabulary, max_expansions):
+        """Vocabulary terms a query token matches, with their weights."""
+        weighted = {}
+        if token in self._postings:
+            weighted[token] = self.EXACT_WEIGHT
+        start = bisect_left(vocabulary, token)
+        end = bisect_left(vocabulary, token + "\U0010ffff", start)
+        prefixed = self._most_frequent(vocabulary[start:end], max_expansions)
+        for term in prefixed:
+            weighted.setdefault(term, self.PREFIX_WEIGHT)
+        if len(token) >= 3:
+            grams = sorted((self._trigrams.get(gram, {}) for gram in self._grams(token)), key=len)
+            substrings = [term for term in grams[0] if token in term and all(term in other for other in grams[1:])]
+            for term in self._most_frequent(substrings, max_expansions):
+                weighted.setdefault(term, self.SUBSTRING_WEIGHT)
+        return list(weighted.items())
+
+    def _most_frequent(self, terms, max_expansions):
+        if max_expansions is None or len(terms) <= max_expansions:
+            return terms
+        return heapq.nlargest(max_expansions, terms, key=lambda term: len(self._postings[term]))
+
+    # --- Vocabulary maintenance ---
+    @staticmethod
+    def _grams(term):
+        return {term[index:index + 3] for index in range(len(term) - 2)}
+
+    def _sorted_vocabulary(self):
+        # Merging the queued changes in one go keeps loading a catalog
+        # O(V log V) instead of O(V) per new term.
+        if self._new_terms or self._dropped_terms:
+            vocabulary = self._vocabulary
+            if self._dropped_terms:
+                dropped = self._dropped_terms
+                vocabulary = [term for term in vocabulary if term not in dropped]
+            postings = self._postings
+            # A term dropped and added again is in both queues; it only stays if it has postings
+            vocabulary.extend(sorted({term for term in self._new_terms if term in postings}))
+            vocabulary.sort() # Two sorted runs, merged in linear time
+            self._vocabulary = vocabulary
+            self._new_terms = []
+            self._dropped_terms = set()
+        return self._vocabulary
+
+    def _add_term(self, term):
+        self._new_terms.append(term)
+        for gram in self._grams(term):
+            self._trigrams.setdefault(gram, {})[term] = None
+
+    def _remove_term(self, term):
+        self._dropped_terms.add(term)
+        for gram in self._grams(term):
+            terms = self._trigrams[gram]
+            del terms[term]
+            if not terms:
+                del self._trigrams[gram]
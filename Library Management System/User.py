@@ -1,11 +1,12 @@
-from Observer import Observer
+from Observer import Observer, Subject
 from Book import Book
 from datetime import datetime, timedelta
 from Exceptions import *
 
-# --- User Class (Enhanced Observer) ---
-class User(Observer):
+# --- User Class (Enhanced Observer, Subject for fine changes) ---
+class User(Observer, Subject):
     def __init__(self, user_id, name, email):
+        Subject.__init__(self)
         self.user_id = user_id
         self.name = name
         self.email = email
@@ -21,6 +22,7 @@ class User(Observer):
         if amount > 0:
             self.fines += amount
             print(f"Fine of ${amount:.2f} added to {self.name}. Total fines: ${self.fines:.2f}")
+            self.notify(f"Fine of ${amount:.2f} added to {self.name}.")
 
     def pay_fine(self, amount):
         if amount <= 0:
@@ -29,6 +31,7 @@ class User(Observer):
         paid_amount = min(amount, self.fines)
         self.fines -= paid_amount
         print(f"{self.name} paid ${paid_amount:.2f}. Remaining fines: ${self.fines:.2f}")
+        self.notify(f"{self.name} paid ${paid_amount:.2f}.")
 
     def _actual_checkout_book(self, book: Book, library):
         """Internal logic for checking out a book."""
@@ -37,6 +40,7 @@ class User(Observer):
             # The book object itself validates if it can be checked out by this user
             book.checkout(self, due_date)
             self.checked_out_books.append(book)
+            library.get_due_index().loan_opened(self, book, due_date)
             print(f"{self.name} checked out '{book.get_title()}'. Due: {due_date}")
             return True
         except BookUnavailableError as e:
@@ -50,8 +54,13 @@ class User(Observer):
             raise NotCheckedOutError(f"{self.name} did not check out '{book.get_title()}'.")
 
         # Calculate fines *before* changing status/detaching user
-        if book.due_date and datetime.now().date() > book.due_date:
-            overdue_days = (datetime.now().date() - book.due_date).days
+        # Days already charged by the daily accrual job are not charged again
+        charged_from = book.due_date
+        accrued_through = library.get_due_index().accrued_through(self, book)
+        if charged_from and accrued_through and accrued_through > charged_from:
+            charged_from = accrued_through
+        if charged_from and datetime.now().date() > charged_from:
+            overdue_days = (datetime.now().date() - charged_from).days
             fine_amount = overdue_days * library.fine_rate_per_day
             self.add_fine(fine_amount)
 
@@ -59,6 +68,7 @@ class User(Observer):
             # Book handles status change and waitlist processing
             book.return_book()
             self.checked_out_books.remove(book)
+            library.get_due_index().loan_closed(self, book)
             print(f"{self.name} returned '{book.get_title()}'.")
             return True
         except LibraryError as e: # Catch potential errors during return process
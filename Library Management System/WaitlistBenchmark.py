@@ -0,0 +1,131 @@
+import argparse
+import contextlib
+import io
+import random
+import time
+from datetime import date
+
+from Book import *
+from HoldQueue import *
+
+# --- Waitlist Benchmark: HoldQueue and hashed observers vs the old lists ---
+# Run directly: python WaitlistBenchmark.py --holds 1000 10000
+
+
+class QuietUser(Observer):
+    """A waitlist member that ignores notifications, so printing is not timed."""
+    def __init__(self, name):
+        self.name = name
+    def get_name(self): return self.name
+    def update(self, subject, message): pass
+
+
+def per_op_us(function, operations):
+    start = time.perf_counter()
+    function()
+    return (time.perf_counter() - start) / operations * 1e6
+
+
+def list_ops(users, queries, cancels):
+    """The old Book.waitlist / Subject._observers operations on plain lists."""
+    waitlist, observers = [], []
+
+    def reserve():
+        for user in users:
+            if user not in waitlist:
+                waitlist.append(user)
+                if user not in observers:
+                    observers.append(user)
+
+    def position():
+        for user in queries:
+            waitlist.index(user)
+
+    def cancel():
+        for user in cancels:
+            waitlist.remove(user)
+            observers.remove(user)
+
+    def serve():
+        while waitlist:
+            observers.remove(waitlist.pop(0))
+
+    return reserve, position, cancel, serve
+
+
+def hold_queue_ops(users, queries, cancels):
+    waitlist, observers = HoldQueue(), {}
+
+    def reserve():
+        for user in users:
+            if waitlist.append(user):
+                observers.setdefault(user, None)
+
+    def position():
+        for user in queries:
+            waitlist.position(user)
+
+    def cancel():
+        for user in cancels:
+            waitlist.remove(user)
+            observers.pop(user, None)
+
+    def serve():
+        while waitlist:
+            observers.pop(waitlist.popleft(), None)
+
+    return reserve, position, cancel, serve
+
+
+def book_ops(users, queries, cancels):
+    """End to end through Book, including the notifications each step sends."""
+    book = Book("Popular Title", "Some Author", "0000000000001")
+    book.checkout(QuietUser("borrower"), date.today())
+
+    def reserve():
+        for user in users:
+            book.add_to_waitlist(user)
+
+    def position():
+        for user in queries:
+            book.get_waitlist_position(user)
+
+    def cancel():
+        for user in cancels:
+            book.remove_from_waitlist(user)
+
+    def serve():
+        while book.waitlist:
+            next_user = book.waitlist.peek()
+            book.return_book()
+            book.checkout(next_user, date.today())
+
+    return reserve, position, cancel, serve
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Waitlist operations per title with thousands of holds.")
+    parser.add_argument("--holds", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--queries", type=int, default=1_000)
+    args = parser.parse_args()
+
+    print("%8s %-10s %-12s %12s" % ("holds", "structure", "operation", "us/op"))
+    for holds in args.holds:
+        users = [QuietUser(f"user{index}") for index in range(holds)]
+        rng = random.Random(holds)
+        queries = [rng.choice(users) for _ in range(args.queries)]
+        cancels = rng.sample(users, holds // 10)
+        served = holds - len(cancels)
+        for structure, build in (("list", list_ops), ("HoldQueue", hold_queue_ops), ("Book", book_ops)):
+            reserve, position, cancel, serve = build(users, queries, cancels)
+            with contextlib.redirect_stdout(io.StringIO()):
+                timings = [("reserve", per_op_us(reserve, holds)),
+                           ("position", per_op_us(position, len(queries))),
+                           ("cancel", per_op_us(cancel, len(cancels))),
+                           ("serve", per_op_us(serve, served))]
+            for operation, us in timings:
+                print("%8d %-10s %-12s %12.2f" % (holds, structure, operation, us))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,10 @@ import abc
 from datetime import datetime, timedelta
 from Exceptions import *
 from Book import *
+from CatalogIndex import *
+from SearchIndex import *
+from LibraryStats import *
+from DueDateIndex import *
 from Command import *
 from Factory import *
 
@@ -21,6 +25,11 @@ class Library:
             raise Exception("This class is a singleton! Use get_instance().")
         else:
             self._catalog = BookCollection("Main Catalog")
+            self._catalog_index = CatalogIndex(self._catalog) # Kept current by Add/RemoveItemCommand and Book status changes
+            self._search_index = SearchIndex()
+            self._catalog_index.add_listener(self._search_index.add_book, self._search_index.remove_book)
+            self._stats = LibraryStats(self._catalog_index) # Live report totals
+            self._due_index = DueDateIndex() # Open loans by due date, kept by checkout/return and due-date changes
             self.user_list = []
             self.librarian_list = [] # Store librarians separately now
             self.command_invoker = CommandInvoker()
@@ -30,6 +39,16 @@ class Library:
             Library._instance = self
 
     def get_catalog(self): return self._catalog
+    def get_catalog_index(self): return self._catalog_index
+    def get_stats(self): return self._stats
+    def get_due_index(self): return self._due_index
+
+    def check_stats(self, repair=False):
+        """Compares live report totals with a full recount; optionally rebuilds them."""
+        problems = self._stats.verify(self.user_list)
+        if problems and repair:
+            self._stats.rebuild(self.user_list)
+        return problems
     def find_librarian(self, staff_id): # Specific finder for librarian
         for lib in self.librarian_list:
             if lib.get_staff_id() == staff_id:
@@ -43,46 +62,66 @@ class Library:
         return None
 
     def get_all_books(self):
-        return self._catalog.get_books()
+        # Served from the index; no walk of the catalog tree
+        return self._catalog_index.get_all_books()
 
     def get_available_books(self):
         # Only books explicitly marked 'available' or 'reserved' (but maybe show differently)
-        return [book for book in self.get_all_books() if book.get_status() == "available"]
+        return self._catalog_index.get_books_by_status("available")
 
     def find_book(self, isbn):
-        for book in self.get_all_books():
-             if book.get_isbn() == isbn:
-                 return book
-        raise BookNotFoundError(f"Book with ISBN {isbn} not found.")
-
-
-    def search_books(self, criteria):
-        results = []
-        all_books = self.get_all_books()
-        criteria_lower = criteria.lower()
-        for book in all_books:
-            # Exclude archived/lost/damaged from general search? Optional.
-            # if book.get_status() in ["lost", "damaged", "archived"]: continue
-            if criteria_lower in book.get_title().lower() or \
-               criteria_lower in book.get_author().lower() or \
-               criteria_lower == book.get_isbn():
-                results.append(book)
-        return results
-
-    def notify_users(self):
-        today = datetime.now().date()
+        book = self._catalog_index.find_by_isbn(isbn)
+        if book is None:
+            raise BookNotFoundError(f"Book with ISBN {isbn} not found.")
+        return book
+
+    def find_books_by_author(self, author):
+        return self._catalog_index.get_books_by_author(author)
+
+
+    def search_books(self, criteria, limit=None):
+        """Ranked title/author/ISBN search; returns the best `limit` matches, or all of them."""
+        # Exclude archived/lost/damaged from general search? Optional.
+        return self._search_index.search(criteria, limit)
+
+    def notify_users(self, batch_size=100, send=None, today=None):
+        """Sends overdue and fine notices in batches of `batch_size` through send(list_of_notices)."""
+        today = today or datetime.now().date()
+        send = send or self._print_notice_batch
         print("\n--- Sending Notifications ---")
-        for user in self.user_list:
-            # Notify about overdue books
-            for book in user.checked_out_books:
-                if book.due_date and book.due_date < today:
-                    print(f"  OVERDUE Notice to {user.get_name()}: Book '{book.get_title()}' was due on {book.due_date}!")
-            # Notify about pending fines
-            if user.get_fines() > 0:
-                 print(f"  FINE Notice to {user.get_name()}: You have outstanding fines of ${user.get_fines():.2f}.")
-            # Notify about reserved books ready for pickup (via Observer update now)
-
-        print("--- Notifications Sent ---")
+        sent = 0
+        for batch in self._batched(self._notices(today), batch_size):
+            send(batch)
+            sent += len(batch)
+        print(f"--- Notifications Sent ({sent}) ---")
+        return sent
+
+    def _notices(self, today):
+        # Only loans that are actually overdue and users who actually owe are visited
+        for user, book in self._due_index.overdue_loans(today):
+            yield f"  OVERDUE Notice to {user.get_name()}: Book '{book.get_title()}' was due on {book.due_date}!"
+        for user in self._stats.get_users_with_fines():
+            yield f"  FINE Notice to {user.get_name()}: You have outstanding fines of ${user.get_fines():.2f}."
+        # Notify about reserved books ready for pickup (via Observer update now)
+
+    @staticmethod
+    def _batched(notices, batch_size):
+        batch = []
+        for notice in notices:
+            batch.append(notice)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    @staticmethod
+    def _print_notice_batch(batch):
+        print("\n".join(batch))
+
+    def accrue_daily_fines(self, today=None):
+        """Charges overdue loans for the days since they were last charged; run once a day."""
+        return self._due_index.accrue_fines(today or datetime.now().date(), self.fine_rate_per_day)
 
 
     def display_catalog(self):